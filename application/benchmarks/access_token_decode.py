@@ -0,0 +1,57 @@
+"""
+Measure the CPU cost per request of decoding the access token, i.e. of
+`AccessTokenPayload.decode_from_access_token()`, with and without the cache of
+the verified access tokens.
+
+Requests are emulated by decoding `--tokens` distinct tokens in turn, as if that
+many clients were making requests:
+
+    python -m benchmarks.access_token_decode --tokens 100 --iterations 100000
+"""
+
+import argparse
+import timeit
+from typing import Callable
+
+from benchmarks.common import print_table
+from src.core.security import AccessTokenPayload, generate_access_token
+
+
+def main(arguments: argparse.Namespace) -> None:
+    access_tokens = [
+        generate_access_token(subject) for subject in range(arguments.tokens)
+    ]
+
+    def decode_all(decode: Callable[[str], AccessTokenPayload]) -> None:
+        for access_token in access_tokens:
+            decode(access_token)
+
+    results: dict[str, float] = {}
+    for name, decode in [
+        ("uncached", AccessTokenPayload.decode_from_access_token_uncached),
+        ("cached", AccessTokenPayload.decode_from_access_token),
+    ]:
+        # fill the cache up
+        decode_all(decode)
+        rounds = max(arguments.iterations // arguments.tokens, 1)
+        seconds = timeit.timeit(lambda: decode_all(decode), number=rounds)
+        results[name] = seconds / (rounds * arguments.tokens)
+
+    print_table(
+        ["decode", "us/request", "speedup"],
+        [
+            [
+                name,
+                f"{seconds * 1_000_000:.1f}",
+                f"{results['uncached'] / seconds:.1f}x",
+            ]
+            for name, seconds in results.items()
+        ],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=100_000)
+    main(parser.parse_args())
@@ -0,0 +1,151 @@
+"""
+Compare the synchronous and the asynchronous database access paths of the API.
+
+Both paths serve the same "list the current user's todo items" workload: get the
+user by the primary key and list his todo items. Synchronous path operations are
+run in the AnyIO threadpool (40 threads by default), asynchronous ones are run
+in the event loop directly.
+
+`--db-latency-ms` emulates a network round trip to the database with `pg_sleep`.
+The load is generated in the same process, so run it on a multi-core machine in
+order to let the threadpool cap be the bottleneck rather than the CPU.
+
+Keep `--concurrency` not greater than `--pool-size` when measuring the `sync`
+path: a synchronous session is closed in the threadpool too, so sessions waiting
+for a thread keep holding connections while threads wait for connections.
+
+Run against a seeded (e.g. test) database:
+
+    python -m benchmarks.api_db_session --concurrency 80 --db-latency-ms 20
+"""
+
+import argparse
+import asyncio
+from typing import Annotated, AsyncGenerator, Generator
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from benchmarks.common import LoadResult, print_table, run_load
+from src.config import application_config
+from src.models import User
+from src.services import todo_item_service, user_service
+
+
+def make_application(
+    *, asynchronous: bool, pool_size: int, db_latency_seconds: float
+) -> FastAPI:
+    application = FastAPI()
+
+    if asynchronous:
+        async_engine = create_async_engine(
+            application_config.get_postgres_async_uri(),
+            pool_size=pool_size,
+            max_overflow=0,
+        )
+
+        async def yield_async_session() -> AsyncGenerator[AsyncSession, None]:
+            async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                yield session
+
+        @application.get("/todo_items/{user_id}")
+        async def list_async(
+            db: Annotated[AsyncSession, Depends(yield_async_session)], user_id: int
+        ) -> int:
+            await db.execute(
+                text("SELECT pg_sleep(:seconds)"), {"seconds": db_latency_seconds}
+            )
+            await user_service.get_or_exception_async(db, user_id)
+            return len(await todo_item_service.list_by_user_async(db, user_id))
+
+        application.router.on_shutdown.append(async_engine.dispose)
+    else:
+        engine = create_engine(
+            application_config.get_postgres_uri(), pool_size=pool_size, max_overflow=0
+        )
+
+        def yield_sync_session() -> Generator[Session, None, None]:
+            with Session(engine) as session:
+                yield session
+
+        @application.get("/todo_items/{user_id}")
+        def list_sync(
+            db: Annotated[Session, Depends(yield_sync_session)], user_id: int
+        ) -> int:
+            db.execute(
+                text("SELECT pg_sleep(:seconds)"), {"seconds": db_latency_seconds}
+            )
+            user_service.get_or_exception(db, user_id)
+            return len(todo_item_service.list_by_user(db, user_id))
+
+        application.router.on_shutdown.append(engine.dispose)
+
+    return application
+
+
+async def measure(
+    application: FastAPI, path: str, arguments: argparse.Namespace
+) -> LoadResult:
+    async with httpx.AsyncClient(app=application, base_url="http://bench") as client:
+        # warm the connection pool up
+        await run_load(
+            client,
+            path,
+            requests=arguments.pool_size,
+            concurrency=arguments.concurrency,
+        )
+        result = await run_load(
+            client,
+            path,
+            requests=arguments.requests,
+            concurrency=arguments.concurrency,
+        )
+    await application.router.shutdown()
+    return result
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    engine = create_engine(application_config.get_postgres_uri())
+    with Session(engine) as db:
+        user_id = db.execute(
+            select(User.id).where(User.username == arguments.username)
+        ).scalar_one()
+    engine.dispose()
+
+    results: dict[str, LoadResult] = {}
+    for name in arguments.paths:
+        application = make_application(
+            asynchronous=name == "async",
+            pool_size=arguments.pool_size,
+            db_latency_seconds=arguments.db_latency_ms / 1000,
+        )
+        results[name] = await measure(application, f"/todo_items/{user_id}", arguments)
+
+    print_table(
+        ["path", "requests/sec", "p50, ms", "p99, ms"],
+        [
+            [
+                name,
+                f"{result.requests_per_second:.0f}",
+                f"{result.percentile(50) * 1000:.1f}",
+                f"{result.percentile(99) * 1000:.1f}",
+            ]
+            for name, result in results.items()
+        ],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--username", default="jane.with.some.todo_items.to.list")
+    parser.add_argument(
+        "--paths", nargs="+", choices=["sync", "async"], default=["sync", "async"]
+    )
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=80)
+    parser.add_argument("--pool-size", type=int, default=80)
+    parser.add_argument("--db-latency-ms", type=float, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,57 @@
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import httpx
+
+
+@dataclass
+class LoadResult:
+    """
+    Latencies (in seconds) of all requests made during a load run.
+    """
+
+    total_seconds: float
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def requests_per_second(self) -> float:
+        return len(self.latencies) / self.total_seconds
+
+    def percentile(self, percent: int) -> float:
+        return statistics.quantiles(self.latencies, n=100)[percent - 1]
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    path: str,
+    *,
+    requests: int,
+    concurrency: int,
+) -> LoadResult:
+    """
+    Make `requests` GET requests to `path` keeping at most `concurrency` of them
+    in flight.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def make_request() -> None:
+        async with semaphore:
+            started_at = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - started_at)
+            response.raise_for_status()
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(make_request() for _ in range(requests)))
+    return LoadResult(time.perf_counter() - started_at, latencies)
+
+
+def print_table(header: list[str], rows: Iterable[Iterable[object]]) -> None:
+    cells = [header, *([str(cell) for cell in row] for row in rows)]
+    widths = [max(len(row[index]) for row in cells) for index in range(len(header))]
+    for row in cells:
+        print("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
@@ -0,0 +1,80 @@
+"""
+Measure rendering of the overdue todo item emails: the templates compiled once by
+the email templates registry vs read from the file and compiled for every email.
+
+    python -m benchmarks.email_render --emails 10000
+"""
+
+import argparse
+import time
+from datetime import datetime
+from typing import Any, Callable
+
+import jinja2
+
+from benchmarks.common import print_table
+from src.config import application_config
+from src.emails.todo_items import compose_overdue_email
+from src.services.todo_item_service import TodoItemMarkedAsOverdue
+
+
+def compose_overdue_email_uncompiled(
+    todo_item: TodoItemMarkedAsOverdue,
+) -> tuple[str, str]:
+    render_kwargs: dict[str, Any] = {"todo_item": todo_item}
+    subject = (
+        jinja2.Environment()
+        .from_string('"{{ todo_item.subject }}" has passed the deadline')
+        .render(**render_kwargs)
+    )
+    with open(
+        application_config.EMAIL_TEMPLATES_DIR + "todo_item_overdue.html"
+    ) as template_file:
+        template_str = template_file.read()
+    body_html = jinja2.Environment().from_string(template_str).render(**render_kwargs)
+    return (subject, body_html)
+
+
+def main(arguments: argparse.Namespace) -> None:
+    todo_items = [
+        TodoItemMarkedAsOverdue(
+            id=number,
+            subject=f"Todo item number {number}",
+            deadline=datetime(2024, 1, 1),
+            user_id=number,
+            user_username=f"johnny.{number}",
+            user_email=f"johnny.{number}@example.com",
+        )
+        for number in range(arguments.emails)
+    ]
+
+    results: dict[str, float] = {}
+    composers: dict[str, Callable[[TodoItemMarkedAsOverdue], tuple[str, str]]] = {
+        "compiled per email": compose_overdue_email_uncompiled,
+        "compiled once": compose_overdue_email,
+    }
+    for name, compose in composers.items():
+        started_at = time.perf_counter()
+        for todo_item in todo_items:
+            compose(todo_item)
+        results[name] = time.perf_counter() - started_at
+
+    baseline_seconds = results["compiled per email"]
+    print_table(
+        ["templates", "total, s", "emails/sec", "speedup"],
+        [
+            [
+                name,
+                f"{seconds:.2f}",
+                f"{arguments.emails / seconds:.0f}",
+                f"{baseline_seconds / seconds:.1f}x",
+            ]
+            for name, seconds in results.items()
+        ],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--emails", type=int, default=10_000)
+    main(parser.parse_args())
@@ -0,0 +1,138 @@
+"""
+Measure listing a page of todo items and serializing it into a response body:
+`TodoItem` instances vs plain rows of only the response columns. Both are serialized
+with no validation, see `src.api.responses`.
+
+A user with as many todo items as the biggest page is created and deleted afterwards.
+Run it against the test database:
+
+    python -m benchmarks.list_query --pages 200
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Awaitable, Callable
+
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.common import print_table
+from src.api.responses import dump_db_model, get_field_names, make_rows_response
+from src.core.db import async_engine, get_async_session, get_session
+from src.models import TodoItem, User
+from src.schemas.todo_item import TodoItemResponse
+from src.services import todo_item_service
+
+USERNAME = "benchmark.list.query"
+
+
+def create_user_with_todo_items(todo_items_count: int) -> int:
+    with get_session() as db:
+        user_id: int = db.execute(
+            insert(User)
+            .values(
+                username=USERNAME,
+                email=f"{USERNAME}@example.com",
+                hashed_password="-",
+            )
+            .returning(User.id)
+        ).scalar_one()
+        db.execute(
+            insert(TodoItem),
+            [
+                {"user_id": user_id, "subject": f"Todo item number {number}"}
+                for number in range(todo_items_count)
+            ],
+        )
+        db.commit()
+    return user_id
+
+
+def delete_user() -> None:
+    with get_session() as db:
+        db.execute(
+            delete(User)
+            .where(User.username == USERNAME)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+
+async def list_db_models(db: AsyncSession, user_id: int, limit: int) -> bytes:
+    todo_items = await todo_item_service.list_by_user_async(db, user_id, limit=limit)
+    return ORJSONResponse(
+        [dump_db_model(todo_item, TodoItemResponse) for todo_item in todo_items]
+    ).body
+
+
+async def list_rows(db: AsyncSession, user_id: int, limit: int) -> bytes:
+    rows = await todo_item_service.list_rows_by_user_async(
+        db, user_id, column_names=get_field_names(TodoItemResponse), limit=limit
+    )
+    return make_rows_response(rows, TodoItemResponse).body
+
+
+async def run(arguments: argparse.Namespace, user_id: int) -> list[list[str]]:
+    listers: dict[str, Callable[[AsyncSession, int, int], Awaitable[bytes]]] = {
+        "TodoItem instances": list_db_models,
+        "plain rows": list_rows,
+    }
+    rows: list[list[str]] = []
+    for page_size in arguments.page_sizes:
+        baseline_seconds: float | None = None
+        for name, list_page in listers.items():
+            async with get_async_session() as db:
+                # warm up the connection and the statement caches
+                await list_page(db, user_id, page_size)
+                db.expunge_all()
+
+                started_at = time.perf_counter()
+                for _ in range(arguments.pages):
+                    await list_page(db, user_id, page_size)
+                    # a request's session does not outlive its page
+                    db.expunge_all()
+                seconds = (time.perf_counter() - started_at) / arguments.pages
+
+                tracemalloc.start()
+                await list_page(db, user_id, page_size)
+                _, peak_bytes = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                db.expunge_all()
+
+            if baseline_seconds is None:
+                baseline_seconds = seconds
+            rows.append(
+                [
+                    str(page_size),
+                    name,
+                    f"{seconds * 1000:.2f}",
+                    f"{baseline_seconds / seconds:.1f}x",
+                    f"{peak_bytes / 1024:.0f}",
+                ]
+            )
+    await async_engine.dispose()
+    return rows
+
+
+def main(arguments: argparse.Namespace) -> None:
+    delete_user()
+    user_id = create_user_with_todo_items(max(arguments.page_sizes))
+    try:
+        rows = asyncio.run(run(arguments, user_id))
+    finally:
+        delete_user()
+
+    print_table(
+        ["page size", "listed as", "per page, ms", "speedup", "peak memory, KiB"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[20, 100, 1000])
+    main(parser.parse_args())
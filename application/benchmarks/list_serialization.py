@@ -0,0 +1,108 @@
+"""
+Measure serializing a page of todo items into a response body:
+- `validated, json`: the response model validation of every row, `jsonable_encoder`
+  and the stdlib `json`, i.e. the FastAPI's default path
+- `validated, orjson`: the same with the `ORJSONResponse`, the API's default response
+  class
+- `trusted, orjson`: the rows dumped with no validation by `dump_db_model()`, as the
+  todo item path operations do
+
+Serialization runs in the same process, no database or HTTP is involved.
+
+    python -m benchmarks.list_serialization --pages 200
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from benchmarks.common import print_table
+from src.api.responses import dump_db_model
+from src.enums import TodoItemStatusEnum, TodoItemVisibilityEnum
+from src.models import TodoItem
+from src.schemas.todo_item import TodoItemResponse
+
+_response_field = create_response_field(
+    name="benchmark_response", type_=list[TodoItemResponse]
+)
+
+
+async def serialize_validated_json(todo_items: list[TodoItem]) -> bytes:
+    content = await serialize_response(
+        field=_response_field, response_content=todo_items
+    )
+    return JSONResponse(content).body
+
+
+async def serialize_validated_orjson(todo_items: list[TodoItem]) -> bytes:
+    content = await serialize_response(
+        field=_response_field, response_content=todo_items
+    )
+    return ORJSONResponse(content).body
+
+
+async def serialize_trusted_orjson(todo_items: list[TodoItem]) -> bytes:
+    return ORJSONResponse(
+        [dump_db_model(todo_item, TodoItemResponse) for todo_item in todo_items]
+    ).body
+
+
+def make_todo_items(count: int) -> list[TodoItem]:
+    return [
+        TodoItem(
+            id=number,
+            user_id=1,
+            subject=f"Todo item number {number}",
+            deadline=datetime(2024, 1, 1) + timedelta(minutes=number),
+            status=TodoItemStatusEnum.OPEN,
+            visibility=TodoItemVisibilityEnum.VISIBLE,
+            resolve_time=None,
+        )
+        for number in range(1, count + 1)
+    ]
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    serializers: dict[str, Callable[[list[TodoItem]], Awaitable[bytes]]] = {
+        "validated, json": serialize_validated_json,
+        "validated, orjson": serialize_validated_orjson,
+        "trusted, orjson": serialize_trusted_orjson,
+    }
+
+    rows: list[list[str]] = []
+    for page_size in arguments.page_sizes:
+        todo_items = make_todo_items(page_size)
+        baseline_seconds: float | None = None
+        for name, serialize in serializers.items():
+            started_at = time.perf_counter()
+            for _ in range(arguments.pages):
+                await serialize(todo_items)
+            seconds = (time.perf_counter() - started_at) / arguments.pages
+            if baseline_seconds is None:
+                baseline_seconds = seconds
+            rows.append(
+                [
+                    str(page_size),
+                    name,
+                    f"{seconds * 1000:.3f}",
+                    f"{1 / seconds:.0f}",
+                    f"{baseline_seconds / seconds:.1f}x",
+                ]
+            )
+
+    print_table(
+        ["page size", "serialization", "per page, ms", "pages/sec", "speedup"], rows
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[20, 100, 1000])
+    asyncio.run(main(parser.parse_args()))
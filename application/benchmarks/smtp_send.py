@@ -0,0 +1,116 @@
+"""
+Compare sending emails over a new SMTP connection for every email (as the
+`emails` library does) vs over the pooled persistent connections, one email per
+call and in batches.
+
+Emails are sent to a local `aiosmtpd` server. `--handshake-latency-ms` emulates
+the cost of a real server's connection setup (network round trips, TLS, AUTH) by
+delaying the `EHLO` reply:
+
+    python -m benchmarks.smtp_send --emails 500 --handshake-latency-ms 50
+"""
+
+import argparse
+import asyncio
+import socket
+import time
+from typing import Callable
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import SMTP, Envelope, Session
+
+from benchmarks.common import print_table
+from src.config import application_config
+from src.core.email import SMTPConnectionPool, make_message
+
+
+class DelayedHandshakeHandler:
+    def __init__(self, handshake_latency_seconds: float) -> None:
+        self.handshake_latency_seconds = handshake_latency_seconds
+
+    async def handle_EHLO(
+        self,
+        server: SMTP,
+        session: Session,
+        envelope: Envelope,
+        hostname: str,
+        responses: list[str],
+    ) -> list[str]:
+        await asyncio.sleep(self.handshake_latency_seconds)
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(
+        self, server: SMTP, session: Session, envelope: Envelope
+    ) -> str:
+        return "250 Message accepted for delivery"
+
+
+def main(arguments: argparse.Namespace) -> None:
+    with socket.socket() as free_port_socket:
+        free_port_socket.bind(("127.0.0.1", 0))
+        port = free_port_socket.getsockname()[1]
+    application_config.SMTP_HOST = "127.0.0.1"
+    application_config.SMTP_PORT = str(port)
+    application_config.SMTP_DO_USE_TLS = False
+    application_config.SMTP_USER = ""
+
+    controller = Controller(
+        DelayedHandshakeHandler(arguments.handshake_latency_ms / 1000),
+        hostname="127.0.0.1",
+        port=port,
+    )
+    controller.start()
+
+    messages = [
+        make_message(f"johnny.{number}@example.com", "Subject", "<p>Body</p>")
+        for number in range(arguments.emails)
+    ]
+    smtp_connection_pool = SMTPConnectionPool(size=1, health_check_idle_seconds=30)
+
+    def send_over_new_connections() -> None:
+        for message in messages:
+            message.send(smtp={"host": "127.0.0.1", "port": port})
+
+    def send_pooled() -> None:
+        for message in messages:
+            smtp_connection_pool.send([message])
+
+    def send_pooled_batch() -> None:
+        smtp_connection_pool.send(messages)
+
+    senders: dict[str, Callable[[], None]] = {
+        "connection per email": send_over_new_connections,
+        "pooled": send_pooled,
+        "pooled, batch": send_pooled_batch,
+    }
+    results: dict[str, float] = {}
+    try:
+        for name, send in senders.items():
+            started_at = time.perf_counter()
+            send()
+            results[name] = time.perf_counter() - started_at
+    finally:
+        smtp_connection_pool.close()
+        controller.stop()
+
+    baseline_seconds = results["connection per email"]
+    print_table(
+        ["sending", "total, s", "emails/sec", "speedup"],
+        [
+            [
+                name,
+                f"{seconds:.2f}",
+                f"{arguments.emails / seconds:.0f}",
+                f"{baseline_seconds / seconds:.1f}x",
+            ]
+            for name, seconds in results.items()
+        ],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--emails", type=int, default=500)
+    parser.add_argument("--handshake-latency-ms", type=float, default=50)
+    main(parser.parse_args())
@@ -0,0 +1,151 @@
+"""
+Measure the throughput of the overdue todo items sweep split into chunks, each one
+processed by its own worker process concurrently, the way Celery workers process
+the chunk tasks fanned out by the coordinator task.
+
+A backlog of `--todo-items` open todo items past their deadline, owned by `--users`
+users, is created and reset to open before each run. It is deleted afterwards.
+Other open todo items past their deadline are swept too, so run it against the test
+database:
+
+    python -m benchmarks.sweep_workers --todo-items 100000 --users 100
+"""
+
+import argparse
+import multiprocessing
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, select, update
+
+from benchmarks.common import print_table
+from src.core.db import engine, get_session
+from src.enums import TodoItemStatusEnum
+from src.models import TodoItem, User
+from src.services import todo_item_service
+
+USERNAME_PREFIX = "benchmark.sweep."
+
+
+def create_backlog(users_count: int, todo_items_count: int) -> list[int]:
+    with get_session() as db:
+        db.execute(
+            insert(User),
+            [
+                {
+                    "username": f"{USERNAME_PREFIX}{number}",
+                    "email": f"{USERNAME_PREFIX}{number}@example.com",
+                    "hashed_password": "-",
+                }
+                for number in range(users_count)
+            ],
+        )
+        user_ids = list(
+            db.execute(
+                select(User.id).where(User.username.startswith(USERNAME_PREFIX))
+            ).scalars()
+        )
+        deadline = datetime.now() - timedelta(days=1)
+        db.execute(
+            insert(TodoItem),
+            [
+                {
+                    "user_id": user_ids[number % len(user_ids)],
+                    "subject": f"Todo item number {number}",
+                    "deadline": deadline - timedelta(seconds=number),
+                }
+                for number in range(todo_items_count)
+            ],
+        )
+        db.commit()
+    return user_ids
+
+
+def reset_backlog(user_ids: list[int]) -> None:
+    with get_session() as db:
+        db.execute(
+            update(TodoItem)
+            .where(TodoItem.user_id.in_(user_ids))
+            .values(status=TodoItemStatusEnum.OPEN)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+
+def delete_backlog() -> None:
+    with get_session() as db:
+        db.execute(
+            delete(User)
+            .where(User.username.startswith(USERNAME_PREFIX))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+
+def reset_database_pool() -> None:
+    # see `src.background_tasks.main.reset_database_pool()`
+    engine.dispose(close=False)  # type: ignore[call-arg]
+
+
+def sweep_chunk(chunk_number: int, chunks_count: int, batch_size: int) -> int:
+    with get_session() as db:
+        return sum(
+            len(batch)
+            for batch in todo_item_service.mark_all_open_overdue_as_overdue(
+                db,
+                batch_size=batch_size,
+                partition_number=chunk_number,
+                partitions_count=chunks_count,
+            )
+        )
+
+
+def main(arguments: argparse.Namespace) -> None:
+    delete_backlog()
+    user_ids = create_backlog(arguments.users, arguments.todo_items)
+    context = multiprocessing.get_context("fork")
+
+    results: dict[int, tuple[int, float]] = {}
+    try:
+        for workers in [1, 2, 4, 8]:
+            reset_backlog(user_ids)
+            with context.Pool(workers, initializer=reset_database_pool) as pool:
+                started_at = time.perf_counter()
+                todo_items_swept = sum(
+                    pool.starmap(
+                        sweep_chunk,
+                        [
+                            (chunk_number, workers, arguments.batch_size)
+                            for chunk_number in range(workers)
+                        ],
+                    )
+                )
+                results[workers] = (
+                    todo_items_swept,
+                    time.perf_counter() - started_at,
+                )
+    finally:
+        delete_backlog()
+
+    baseline_seconds = results[1][1]
+    print_table(
+        ["workers", "todo items", "total, s", "todo items/sec", "speedup"],
+        [
+            [
+                workers,
+                todo_items_swept,
+                f"{seconds:.2f}",
+                f"{todo_items_swept / seconds:.0f}",
+                f"{baseline_seconds / seconds:.1f}x",
+            ]
+            for workers, (todo_items_swept, seconds) in results.items()
+        ],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--todo-items", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    main(parser.parse_args())
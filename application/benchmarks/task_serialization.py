@@ -0,0 +1,138 @@
+"""
+Measure publishing and consuming the background tasks messages with the `json`,
+`orjson` and `msgpack` serializers, each with and without the compression of the
+messages above the threshold.
+
+    python -m benchmarks.task_serialization --messages 5000 --broker-url memory://
+"""
+
+import argparse
+import time
+from datetime import datetime
+from typing import Any
+
+from kombu import Connection, Consumer, Exchange, Producer, Queue
+from kombu import compression as kombu_compression  # type: ignore[attr-defined]
+from kombu import serialization as kombu_serialization
+from kombu.message import Message
+
+from benchmarks.common import print_table
+from src.background_tasks import serialization
+from src.config import application_config
+from src.emails.todo_items import compose_overdue_email
+from src.enums import EmailTemplateEnum
+from src.services.todo_item_service import TodoItemMarkedAsOverdue
+
+
+def make_payloads() -> dict[str, dict[str, Any]]:
+    subject, body_html = compose_overdue_email(
+        TodoItemMarkedAsOverdue(
+            id=1,
+            subject="Todo item number 1",
+            deadline=datetime(2024, 1, 1),
+            user_id=1,
+            user_username="johnny",
+            user_email="johnny@example.com",
+        )
+    )
+    return {
+        "send_email": {
+            "args": ["johnny@example.com", subject, body_html],
+            "kwargs": {},
+        },
+        "overdue digest": {
+            "args": [EmailTemplateEnum.TODO_ITEMS_OVERDUE_DIGEST.value],
+            "kwargs": {
+                "todo_item_ids": list(range(1_000_000, 1_000_500)),
+                "todo_items_count": 500,
+            },
+        },
+        "archive chunk": {"args": [], "kwargs": {}},
+    }
+
+
+def run(
+    connection: Any,
+    payload: dict[str, Any],
+    serializer: str,
+    compression: str | None,
+    messages_count: int,
+) -> tuple[float, int]:
+    """
+    Publish and consume the messages. Return the total time and the size of a\
+    message body.
+    """
+    exchange = Exchange("benchmark-task-serialization", type="direct")
+    queue = Queue("benchmark-task-serialization", exchange, "benchmark")
+    channel = connection.channel()
+    producer = Producer(channel, exchange, routing_key="benchmark")
+    bound_queue: Any = queue(channel)  # type: ignore[operator]
+    bound_queue.declare()
+    bound_queue.purge()
+
+    _, _, body = kombu_serialization.dumps(payload, serializer)
+    if compression is not None:
+        body, _ = kombu_compression.compress(body, compression)
+
+    consumed_count = 0
+
+    def on_message(message: Message) -> None:
+        nonlocal consumed_count
+        message.decode()
+        message.ack()
+        consumed_count += 1
+
+    consumer: Any = Consumer(
+        connection.channel(),
+        [queue],
+        accept=["json", serialization.ORJSON_SERIALIZER, "msgpack"],
+        on_message=on_message,
+    )
+    started_at = time.perf_counter()
+    for _ in range(messages_count):
+        producer.publish(payload, serializer=serializer, compression=compression)
+    with consumer:
+        while consumed_count < messages_count:
+            connection.drain_events(timeout=10)
+    return (time.perf_counter() - started_at, len(body))
+
+
+def main(arguments: argparse.Namespace) -> None:
+    serialization.register()
+    application_config.BACKGROUND_TASKS_COMPRESSION_THRESHOLD_BYTES = (
+        arguments.compression_threshold_bytes
+    )
+
+    rows: list[list[str]] = []
+    with Connection(arguments.broker_url) as connection:
+        for payload_name, payload in make_payloads().items():
+            for serializer in ["json", serialization.ORJSON_SERIALIZER, "msgpack"]:
+                for compression in [None, serialization.THRESHOLD_COMPRESSION]:
+                    seconds, body_size = run(
+                        connection,
+                        payload,
+                        serializer,
+                        compression,
+                        arguments.messages,
+                    )
+                    rows.append(
+                        [
+                            payload_name,
+                            serializer,
+                            "above threshold" if compression else "none",
+                            f"{arguments.messages / seconds:.0f}",
+                            str(body_size),
+                        ]
+                    )
+
+    print_table(
+        ["payload", "serializer", "compression", "messages/sec", "body, bytes"], rows
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5_000)
+    parser.add_argument("--broker-url", default="memory://")
+    parser.add_argument("--compression-threshold-bytes", type=int, default=1024)
+    main(parser.parse_args())
@@ -0,0 +1,161 @@
+"""
+Measure exporting all of a user's todo items: the NDJSON export streamed from a
+server-side cursor in batches vs all of the rows listed at once and serialized into a
+single response body. Reports the time to the first byte, the total time and the peak
+memory traced by `tracemalloc`.
+
+A user with `--todo-items` todo items is created and deleted afterwards. Run it
+against the test database:
+
+    python -m benchmarks.todo_items_export --todo-items 1000000
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import AsyncIterator
+
+from sqlalchemy import delete, insert, text
+from sqlalchemy.engine import Row
+
+from benchmarks.common import print_table
+from src.api.responses import (
+    get_field_names,
+    make_rows_export_response,
+    make_rows_response,
+)
+from src.core.db import async_engine, get_async_session, get_session
+from src.enums import FileFormatEnum
+from src.models import User
+from src.schemas.todo_item import TodoItemResponse
+from src.services import todo_item_service
+
+USERNAME = "benchmark.todo_items.export"
+
+
+def create_user_with_todo_items(todo_items_count: int) -> int:
+    with get_session() as db:
+        user_id: int = db.execute(
+            insert(User)
+            .values(
+                username=USERNAME,
+                email=f"{USERNAME}@example.com",
+                hashed_password="-",
+            )
+            .returning(User.id)
+        ).scalar_one()
+        db.execute(
+            text(
+                "INSERT INTO todo_items (user_id, subject) "
+                "SELECT :user_id, 'Todo item number ' || number "
+                "FROM generate_series(1, :todo_items_count) AS number"
+            ),
+            {"user_id": user_id, "todo_items_count": todo_items_count},
+        )
+        db.commit()
+    return user_id
+
+
+def delete_user() -> None:
+    with get_session() as db:
+        db.execute(
+            delete(User)
+            .where(User.username == USERNAME)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+
+async def export_streamed(user_id: int, batch_size: int) -> tuple[float, int]:
+    """
+    Return the time to the first chunk and the total size of the body.
+    """
+
+    async def stream_rows() -> AsyncIterator[list[Row]]:
+        async with get_async_session() as db:
+            async for rows in todo_item_service.stream_rows_by_user_async(
+                db,
+                user_id,
+                column_names=get_field_names(TodoItemResponse),
+                batch_size=batch_size,
+            ):
+                yield rows
+
+    response = make_rows_export_response(
+        stream_rows(),
+        TodoItemResponse,
+        FileFormatEnum.NDJSON,
+        filename="todo_items",
+    )
+    started_at = time.perf_counter()
+    first_byte_seconds: float | None = None
+    body_size = 0
+    async for chunk in response.body_iterator:
+        if first_byte_seconds is None:
+            first_byte_seconds = time.perf_counter() - started_at
+        body_size += len(chunk)
+    return (first_byte_seconds or 0.0, body_size)
+
+
+async def export_listed(user_id: int, todo_items_count: int) -> tuple[float, int]:
+    started_at = time.perf_counter()
+    async with get_async_session() as db:
+        rows = await todo_item_service.list_rows_by_user_async(
+            db,
+            user_id,
+            column_names=get_field_names(TodoItemResponse),
+            limit=todo_items_count,
+        )
+    body = make_rows_response(rows, TodoItemResponse).body
+    return (time.perf_counter() - started_at, len(body))
+
+
+async def run(arguments: argparse.Namespace, user_id: int) -> list[list[str]]:
+    rows: list[list[str]] = []
+    for name in ["streamed", "listed at once"]:
+        tracemalloc.start()
+        started_at = time.perf_counter()
+        if name == "streamed":
+            first_byte_seconds, body_size = await export_streamed(
+                user_id, arguments.batch_size
+            )
+        else:
+            first_byte_seconds, body_size = await export_listed(
+                user_id, arguments.todo_items
+            )
+        seconds = time.perf_counter() - started_at
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rows.append(
+            [
+                name,
+                f"{first_byte_seconds * 1000:.0f}",
+                f"{seconds:.2f}",
+                f"{body_size / 1024 / 1024:.1f}",
+                f"{peak_bytes / 1024 / 1024:.1f}",
+            ]
+        )
+    await async_engine.dispose()
+    return rows
+
+
+def main(arguments: argparse.Namespace) -> None:
+    delete_user()
+    user_id = create_user_with_todo_items(arguments.todo_items)
+    try:
+        rows = asyncio.run(run(arguments, user_id))
+    finally:
+        delete_user()
+
+    print_table(
+        ["export", "first byte, ms", "total, s", "body, MiB", "peak memory, MiB"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--todo-items", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    main(parser.parse_args())
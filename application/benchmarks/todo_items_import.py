@@ -0,0 +1,133 @@
+"""
+Measure creating todo items in bulk with the NDJSON import vs one by one with the
+create path operation, both served by the API application in the same process.
+
+A user is created and deleted afterwards along with his todo items. The one by one
+creation is timed on `--one-by-one-todo-items` of them and extrapolated. Run it
+against the test database:
+
+    python -m benchmarks.todo_items_import --todo-items 100000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from typing import AsyncIterator
+
+import httpx
+from sqlalchemy import delete, insert
+
+from benchmarks.common import print_table
+from src.core.db import get_session
+from src.core.security import generate_access_token
+from src.main import application
+from src.models import User
+
+USERNAME = "benchmark.todo_items.import"
+
+
+def create_user() -> int:
+    with get_session() as db:
+        user_id: int = db.execute(
+            insert(User)
+            .values(
+                username=USERNAME,
+                email=f"{USERNAME}@example.com",
+                hashed_password="-",
+            )
+            .returning(User.id)
+        ).scalar_one()
+        db.commit()
+    return user_id
+
+
+def delete_user() -> None:
+    with get_session() as db:
+        db.execute(
+            delete(User)
+            .where(User.username == USERNAME)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+
+def make_todo_item(number: int) -> dict[str, str | None]:
+    deadline = datetime.now() + timedelta(days=30, minutes=number)
+    return {
+        "subject": f"Todo item number {number}",
+        "deadline": deadline.isoformat() if number % 2 else None,
+    }
+
+
+async def stream_ndjson(todo_items_count: int) -> AsyncIterator[bytes]:
+    lines: list[str] = []
+    for number in range(todo_items_count):
+        lines.append(json.dumps(make_todo_item(number)))
+        if len(lines) == 1000:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield "\n".join(lines).encode()
+
+
+async def run(arguments: argparse.Namespace, user_id: int) -> list[list[str]]:
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=application),  # type: ignore[arg-type]
+        base_url="http://benchmark",
+        headers={"Authorization": f"Bearer {generate_access_token(user_id)}"},
+        timeout=None,
+    ) as client:
+        started_at = time.perf_counter()
+        for number in range(arguments.one_by_one_todo_items):
+            response = await client.post(
+                "/users/current-user/todo_items/", json=make_todo_item(number)
+            )
+            response.raise_for_status()
+        one_by_one_seconds = (
+            (time.perf_counter() - started_at)
+            / arguments.one_by_one_todo_items
+            * arguments.todo_items
+        )
+
+        started_at = time.perf_counter()
+        response = await client.post(
+            "/users/current-user/todo_items/import",
+            content=stream_ndjson(arguments.todo_items),
+        )
+        response.raise_for_status()
+        import_seconds = time.perf_counter() - started_at
+
+    return [
+        [
+            "one by one (extrapolated)",
+            f"{one_by_one_seconds:.1f}",
+            f"{arguments.todo_items / one_by_one_seconds:.0f}",
+            "1.0x",
+        ],
+        [
+            "NDJSON import",
+            f"{import_seconds:.1f}",
+            f"{arguments.todo_items / import_seconds:.0f}",
+            f"{one_by_one_seconds / import_seconds:.1f}x",
+        ],
+    ]
+
+
+def main(arguments: argparse.Namespace) -> None:
+    delete_user()
+    user_id = create_user()
+    try:
+        rows = asyncio.run(run(arguments, user_id))
+    finally:
+        delete_user()
+
+    print_table(["creation", "total, s", "todo items/sec", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--todo-items", type=int, default=100_000)
+    parser.add_argument("--one-by-one-todo-items", type=int, default=500)
+    main(parser.parse_args())
@@ -1,2 +1,6 @@
-from .auth import CurrentUserDependency  # noqa: F401
-from .db import SessionDependency  # noqa: F401
+from .auth import (  # noqa: F401
+    CurrentUserDependency,
+    CurrentUserIdDependency,
+    CurrentUserReadOnlyDependency,
+)
+from .db import ReadOnlySessionDependency, SessionDependency  # noqa: F401
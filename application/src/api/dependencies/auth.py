@@ -2,22 +2,53 @@ from typing import Annotated
 
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.security import AccessTokenPayload
 from src.models import User
 from src.services import user_service
 
-from .db import SessionDependency
+from .db import ReadOnlySessionDependency, SessionDependency
 
 reusable_oauth2 = OAuth2PasswordBearer(tokenUrl="/login/access-token")
 
 
-def get_current_user(
+async def _get_user_by_access_token(db: AsyncSession, token: str) -> User:
+    token_payload = AccessTokenPayload.decode_from_access_token(token)
+    return await user_service.get_cached_or_exception_async(
+        db, id=int(token_payload.sub)
+    )
+
+
+async def get_current_user_id(
+    token: Annotated[str, Depends(reusable_oauth2)],
+) -> int:
+    """
+    Get the current user's id from the access token without querying the user, for \
+    the path operations which only filter by it.
+    """
+    token_payload = AccessTokenPayload.decode_from_access_token(token)
+    return int(token_payload.sub)
+
+
+async def get_current_user(
     db: SessionDependency,
     token: Annotated[str, Depends(reusable_oauth2)],
 ) -> User:
-    token_payload = AccessTokenPayload.decode_from_access_token(token)
-    return user_service.get_or_exception(db, id=int(token_payload.sub))
+    return await _get_user_by_access_token(db, token)
+
+
+async def get_current_user_read_only(
+    db: ReadOnlySessionDependency,
+    token: Annotated[str, Depends(reusable_oauth2)],
+) -> User:
+    """
+    Get the current user attached to the read-only session, for the path operations\
+    that do not write.
+    """
+    return await _get_user_by_access_token(db, token)
 
 
 CurrentUserDependency = Annotated[User, Depends(get_current_user)]
+CurrentUserReadOnlyDependency = Annotated[User, Depends(get_current_user_read_only)]
+CurrentUserIdDependency = Annotated[int, Depends(get_current_user_id)]
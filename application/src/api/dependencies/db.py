@@ -1,14 +1,56 @@
-from typing import Annotated, Generator
+import hashlib
+from typing import Annotated, AsyncGenerator
 
-from fastapi import Depends
-from sqlalchemy.orm.session import Session
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.db import get_session
+from src.config import application_config
+from src.core.cache import TTLLRUCache
+from src.core.db import get_async_read_only_session, get_async_session
 
+# clients which have recently written. Reads of such a client are served from the
+# primary for them to see their own writes despite the replication lag. Tracked per
+# API process, hence sticky load balancing keeps the guarantee across processes
+recent_writers: TTLLRUCache[str, bool] = TTLLRUCache(
+    max_size=100_000,
+    ttl_seconds=application_config.POSTGRES_READ_YOUR_WRITES_SECONDS,
+)
 
-def yield_session() -> Generator[Session, None, None]:
-    with get_session() as session:
+
+def get_client_key(request: Request) -> str | None:
+    """
+    Identify a client by the digest of its access token.
+    """
+    authorization = request.headers.get("Authorization")
+    if not authorization:
+        return None
+    return hashlib.sha256(authorization.encode()).hexdigest()
+
+
+async def yield_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_session() as session:
+        yield session
+
+    client_key = get_client_key(request)
+    if client_key is not None and request.method not in ("GET", "HEAD", "OPTIONS"):
+        recent_writers.set(client_key, True)
+
+
+def is_recent_writer(request: Request) -> bool:
+    """
+    Check whether the client has recently written, so that its reads must be served\
+    from the primary.
+    """
+    client_key = get_client_key(request)
+    return client_key is not None and recent_writers.get(client_key) is not None
+
+
+async def yield_read_only_session(
+    request: Request,
+) -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_read_only_session(is_recent_writer(request)) as session:
         yield session
 
 
-SessionDependency = Annotated[Session, Depends(yield_session)]
+SessionDependency = Annotated[AsyncSession, Depends(yield_session)]
+ReadOnlySessionDependency = Annotated[AsyncSession, Depends(yield_read_only_session)]
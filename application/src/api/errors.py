@@ -26,4 +26,10 @@ exceptions_to_http_status_codes: dict[
     services_exceptions.AccessViolationException: status.HTTP_403_FORBIDDEN,
     services_exceptions.StateConflictException: status.HTTP_409_CONFLICT,
     core_exceptions.AccessTokenMalformedException: status.HTTP_401_UNAUTHORIZED,
+    core_exceptions.PaginationCursorMalformedException: (
+        status.HTTP_422_UNPROCESSABLE_ENTITY
+    ),
+    core_exceptions.PasswordHashingOverloadedException: (
+        status.HTTP_503_SERVICE_UNAVAILABLE
+    ),
 }
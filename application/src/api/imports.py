@@ -0,0 +1,160 @@
+import codecs
+import csv
+from typing import Any, AsyncIterator, NamedTuple, TypeVar
+
+import orjson
+from fastapi import HTTPException, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+from src.enums import FileFormatEnum
+from src.schemas.base import BaseAPIModel
+
+APIModelType = TypeVar("APIModelType", bound=BaseAPIModel)
+
+
+async def parse_body_batches(
+    chunks: AsyncIterator[bytes],
+    api_model_type: type[APIModelType],
+    import_format: FileFormatEnum,
+    *,
+    batch_size: int,
+    size_bytes_max: int,
+    errors_max: int,
+) -> AsyncIterator[list[APIModelType]]:
+    """
+    Parse an NDJSON or CSV (with a header) body, streamed in `chunks`, into batches of\
+    `api_model_type` models. Every row is validated as it is read, so that the body\
+    is never held in memory at once.
+
+    Invalid rows are reported by line number once the body is exhausted or\
+    `errors_max` of them are found, by raising `RequestValidationError` after the\
+    valid batches have been yielded. HTTP 413 is raised once the body exceeds\
+    `size_bytes_max`.
+    """
+    read_records = (
+        _read_csv_records if import_format == FileFormatEnum.CSV else _read_ndjson
+    )
+    errors: list[dict[str, Any]] = []
+    batch: list[APIModelType] = []
+    async for line_number, record in read_records(_read_lines(chunks, size_bytes_max)):
+        if isinstance(record, _MalformedRecord):
+            errors.append(
+                {
+                    "loc": ("body", line_number),
+                    "msg": record.message,
+                    "type": "value_error.malformed",
+                }
+            )
+        else:
+            try:
+                batch.append(api_model_type.parse_obj(record))
+            except ValidationError as error:
+                errors += [
+                    {**row_error, "loc": ("body", line_number, *row_error["loc"])}
+                    for row_error in error.errors()
+                ]
+        if len(errors) >= errors_max:
+            break
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+
+    if errors:
+        raise RequestValidationError(errors[:errors_max])
+    if batch:
+        yield batch
+
+
+def ensure_body_size_not_exceeded(size_bytes: int, size_bytes_max: int) -> None:
+    if size_bytes > size_bytes_max:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"the body must not exceed {size_bytes_max} bytes",
+        )
+
+
+class _MalformedRecord(NamedTuple):
+    message: str
+
+
+async def _read_lines(
+    chunks: AsyncIterator[bytes], size_bytes_max: int
+) -> AsyncIterator[tuple[int, str]]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    size_bytes = 0
+    line_number = 0
+    tail = ""
+    try:
+        async for chunk in chunks:
+            size_bytes += len(chunk)
+            ensure_body_size_not_exceeded(size_bytes, size_bytes_max)
+            *lines, tail = (tail + decoder.decode(chunk)).split("\n")
+            for line in lines:
+                line_number += 1
+                yield (line_number, line)
+        tail += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as error:
+        raise RequestValidationError(
+            [{"loc": ("body",), "msg": str(error), "type": "value_error.unicode"}]
+        )
+    if tail:
+        yield (line_number + 1, tail)
+
+
+async def _read_ndjson(
+    lines: AsyncIterator[tuple[int, str]]
+) -> AsyncIterator[tuple[int, Any]]:
+    async for line_number, line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError as error:
+            record = _MalformedRecord(f"invalid JSON: {error}")
+        yield (line_number, record)
+
+
+async def _read_csv_records(
+    lines: AsyncIterator[tuple[int, str]]
+) -> AsyncIterator[tuple[int, Any]]:
+    header: list[str] | None = None
+    record_line_number = 0
+    record_lines: list[str] = []
+    async for line_number, line in lines:
+        if not record_lines:
+            if not line.strip():
+                continue
+            record_line_number = line_number
+        record_lines.append(line)
+        record = "\n".join(record_lines)
+        # a quoted value spans the following lines until its closing quote, quotes
+        # inside of it are doubled
+        if record.count('"') % 2:
+            continue
+        record_lines = []
+
+        try:
+            values = next(csv.reader([record]))
+        except csv.Error as error:
+            yield (record_line_number, _MalformedRecord(f"invalid CSV: {error}"))
+            continue
+        if header is None:
+            header = values
+            continue
+        if len(values) != len(header):
+            yield (
+                record_line_number,
+                _MalformedRecord(
+                    f"invalid CSV: {len(values)} values for {len(header)} columns"
+                ),
+            )
+            continue
+        # empty values are missing ones, the fields' defaults apply
+        yield (
+            record_line_number,
+            {name: value for name, value in zip(header, values) if value != ""},
+        )
+
+    if record_lines:
+        yield (record_line_number, _MalformedRecord("invalid CSV: unclosed quote"))
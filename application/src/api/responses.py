@@ -0,0 +1,178 @@
+import csv
+import functools
+import io
+import zlib
+from datetime import datetime
+from enum import Enum
+from operator import attrgetter
+from typing import Any, AsyncIterator, Callable, Iterable, Mapping, Sequence
+
+import orjson
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+from src.enums import FileFormatEnum
+from src.models.base import BaseDBModel
+from src.schemas.base import BaseAPIModel
+
+
+@functools.cache
+def get_field_names(response_model: type[BaseAPIModel]) -> tuple[str, ...]:
+    return tuple(response_model.__fields__)
+
+
+@functools.cache
+def _get_fields_getter(
+    response_model: type[BaseAPIModel],
+) -> tuple[tuple[str, ...], Callable[[Any], Any]]:
+    field_names = get_field_names(response_model)
+    getter = attrgetter(*field_names)
+    # `attrgetter` of a single attribute returns the value itself, not a tuple
+    if len(field_names) == 1:
+        return (field_names, lambda db_model: (getter(db_model),))
+    return (field_names, getter)
+
+
+def dump_db_model(
+    db_model: BaseDBModel, response_model: type[BaseAPIModel]
+) -> dict[str, Any]:
+    field_names, get_fields = _get_fields_getter(response_model)
+    return dict(zip(field_names, get_fields(db_model)))
+
+
+def make_db_model_response(
+    db_model: BaseDBModel,
+    response_model: type[BaseAPIModel],
+    headers: Mapping[str, str] | None = None,
+) -> ORJSONResponse:
+    """
+    Serialize a DB model into a response of the `response_model` fields, skipping\
+    the response model validation.
+
+    Only for the DB models which are trusted to conform to the `response_model`, i.e.\
+    loaded from the database with the columns' types matching the fields' ones.
+    """
+    return ORJSONResponse(dump_db_model(db_model, response_model), headers=headers)
+
+
+def make_rows_response(
+    rows: Iterable[Sequence[Any]],
+    response_model: type[BaseAPIModel],
+    headers: Mapping[str, str] | None = None,
+) -> ORJSONResponse:
+    """
+    Serialize plain rows of the `response_model` fields, selected in the order of\
+    `get_field_names()`, into a response of a list of them. The cheapest way to\
+    respond with a list, see `make_db_model_response()`.
+    """
+    field_names = get_field_names(response_model)
+    return ORJSONResponse(
+        [dict(zip(field_names, row)) for row in rows], headers=headers
+    )
+
+
+def make_rows_export_response(
+    row_batches: AsyncIterator[Iterable[Sequence[Any]]],
+    response_model: type[BaseAPIModel],
+    export_format: FileFormatEnum,
+    *,
+    filename: str,
+    do_compress: bool = False,
+) -> StreamingResponse:
+    """
+    Stream batches of plain rows of the `response_model` fields, see\
+    `make_rows_response()`, as an NDJSON or CSV file. Each batch is encoded and sent\
+    once it is fetched, so the first bytes are sent right away and the memory stays\
+    the same for any number of rows.
+
+    The body is gzipped with `do_compress`, flushed at every batch.
+    """
+    field_names = get_field_names(response_model)
+    encode_rows = _rows_encoders[export_format]
+
+    async def stream_body() -> AsyncIterator[bytes]:
+        if export_format == FileFormatEnum.CSV:
+            yield _encode_csv_rows([field_names], field_names)
+        async for rows in row_batches:
+            yield encode_rows(rows, field_names)
+
+    headers = {
+        "Content-Disposition": (
+            f'attachment; filename="{filename}.{export_format.value}"'
+        ),
+        "Vary": "Accept-Encoding",
+    }
+    body = stream_body()
+    if do_compress:
+        headers["Content-Encoding"] = "gzip"
+        body = _gzip_stream(body)
+    return StreamingResponse(
+        body, media_type=_media_types[export_format], headers=headers
+    )
+
+
+def is_encoding_accepted(accept_encoding: str, encoding: str) -> bool:
+    """
+    Check whether `encoding` is acceptable by the `Accept-Encoding` request header\
+    value, i.e. listed, by name or as `*`, with a non-zero `q` weight. A name takes\
+    precedence over `*`.
+    """
+    weights: dict[str, float] = {}
+    for coding in accept_encoding.split(","):
+        name, *parameters = coding.split(";")
+        weight = 1.0
+        for parameter in parameters:
+            key, _, value = parameter.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.strip().lower()] = weight
+    return weights.get(encoding, weights.get("*", 0.0)) > 0
+
+
+def _encode_ndjson_rows(
+    rows: Iterable[Sequence[Any]], field_names: Sequence[str]
+) -> bytes:
+    return b"".join(
+        orjson.dumps(dict(zip(field_names, row)), option=orjson.OPT_APPEND_NEWLINE)
+        for row in rows
+    )
+
+
+def _encode_csv_rows(
+    rows: Iterable[Sequence[Any]], field_names: Sequence[str]
+) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        [_format_csv_value(value) for value in row] for row in rows
+    )
+    return buffer.getvalue().encode()
+
+
+def _format_csv_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def _gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        # flushed for the client to be able to decompress every batch once received
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+_rows_encoders: dict[
+    FileFormatEnum, Callable[[Iterable[Sequence[Any]], Sequence[str]], bytes]
+] = {
+    FileFormatEnum.NDJSON: _encode_ndjson_rows,
+    FileFormatEnum.CSV: _encode_csv_rows,
+}
+_media_types = {
+    FileFormatEnum.NDJSON: "application/x-ndjson",
+    FileFormatEnum.CSV: "text/csv",
+}
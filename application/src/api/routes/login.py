@@ -3,7 +3,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 
-from src.api.dependencies import CurrentUserDependency, SessionDependency
+from src.api.dependencies import CurrentUserReadOnlyDependency, SessionDependency
 from src.core.security import generate_access_token
 from src.models import User
 from src.schemas.token import TokenResponse
@@ -14,14 +14,14 @@ router = APIRouter()
 
 
 @router.post("/login/access-token")
-def login_for_access_token(
+async def login_for_access_token(
     db: SessionDependency,
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ) -> TokenResponse:
     """
     OAuth2 compatible token login, get an access token for future requests
     """
-    user = user_service.get_by_credentials_verified(
+    user = await user_service.get_by_credentials_verified_async(
         db, username=form_data.username, password=form_data.password
     )
     if not user:
@@ -36,9 +36,9 @@ def login_for_access_token(
 
 
 @router.get("/login/who-am-i", response_model=UserResponse)
-def read_current_user(
+async def read_current_user(
     *,
-    current_user: CurrentUserDependency,
+    current_user: CurrentUserReadOnlyDependency,
 ) -> User:
     """
     Get current `User`. Endpoint used to test the auth flow
@@ -1,114 +1,282 @@
-from fastapi import APIRouter, status
+from typing import Annotated, AsyncIterator
 
-from src.api.dependencies import CurrentUserDependency, SessionDependency
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.engine import Row
+
+from src.api.dependencies import (
+    CurrentUserDependency,
+    CurrentUserIdDependency,
+    ReadOnlySessionDependency,
+    SessionDependency,
+)
+from src.api.dependencies.db import is_recent_writer
+from src.api.imports import ensure_body_size_not_exceeded, parse_body_batches
+from src.api.responses import (
+    get_field_names,
+    is_encoding_accepted,
+    make_db_model_response,
+    make_rows_export_response,
+    make_rows_response,
+)
+from src.background_tasks.scheduling import make_todo_item_overdue_outbox_messages
 from src.config import application_config
-from src.enums import TodoItemVisibilityEnum
-from src.models import TodoItem
-from src.schemas.todo_item import TodoItemCreate, TodoItemResponse, TodoItemUpdate
+from src.core.db import get_async_read_only_session
+from src.core.pagination import decode_cursor, encode_cursor
+from src.enums import FileFormatEnum, TodoItemVisibilityEnum
+from src.schemas.todo_item import (
+    TodoItemCreate,
+    TodoItemResponse,
+    TodoItemsImportResponse,
+    TodoItemUpdate,
+)
 from src.services import todo_item_service
 
 router = APIRouter()
 
 
 @router.post("/users/current-user/todo_items/", response_model=TodoItemResponse)
-def create_todo_item(
+async def create_todo_item(
     *,
     db: SessionDependency,
     current_user: CurrentUserDependency,
     create_api_model: TodoItemCreate,
-) -> TodoItem:
+) -> ORJSONResponse:
     """
     Create a new `TodoItem`
     """
-    return todo_item_service.create_for_user(db, create_api_model, current_user)
+    # a todo item due soon is scheduled to be marked as overdue right at its deadline
+    todo_item = await todo_item_service.create_for_user_async(
+        db, create_api_model, current_user, make_todo_item_overdue_outbox_messages
+    )
+    return make_db_model_response(todo_item, TodoItemResponse)
 
 
 @router.get("/users/current-user/todo_items/", response_model=list[TodoItemResponse])
-def list_todo_items(
+async def list_todo_items(
     *,
-    db: SessionDependency,
-    current_user: CurrentUserDependency,
+    db: ReadOnlySessionDependency,
+    current_user_id: CurrentUserIdDependency,
+    request: Request,
     visibility: TodoItemVisibilityEnum | None = None,
-    offset: int = 0,
-    limit: int = application_config.API_LIST_LIMIT_DEFAULT,
-) -> list[TodoItem]:
+    cursor: str | None = None,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[
+        int, Query(ge=1, le=application_config.API_LIST_LIMIT_MAX)
+    ] = application_config.API_LIST_LIMIT_DEFAULT,
+) -> ORJSONResponse:
     """
-    List current user's `TodoItems`
+    List current user's `TodoItems` ordered by `id`
+
+    If there may be a next page its URL is passed in the `Link` response header. \
+    Follow it to paginate with an opaque `cursor` which, unlike the `offset`, costs \
+    the same for any page.
     """
-    return todo_item_service.list_by_user(
+    if cursor is not None and offset:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="`cursor` and `offset` can not be used together",
+        )
+    # only the response columns are selected as plain rows, no `TodoItem` instances
+    # are made just to be serialized once
+    todo_items = await todo_item_service.list_rows_by_user_async(
         db,
-        current_user,
+        current_user_id,
+        column_names=get_field_names(TodoItemResponse),
         visibility=visibility,
+        after_id=decode_cursor(cursor) if cursor is not None else None,
         offset=offset,
         limit=limit,
     )
+    headers: dict[str, str] = {}
+    if len(todo_items) == limit:
+        last_todo_item_id: int = todo_items[-1].id
+        next_page_url = request.url.remove_query_params("offset").include_query_params(
+            cursor=encode_cursor(last_todo_item_id)
+        )
+        headers["Link"] = f'<{next_page_url}>; rel="next"'
+    # the rows are serialized right away, validating each of them with the
+    # response model would cost more than querying them
+    return make_rows_response(todo_items, TodoItemResponse, headers)
+
+
+@router.get(
+    "/users/current-user/todo_items/export",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"content": {"application/x-ndjson": {}, "text/csv": {}}}
+    },
+)
+async def export_todo_items(
+    *,
+    current_user_id: CurrentUserIdDependency,
+    request: Request,
+    export_format: Annotated[
+        FileFormatEnum, Query(alias="format")
+    ] = FileFormatEnum.NDJSON,
+    visibility: TodoItemVisibilityEnum | None = None,
+) -> StreamingResponse:
+    """
+    Export all of the current user's `TodoItems` ordered by `id` as an NDJSON or a \
+    CSV file
+
+    The file is streamed while the `TodoItems` are being read. It is gzipped in case \
+    the client accepts it (the `Accept-Encoding` request header).
+    """
+    do_use_primary = is_recent_writer(request)
+
+    async def stream_rows() -> AsyncIterator[list[Row]]:
+        # the session of a dependency is closed before the response is sent, this one
+        # lives as long as the response is being streamed
+        async with get_async_read_only_session(do_use_primary) as db:
+            async for rows in todo_item_service.stream_rows_by_user_async(
+                db,
+                current_user_id,
+                column_names=get_field_names(TodoItemResponse),
+                visibility=visibility,
+                batch_size=application_config.API_EXPORT_BATCH_SIZE,
+            ):
+                yield rows
+
+    return make_rows_export_response(
+        stream_rows(),
+        TodoItemResponse,
+        export_format,
+        filename="todo_items",
+        do_compress=is_encoding_accepted(
+            request.headers.get("Accept-Encoding", ""), "gzip"
+        ),
+    )
+
+
+@router.post(
+    "/users/current-user/todo_items/import",
+    response_model=TodoItemsImportResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        }
+    },
+)
+async def import_todo_items(
+    *,
+    db: SessionDependency,
+    current_user_id: CurrentUserIdDependency,
+    request: Request,
+    import_format: Annotated[
+        FileFormatEnum, Query(alias="format")
+    ] = FileFormatEnum.NDJSON,
+) -> TodoItemsImportResponse:
+    """
+    Create `TodoItems` in bulk from an NDJSON or a CSV (with a header) file of \
+    `TodoItemCreate` rows
+
+    The file is validated while it is being uploaded and inserted once it has \
+    been, so that a database connection is not held for the upload. Nothing is \
+    created in case any of the rows is invalid, the invalid ones are reported by \
+    line number.
+    """
+    content_length = request.headers.get("Content-Length")
+    if content_length is not None:
+        if not content_length.isascii() or not content_length.isdigit():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="the `Content-Length` header must be a non-negative integer",
+            )
+        ensure_body_size_not_exceeded(
+            int(content_length), application_config.API_IMPORT_SIZE_BYTES_MAX
+        )
+    # the session checks out a connection on the first statement only
+    create_api_models_batches = [
+        create_api_models
+        async for create_api_models in parse_body_batches(
+            request.stream(),
+            TodoItemCreate,
+            import_format,
+            batch_size=application_config.API_IMPORT_BATCH_SIZE,
+            size_bytes_max=application_config.API_IMPORT_SIZE_BYTES_MAX,
+            errors_max=application_config.API_IMPORT_ERRORS_MAX,
+        )
+    ]
+    created_count = await todo_item_service.create_many_for_user_async(
+        db,
+        create_api_models_batches,
+        current_user_id,
+        make_todo_item_overdue_outbox_messages,
+    )
+    return TodoItemsImportResponse(created_count=created_count)
 
 
 @router.put(
     "/users/current-user/todo_items/{todo_item_id}", response_model=TodoItemResponse
 )
-def update_todo_item(
+async def update_todo_item(
     *,
     db: SessionDependency,
     current_user: CurrentUserDependency,
     todo_item_id: int,
     update_api_model: TodoItemUpdate,
-) -> TodoItem:
+) -> ORJSONResponse:
     """
     Update a `TodoItem`
     """
-    todo_item = todo_item_service.get_for_user_or_exception(
+    todo_item = await todo_item_service.get_for_user_or_exception_async(
         db, todo_item_id, current_user
     )
-    todo_item_service.update(db, todo_item, update_api_model)
-    return todo_item
+    await todo_item_service.update_async(
+        db, todo_item, update_api_model, make_todo_item_overdue_outbox_messages
+    )
+    return make_db_model_response(todo_item, TodoItemResponse)
 
 
 @router.post(
     "/users/current-user/todo_items/{todo_item_id}/resolve",
     response_model=TodoItemResponse,
 )
-def resolve_todo_item(
+async def resolve_todo_item(
     *,
     db: SessionDependency,
     current_user: CurrentUserDependency,
     todo_item_id: int,
-) -> TodoItem:
+) -> ORJSONResponse:
     """
     Transfer an open `TodoItem` into resolved state
     """
-    todo_item = todo_item_service.get_for_user_or_exception(
+    todo_item = await todo_item_service.get_for_user_or_exception_async(
         db, todo_item_id, current_user
     )
-    todo_item_service.resolve(db, todo_item)
-    return todo_item
+    await todo_item_service.resolve_async(db, todo_item)
+    return make_db_model_response(todo_item, TodoItemResponse)
 
 
 @router.post(
     "/users/current-user/todo_items/{todo_item_id}/reopen",
     response_model=TodoItemResponse,
 )
-def reopen_todo_item(
+async def reopen_todo_item(
     *,
     db: SessionDependency,
     current_user: CurrentUserDependency,
     todo_item_id: int,
-) -> TodoItem:
+) -> ORJSONResponse:
     """
     Reopen a resolved `TodoItem`
     """
-    todo_item = todo_item_service.get_for_user_or_exception(
+    todo_item = await todo_item_service.get_for_user_or_exception_async(
         db, todo_item_id, current_user
     )
-    todo_item_service.reopen(db, todo_item)
-    return todo_item
+    await todo_item_service.reopen_async(
+        db, todo_item, make_todo_item_overdue_outbox_messages
+    )
+    return make_db_model_response(todo_item, TodoItemResponse)
 
 
 @router.delete(
     "/users/current-user/todo_items/{todo_item_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_todo_item(
+async def delete_todo_item(
     *,
     db: SessionDependency,
     todo_item_id: int,
@@ -117,7 +285,7 @@ def delete_todo_item(
     """
     Delete a `TodoItem`
     """
-    todo_item = todo_item_service.get_for_user_or_exception(
+    todo_item = await todo_item_service.get_for_user_or_exception_async(
         db, todo_item_id, current_user
     )
-    todo_item_service.delete(db, todo_item)
+    await todo_item_service.delete_async(db, todo_item)
@@ -1,61 +1,69 @@
 from fastapi import APIRouter, status
+from fastapi.responses import ORJSONResponse
 
-from src.api.dependencies import CurrentUserDependency, SessionDependency
-from src.background_tasks import send_email
-from src.emails.users import compose_registration_email
+from src.api.dependencies import (
+    CurrentUserDependency,
+    CurrentUserReadOnlyDependency,
+    SessionDependency,
+)
+from src.api.responses import make_db_model_response
+from src.background_tasks import send_templated_email
+from src.enums import EmailTemplateEnum
+from src.models import OutboxMessage
 from src.models.user import User
 from src.schemas.user import UserCreate, UserResponse, UserUpdate
-from src.services import user_service
+from src.services import outbox_service, user_service
 
 router = APIRouter()
 
 
 @router.post("/users/", response_model=UserResponse)
-def create_user(
+async def create_user(
     *,
     db: SessionDependency,
     create_api_model: UserCreate,
-) -> User:
+) -> ORJSONResponse:
     """
     Register (create) a new `User`.
     """
-    new_user = user_service.create(db, create_api_model)
-
-    send_email.apply_async(args=(new_user.email, *compose_registration_email(new_user)))
-
-    return new_user
+    # the registration e-mail task is committed along with the user and published
+    # by the outbox relay, so that the broker is never waited for
+    user = await user_service.create_async(
+        db, create_api_model, _make_registration_email_outbox_messages
+    )
+    return make_db_model_response(user, UserResponse)
 
 
 @router.get("/users/current-user", response_model=UserResponse)
-def read_current_user(
+async def read_current_user(
     *,
-    current_user: CurrentUserDependency,
-) -> User:
+    current_user: CurrentUserReadOnlyDependency,
+) -> ORJSONResponse:
     """
     Get the current (authenticated) `User`'s details.
     """
-    return current_user
+    return make_db_model_response(current_user, UserResponse)
 
 
 @router.put("/users/current-user", response_model=UserResponse)
-def update_current_user(
+async def update_current_user(
     *,
     db: SessionDependency,
     current_user: CurrentUserDependency,
     update_api_model: UserUpdate,
-) -> User:
+) -> ORJSONResponse:
     """
     Update the current (authenticated) `User`'s details.
     """
-    user_service.update(db, current_user, update_api_model)
-    return current_user
+    await user_service.update_async(db, current_user, update_api_model)
+    return make_db_model_response(current_user, UserResponse)
 
 
 @router.delete(
     "/users/current-user",
     status_code=status.HTTP_204_NO_CONTENT,
 )
-def delete_current_user(
+async def delete_current_user(
     *,
     db: SessionDependency,
     current_user: CurrentUserDependency,
@@ -63,4 +71,14 @@ def delete_current_user(
     """
     Delete the current (authenticated) `User`.
     """
-    user_service.delete(db, current_user)
+    await user_service.delete_async(db, current_user)
+
+
+def _make_registration_email_outbox_messages(user: User) -> list[OutboxMessage]:
+    return [
+        outbox_service.make_message(
+            send_templated_email.name,
+            [EmailTemplateEnum.USER_REGISTERED.value],
+            {"user_id": user.id},
+        )
+    ]
@@ -1 +1 @@
-from .main import send_email  # noqa: F401
+from .main import send_email, send_templated_email  # noqa: F401
@@ -1,5 +1,12 @@
+from kombu import Exchange, Queue
+
 from src.config import application_config
 
+from . import serialization
+from .routing import route_priority_email
+
+serialization.register()
+
 broker_url = application_config.get_rabbitmq_uri()
 
 timezone = "UTC"
@@ -9,7 +16,46 @@ beat_schedule_filename = "./src/background_tasks/.celerybeat-schedule"
 worker_redirect_stdouts = True
 worker_redirect_stdouts_level = "WARNING"
 
+task_serializer = application_config.BACKGROUND_TASKS_SERIALIZER
+accept_content = ["json", serialization.ORJSON_SERIALIZER, "msgpack"]
+task_compression = (
+    serialization.THRESHOLD_COMPRESSION
+    if application_config.BACKGROUND_TASKS_COMPRESSION_THRESHOLD_BYTES is not None
+    else None
+)
+
 task_default_queue = "default-queue"
 task_default_exchange = "default-exchange"
 task_default_exchange_type = "topic"
 task_default_routing_key = "task.default"
+
+_default_exchange = Exchange(task_default_exchange, type=task_default_exchange_type)
+# declared with no priorities as an existing queue can not be redeclared with them
+task_queues = [
+    Queue(task_default_queue, _default_exchange, routing_key=task_default_routing_key),
+    *(
+        Queue(
+            queue_name,
+            _default_exchange,
+            routing_key=f"task.{queue_name.removesuffix('-queue')}",
+            queue_arguments={
+                "x-max-priority": application_config.BACKGROUND_TASKS_PRIORITY_MAX
+            },
+        )
+        for queue_name in sorted(
+            {
+                *application_config.BACKGROUND_TASKS_QUEUES_BY_TASK.values(),
+                application_config.BACKGROUND_TASKS_PRIORITY_EMAILS_QUEUE,
+            }
+        )
+    ),
+]
+task_routes = (
+    route_priority_email,
+    {
+        task_name: {"queue": queue_name}
+        for task_name, queue_name in (
+            application_config.BACKGROUND_TASKS_QUEUES_BY_TASK.items()
+        )
+    },
+)
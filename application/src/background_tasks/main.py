@@ -1,48 +1,217 @@
 from typing import Any
 
 from celery import Celery
+from celery.signals import (
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown,
+)
+from celery.worker.control import inspect_command  # type: ignore[import-untyped]
 
+from src.config import application_config
+from src.core.db import engine
+from src.core.email import email_templates_registry
 from src.core.email import send_email as core_send_email
-from src.emails.todo_items import compose_overdue_email
+from src.core.email import send_emails as core_send_emails
+from src.core.email import smtp_connection_pool
+from src.core.metrics import metrics
+from src.enums import EmailTemplateEnum
 
 from . import celeryconfig, tasks
+from .single_flight import single_flight
 
 application = Celery("background_tasks")
 application.config_from_object(celeryconfig)
 
 
+@worker_init.connect
+def precompile_email_templates(**kwargs: Any) -> None:
+    # compiled before the worker processes are forked, so that every one of them
+    # inherits the compiled templates
+    email_templates_registry.precompile()
+
+
+@worker_process_init.connect
+def reset_database_pool(**kwargs: Any) -> None:
+    # connections inherited from the parent process must not be shared between the
+    # forked worker processes
+    engine.dispose(close=False)  # type: ignore[call-arg]
+
+
+# the latter one is sent by the worker using a threads pool, which has no processes
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def close_smtp_connections(**kwargs: Any) -> None:
+    smtp_connection_pool.close()
+
+
+@inspect_command()  # type: ignore[misc]
+def read_metrics(state: Any) -> dict[str, Any]:
+    """
+    Usage: `celery --app src.background_tasks.main inspect read_metrics`
+    """
+    return metrics.snapshot()
+
+
 @application.task(acks_late=True)
 def send_email(email_to: str, subject: str, body_html: str) -> None:
     core_send_email(email_to, subject, body_html)
 
 
 @application.task(acks_late=True)
-def todo_items_update_status_overdue() -> int:
-    todo_items_marked_as_overdue = tasks.todo_items.update_status_overdue()
+def send_emails(emails_to_send: list[tuple[str, str, str]]) -> None:
+    """
+    Send emails, given as `(email_to, subject, body_html)`, over a single connection.
+    """
+    core_send_emails(emails_to_send)
+
 
-    for todo_item in todo_items_marked_as_overdue:
-        send_email.apply_async(
-            args=(todo_item.user.email, *compose_overdue_email(todo_item))
+@application.task(acks_late=True)
+def send_templated_email(template_key: str, **template_arguments: Any) -> None:
+    """
+    Render the email of `template_key` from the records referenced by the\
+    `template_arguments` ids and send it. Publishers pass ids only, so that no\
+    rendering is done by them and messages stay small.
+    """
+    email_composed = tasks.emails.compose(
+        EmailTemplateEnum(template_key), **template_arguments
+    )
+    if email_composed is not None:
+        core_send_email(*email_composed)
+
+
+@application.task(acks_late=True)
+def todo_item_update_status_overdue(todo_item_id: int) -> bool:
+    """
+    Scheduled with the `TodoItem`'s deadline as the ETA. A no-op in case the\
+    `TodoItem` is no longer open or its deadline has been moved.
+    """
+    todo_item = tasks.todo_items.update_status_overdue_one(todo_item_id)
+    if todo_item is None:
+        return False
+    send_templated_email.apply_async(
+        args=(EmailTemplateEnum.TODO_ITEM_OVERDUE.value,),
+        kwargs={"todo_item_id": todo_item.id},
+    )
+    return True
+
+
+@application.task(acks_late=True)
+@single_flight
+def todo_items_update_status_overdue() -> None:
+    """
+    The safety net for the `TodoItems` not marked as overdue on time: the ones\
+    which got due within the horizon before the previous scan, or whose ETA task\
+    has been lost. Schedules the ETA tasks for the ones due within the horizon.
+
+    The coordinator of the chunk tasks doing the sweep.
+    """
+    chunks_count = application_config.TODO_ITEMS_SWEEP_CHUNKS_COUNT
+    for chunk_number in range(chunks_count):
+        todo_items_update_status_overdue_chunk.apply_async(
+            args=(chunk_number, chunks_count)
         )
 
-    return len(todo_items_marked_as_overdue)
+    # a todo item may be scheduled more than once, the ETA tasks after the first one
+    # are no-ops
+    for todo_item_id, deadline in tasks.todo_items.list_open_due_within_horizon():
+        todo_item_update_status_overdue.apply_async(args=(todo_item_id,), eta=deadline)
 
 
 @application.task(acks_late=True)
-def todo_items_move_dangling_to_archive() -> int:
-    todo_items_moved_to_archive = tasks.todo_items.move_dangling_to_archive()
-    return len(todo_items_moved_to_archive)
+@single_flight
+def todo_items_update_status_overdue_chunk(chunk_number: int, chunks_count: int) -> int:
+    return _send_overdue_emails(
+        tasks.todo_items.update_status_overdue(chunk_number, chunks_count)
+    )
+
+
+@application.task(acks_late=True)
+@single_flight
+def todo_items_recover_status_overdue() -> None:
+    """
+    Mark the `TodoItems` left behind the watermark of the periodic scan.
+
+    The coordinator of the chunk tasks doing the sweep.
+    """
+    chunks_count = application_config.TODO_ITEMS_SWEEP_CHUNKS_COUNT
+    for chunk_number in range(chunks_count):
+        todo_items_recover_status_overdue_chunk.apply_async(
+            args=(chunk_number, chunks_count)
+        )
+
+
+@application.task(acks_late=True)
+@single_flight
+def todo_items_recover_status_overdue_chunk(
+    chunk_number: int, chunks_count: int
+) -> int:
+    return _send_overdue_emails(
+        tasks.todo_items.recover_status_overdue(chunk_number, chunks_count)
+    )
+
+
+@application.task(acks_late=True)
+@single_flight
+def todo_items_move_dangling_to_archive() -> None:
+    """
+    The coordinator of the chunk tasks doing the sweep.
+    """
+    for chunk_number in range(application_config.TODO_ITEMS_SWEEP_CHUNKS_COUNT):
+        todo_items_move_dangling_to_archive_chunk.apply_async(args=(chunk_number,))
+
+
+@application.task(acks_late=True)
+@single_flight
+def todo_items_move_dangling_to_archive_chunk(chunk_number: int) -> int:
+    """
+    Chunks are not partitioned: each one claims batches of rows with\
+    `SKIP LOCKED` until none is left, so that they split the backlog between them.
+    The `chunk_number` only tells the chunks apart for the single-flight lock.
+    """
+    return tasks.todo_items.move_dangling_to_archive()
 
 
 @application.on_after_finalize.connect
 def setup_periodic_tasks(sender: Celery, **kwargs: Any) -> None:
     sender.add_periodic_task(
-        300,
+        application_config.TODO_ITEMS_OVERDUE_SCAN_INTERVAL_SECONDS,
         todo_items_update_status_overdue.s(),
-        expires=240,
+        expires=application_config.TODO_ITEMS_OVERDUE_SCAN_INTERVAL_SECONDS * 0.8,
+    )
+    sender.add_periodic_task(
+        application_config.TODO_ITEMS_OVERDUE_RECOVERY_INTERVAL_SECONDS,
+        todo_items_recover_status_overdue.s(),
+        expires=application_config.TODO_ITEMS_OVERDUE_RECOVERY_INTERVAL_SECONDS * 0.8,
     )
     sender.add_periodic_task(
         300,
         todo_items_move_dangling_to_archive.s(),
         expires=240,
     )
+
+
+def _send_overdue_emails(digests: list[tasks.todo_items.TodoItemsOverdueDigest]) -> int:
+    """
+    Send each user an email about the `TodoItems` marked as overdue. Return the\
+    number of them.
+    """
+    todo_items_marked_as_overdue_count = 0
+    for digest in digests:
+        # a single todo item is worth the regular email
+        if digest.todo_items_count == 1:
+            send_templated_email.apply_async(
+                args=(EmailTemplateEnum.TODO_ITEM_OVERDUE.value,),
+                kwargs={"todo_item_id": digest.todo_items[0].id},
+            )
+        else:
+            send_templated_email.apply_async(
+                args=(EmailTemplateEnum.TODO_ITEMS_OVERDUE_DIGEST.value,),
+                kwargs={
+                    "todo_item_ids": [todo_item.id for todo_item in digest.todo_items],
+                    "todo_items_count": digest.todo_items_count,
+                },
+            )
+        todo_items_marked_as_overdue_count += digest.todo_items_count
+    return todo_items_marked_as_overdue_count
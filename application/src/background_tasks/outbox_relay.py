@@ -0,0 +1,66 @@
+"""
+Publish the tasks written to the outbox table to the broker.
+
+Usage: `python -m src.background_tasks.outbox_relay`
+"""
+
+import logging
+import time
+
+from kombu import Producer
+
+from src.config import application_config
+from src.core.db import get_session
+from src.core.metrics import metrics
+from src.models import OutboxMessage
+from src.services import outbox_service
+
+from .main import application
+
+logger = logging.getLogger(__name__)
+
+
+def relay_pending(producer: Producer) -> int:
+    """
+    Publish all pending outbox messages. Return the number of messages published.
+    """
+
+    def publish(outbox_messages: list[OutboxMessage]) -> None:
+        for outbox_message in outbox_messages:
+            application.send_task(
+                outbox_message.task_name,
+                args=outbox_message.task_args,
+                kwargs=outbox_message.task_kwargs,
+                eta=outbox_message.task_eta,
+                producer=producer,
+            )
+        metrics.increment("outbox.relayed", len(outbox_messages))
+
+    with get_session() as db:
+        return outbox_service.relay_pending(
+            db, publish, batch_size=application_config.OUTBOX_RELAY_BATCH_SIZE
+        )
+
+
+def run() -> None:
+    """
+    Poll the outbox forever. Messages are published over a single connection with\
+    publisher confirms, the connection is reopened after any failure.
+    """
+    while True:
+        try:
+            with application.connection_for_write(
+                transport_options={"confirm_publish": True}
+            ) as connection:
+                producer = Producer(connection)
+                while True:
+                    relay_pending(producer)
+                    time.sleep(application_config.OUTBOX_RELAY_POLL_INTERVAL_SECONDS)
+        except Exception:
+            logger.exception("Failed to relay the outbox messages, retrying")
+            time.sleep(application_config.OUTBOX_RELAY_POLL_INTERVAL_SECONDS)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run()
@@ -0,0 +1,22 @@
+from typing import Any
+
+from src.config import application_config
+
+
+def route_priority_email(
+    name: str, args: tuple[Any, ...], kwargs: dict[str, Any], options: Any, **_: Any
+) -> dict[str, Any] | None:
+    """
+    Route the user-facing emails sent by `send_templated_email` to the priority \
+    queue, the others are left to the routing by task names.
+    """
+    if (
+        name.endswith(".send_templated_email")
+        and args
+        and args[0] in application_config.BACKGROUND_TASKS_PRIORITY_EMAIL_TEMPLATES
+    ):
+        return {
+            "queue": application_config.BACKGROUND_TASKS_PRIORITY_EMAILS_QUEUE,
+            "priority": application_config.BACKGROUND_TASKS_PRIORITY_MAX,
+        }
+    return None
@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta
+
+from src.config import application_config
+from src.enums import TodoItemStatusEnum
+from src.models import OutboxMessage, TodoItem
+from src.services import outbox_service
+
+from .main import todo_item_update_status_overdue
+
+
+def make_todo_item_overdue_outbox_messages(
+    todo_item: TodoItem,
+) -> list[OutboxMessage]:
+    """
+    Schedule an open `TodoItem` to be marked as overdue right at its deadline. \
+    Deadlines beyond the horizon are left to the periodic scan to be scheduled.
+    """
+    scheduling_horizon = datetime.now() + timedelta(
+        seconds=application_config.TODO_ITEMS_OVERDUE_SCHEDULING_HORIZON_SECONDS
+    )
+    if (
+        todo_item.status != TodoItemStatusEnum.OPEN
+        or todo_item.deadline is None
+        or todo_item.deadline >= scheduling_horizon
+    ):
+        return []
+    return [
+        outbox_service.make_message(
+            todo_item_update_status_overdue.name,
+            [todo_item.id],
+            task_eta=todo_item.deadline,
+        )
+    ]
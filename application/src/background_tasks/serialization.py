@@ -0,0 +1,57 @@
+"""
+Serializers and compression of the background tasks messages, registered in kombu.
+
+Every worker accepts all of the serializers, so that the one tasks are published with
+may be switched while there are messages queued.
+"""
+
+import zlib
+from typing import Any
+
+import orjson
+from kombu import compression, serialization  # type: ignore[attr-defined]
+
+from src.config import application_config
+
+ORJSON_SERIALIZER = "orjson"
+# messages are compressed only if they are bigger than
+# `BACKGROUND_TASKS_COMPRESSION_THRESHOLD_BYTES`. A leading byte flags whether the
+# rest of the message is compressed
+THRESHOLD_COMPRESSION = "zlib-above-threshold"
+
+_NOT_COMPRESSED = b"\x00"
+_COMPRESSED = b"\x01"
+
+
+def orjson_dumps(value: Any) -> bytes:
+    # unlike with `json`, datetimes are not restored on load but left as ISO strings
+    return orjson.dumps(value)
+
+
+def compress_above_threshold(body: bytes) -> bytes:
+    threshold_bytes = application_config.BACKGROUND_TASKS_COMPRESSION_THRESHOLD_BYTES
+    if threshold_bytes is None or len(body) <= threshold_bytes:
+        return _NOT_COMPRESSED + body
+    return _COMPRESSED + zlib.compress(body)
+
+
+def decompress_above_threshold(body: bytes) -> bytes:
+    if body[:1] == _COMPRESSED:
+        return zlib.decompress(body[1:])
+    return body[1:]
+
+
+def register() -> None:
+    serialization.register(
+        ORJSON_SERIALIZER,
+        orjson_dumps,  # type: ignore[arg-type]
+        orjson.loads,
+        content_type="application/x-orjson",
+        content_encoding="binary",
+    )
+    compression.register(
+        compress_above_threshold,
+        decompress_above_threshold,
+        "application/x-zlib-above-threshold",
+        aliases=[THRESHOLD_COMPRESSION],
+    )
@@ -0,0 +1,33 @@
+import functools
+from typing import Callable, ParamSpec, TypeVar
+
+from src.core.db import try_advisory_lock
+from src.core.metrics import metrics
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def single_flight(function: Callable[P, R]) -> Callable[P, R | None]:
+    """
+    Skip a task while another execution of it with the same arguments is in\
+    progress anywhere in the cluster, e.g. a periodic task sent by each of the beat\
+    schedulers. Skipped executions return `None` and are counted in the metrics.
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R | None:
+        lock_name = ":".join(
+            [
+                function.__name__,
+                *(str(argument) for argument in args),
+                *(f"{key}={value}" for key, value in sorted(kwargs.items())),
+            ]
+        )
+        with try_advisory_lock(lock_name) as is_locked:
+            if not is_locked:
+                metrics.increment(f"background_tasks.{function.__name__}.skipped")
+                return None
+            return function(*args, **kwargs)
+
+    return wrapper
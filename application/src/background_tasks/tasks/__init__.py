@@ -1,2 +1,3 @@
+from . import emails  # noqa: F401
 from . import todo_items  # noqa: F401
 from . import users  # noqa: F401
@@ -0,0 +1,62 @@
+from typing import Any, Callable
+
+from sqlalchemy.orm import Session
+
+from src.core.db import get_session
+from src.emails.todo_items import compose_overdue_digest_email, compose_overdue_email
+from src.emails.users import compose_registration_email
+from src.enums import EmailTemplateEnum
+from src.services import todo_item_service, user_service
+
+# an email to be sent as `(email_to, subject, body_html)`
+EmailComposed = tuple[str, str, str]
+
+
+def compose(
+    template: EmailTemplateEnum, **template_arguments: Any
+) -> EmailComposed | None:
+    """
+    Load the records referenced by `template_arguments` and render the email of \
+    `template`. Return `None` if the records are gone or the email is no longer \
+    relevant.
+    """
+    with get_session() as db:
+        return _composers[template](db, **template_arguments)
+
+
+def _compose_user_registered(db: Session, user_id: int) -> EmailComposed | None:
+    user = user_service.get(db, user_id)
+    if user is None:
+        return None
+    return (user.email, *compose_registration_email(user))
+
+
+def _compose_todo_item_overdue(db: Session, todo_item_id: int) -> EmailComposed | None:
+    todo_items = todo_item_service.list_overdue_by_ids(db, [todo_item_id])
+    if not todo_items:
+        return None
+    return (todo_items[0].user_email, *compose_overdue_email(todo_items[0]))
+
+
+def _compose_todo_items_overdue_digest(
+    db: Session, todo_item_ids: list[int], todo_items_count: int
+) -> EmailComposed | None:
+    todo_items = todo_item_service.list_overdue_by_ids(db, todo_item_ids)
+    if not todo_items:
+        return None
+    # the listed ones no longer overdue are not counted, the state of the ones not
+    # listed is unknown
+    todo_items_count_overdue = todo_items_count - len(todo_item_ids) + len(todo_items)
+    return (
+        todo_items[0].user_email,
+        *compose_overdue_digest_email(
+            todo_items[0].user_username, todo_items, todo_items_count_overdue
+        ),
+    )
+
+
+_composers: dict[EmailTemplateEnum, Callable[..., EmailComposed | None]] = {
+    EmailTemplateEnum.USER_REGISTERED: _compose_user_registered,
+    EmailTemplateEnum.TODO_ITEM_OVERDUE: _compose_todo_item_overdue,
+    EmailTemplateEnum.TODO_ITEMS_OVERDUE_DIGEST: _compose_todo_items_overdue_digest,
+}
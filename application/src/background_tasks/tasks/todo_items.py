@@ -1,25 +1,114 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Iterable
+
 from src.config import application_config
 from src.core.db import get_session
-from src.models import TodoItem
 from src.services import todo_item_service
+from src.services.todo_item_service import TodoItemMarkedAsOverdue
+
+
+@dataclass
+class TodoItemsOverdueDigest:
+    """
+    A user's `TodoItems` marked as overdue. At most \
+    `TODO_ITEMS_OVERDUE_DIGEST_ITEMS_MAX` of them are kept to be listed in an email, \
+    while `todo_items_count` counts all of them.
+    """
 
+    user_username: str
+    user_email: str
+    todo_items: list[TodoItemMarkedAsOverdue] = field(default_factory=list)
+    todo_items_count: int = 0
 
-def update_status_overdue() -> list[TodoItem]:
+
+def update_status_overdue(
+    chunk_number: int = 0, chunks_count: int = 1
+) -> list[TodoItemsOverdueDigest]:
+    """
+    Mark open `TodoItems` of the chunk's users which have passed the deadline since \
+    the previous run as overdue. Return them grouped by users.
+    """
     with get_session() as db:
-        todo_items_to_mark_as_overdue = todo_item_service.get_all_open_overdue(db)
-        for todo_item in todo_items_to_mark_as_overdue:
-            todo_item_service.mark_as_overdue(db, todo_item)
-    return todo_items_to_mark_as_overdue
+        return _group_by_users(
+            todo_item_service.mark_open_overdue_after_watermark_as_overdue(
+                db,
+                batch_size=application_config.TODO_ITEMS_SWEEP_BATCH_SIZE,
+                partition_number=chunk_number,
+                partitions_count=chunks_count,
+            )
+        )
 
 
-def move_dangling_to_archive() -> list[TodoItem]:
+def recover_status_overdue(
+    chunk_number: int = 0, chunks_count: int = 1
+) -> list[TodoItemsOverdueDigest]:
+    """
+    Mark all open `TodoItems` of the chunk's users which have passed the deadline \
+    as overdue, including the ones missed by `update_status_overdue()`. Return \
+    them grouped by users.
+    """
     with get_session() as db:
-        todo_items_to_move_to_archive = (
-            todo_item_service.get_all_visible_not_open_dangling(
+        return _group_by_users(
+            todo_item_service.mark_all_open_overdue_as_overdue(
                 db,
-                hours_in_status=application_config.TODO_ITEMS_DANGLING_HOURS_MAX,
+                batch_size=application_config.TODO_ITEMS_SWEEP_BATCH_SIZE,
+                partition_number=chunk_number,
+                partitions_count=chunks_count,
             )
         )
-        for todo_item in todo_items_to_move_to_archive:
-            todo_item_service.move_to_archive(db, todo_item)
-    return todo_items_to_move_to_archive
+
+
+def update_status_overdue_one(todo_item_id: int) -> TodoItemMarkedAsOverdue | None:
+    """
+    Mark a `TodoItem` as overdue in case it is still open and has passed the \
+    deadline, which might have been changed since it was scheduled.
+    """
+    with get_session() as db:
+        return todo_item_service.mark_open_overdue_as_overdue(db, todo_item_id)
+
+
+def list_open_due_within_horizon() -> list[tuple[int, datetime]]:
+    """
+    List `(id, deadline)` of the open `TodoItems` due within \
+    `TODO_ITEMS_OVERDUE_SCHEDULING_HORIZON_SECONDS`. The ones already past the \
+    deadline are left to the sweeps.
+    """
+    now = datetime.now()
+    with get_session() as db:
+        return todo_item_service.list_open_with_deadline_between(
+            db,
+            now,
+            now
+            + timedelta(
+                seconds=application_config.TODO_ITEMS_OVERDUE_SCHEDULING_HORIZON_SECONDS
+            ),
+        )
+
+
+def move_dangling_to_archive() -> int:
+    with get_session() as db:
+        return todo_item_service.archive_all_visible_not_open_dangling(
+            db,
+            hours_in_status=application_config.TODO_ITEMS_DANGLING_HOURS_MAX,
+            batch_size=application_config.TODO_ITEMS_SWEEP_BATCH_SIZE,
+        )
+
+
+def _group_by_users(
+    todo_items_batches: Iterable[list[TodoItemMarkedAsOverdue]],
+) -> list[TodoItemsOverdueDigest]:
+    digests_by_user_id: dict[int, TodoItemsOverdueDigest] = {}
+    for todo_items_batch in todo_items_batches:
+        for todo_item in todo_items_batch:
+            digest = digests_by_user_id.setdefault(
+                todo_item.user_id,
+                TodoItemsOverdueDigest(todo_item.user_username, todo_item.user_email),
+            )
+            if (
+                len(digest.todo_items)
+                < application_config.TODO_ITEMS_OVERDUE_DIGEST_ITEMS_MAX
+            ):
+                digest.todo_items.append(todo_item)
+            digest.todo_items_count += 1
+    return list(digests_by_user_id.values())
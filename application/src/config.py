@@ -7,8 +7,43 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "prod"
 
     API_LIST_LIMIT_DEFAULT: int = 20
+    API_LIST_LIMIT_MAX: int = 100
+    # exports are streamed, rows are fetched from a server-side cursor and sent to
+    # the client in batches of that many
+    API_EXPORT_BATCH_SIZE: int = 1000
+    # imports are streamed too, rows are validated and inserted in batches of that
+    # many, all of them in a single transaction
+    API_IMPORT_BATCH_SIZE: int = 1000
+    # bigger imports are rejected
+    API_IMPORT_SIZE_BYTES_MAX: int = 16 * 1024 * 1024  # 16 MiB
+    # an import is stopped at that many invalid rows, nothing is imported
+    API_IMPORT_ERRORS_MAX: int = 100
 
     TODO_ITEMS_DANGLING_HOURS_MAX: int = 24
+    # number of rows updated per transaction by the periodic background tasks
+    TODO_ITEMS_SWEEP_BATCH_SIZE: int = 1000
+    # the periodic background tasks fan out that many chunk tasks, which may be
+    # processed by different workers concurrently
+    TODO_ITEMS_SWEEP_CHUNKS_COUNT: int = 4
+    # a user is sent a single email about all of his todo items that became overdue,
+    # listing at most that many of them
+    TODO_ITEMS_OVERDUE_DIGEST_ITEMS_MAX: int = 20
+    # todo items are marked as overdue right at their deadlines by ETA tasks. Those
+    # are scheduled once a deadline is within the horizon: either on a todo item's
+    # change or by the periodic scan, which also marks the ones missed. The horizon
+    # must exceed the scan interval and stay under RabbitMQ's `consumer_timeout`
+    # (30 minutes by default), as ETA tasks are unacknowledged until they are due
+    TODO_ITEMS_OVERDUE_SCAN_INTERVAL_SECONDS: int = 15 * 60  # 15 minutes
+    TODO_ITEMS_OVERDUE_SCHEDULING_HORIZON_SECONDS: int = 20 * 60  # 20 minutes
+    # the periodic scan only processes todo items which got due since the previous
+    # one. The ones left behind, e.g. reopened past the deadline, are recovered by a
+    # full scan run that often
+    TODO_ITEMS_OVERDUE_RECOVERY_INTERVAL_SECONDS: int = 6 * 60 * 60  # 6 hours
+
+    # authenticated users are cached by each API process. Other processes may serve
+    # a stale user for up to the TTL after it is updated or deleted
+    USERS_CACHE_TTL_SECONDS: float = 60.0
+    USERS_CACHE_SIZE_MAX: int = 10_000
 
     EMAIL_FROM_EMAIL: str
     EMAIL_FROM_NAME: str
@@ -16,22 +51,76 @@ class Settings(BaseSettings):
 
     SECURITY_SECRET_KEY: str = secrets.token_urlsafe(32)
     SECURITY_ACCESS_TOKEN_EXPIRE_SECONDS: int = 60 * 60 * 24 * 7  # 7 days
+    # verified access tokens are cached by each API process, never past their expiry
+    SECURITY_ACCESS_TOKENS_CACHE_TTL_SECONDS: float = 60 * 60  # 1 hour
+    SECURITY_ACCESS_TOKENS_CACHE_SIZE_MAX: int = 10_000
+    # bcrypt's cost factor, passwords hashed with another one are rehashed on login
+    SECURITY_BCRYPT_ROUNDS: int = 12
+    # API processes hash and verify passwords in a dedicated thread pool. Requests
+    # are rejected with 503 once that many passwords are waiting for a thread
+    SECURITY_PASSWORD_HASHING_THREADS: int = 2
+    SECURITY_PASSWORD_HASHING_QUEUE_DEPTH_MAX: int = 32
 
     POSTGRES_HOST: str
     POSTGRES_DB: str
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
+    # streaming replicas the read-only API endpoints are served from, e.g.
+    # `["replica-1", "replica-2:5433"]`
+    POSTGRES_REPLICA_HOSTS: list[str] = []
+    # time after a write during which the same client keeps reading from the primary
+    POSTGRES_READ_YOUR_WRITES_SECONDS: float = 5.0
+    # connection pool of the API processes (async engine)
+    POSTGRES_API_POOL_SIZE: int = 20
+    POSTGRES_API_POOL_MAX_OVERFLOW: int = 10
+    POSTGRES_API_POOL_TIMEOUT_SECONDS: float = 10.0
+    POSTGRES_API_POOL_RECYCLE_SECONDS: int = 30 * 60  # 30 minutes
+    POSTGRES_API_POOL_PRE_PING: bool = False
+    # connection pool of each background tasks worker process (sync engine)
+    POSTGRES_WORKER_POOL_SIZE: int = 2
+    POSTGRES_WORKER_POOL_MAX_OVERFLOW: int = 2
+    POSTGRES_WORKER_POOL_TIMEOUT_SECONDS: float = 30.0
+    POSTGRES_WORKER_POOL_RECYCLE_SECONDS: int = 30 * 60  # 30 minutes
+    POSTGRES_WORKER_POOL_PRE_PING: bool = True
 
     RABBITMQ_HOST: str
     RABBITMQ_VIRTUAL_HOST: str
     RABBITMQ_USER: str
     RABBITMQ_PASSWORD: str
+    # tasks published by the API are written to the outbox table and published to
+    # the broker by the outbox relay process in batches of that size
+    OUTBOX_RELAY_BATCH_SIZE: int = 100
+    # time the relay waits before polling the outbox again once it has been drained
+    OUTBOX_RELAY_POLL_INTERVAL_SECONDS: float = 1.0
+
+    # background tasks are routed to the queues of their workload classes, so that
+    # each one is consumed by its own workers. Task names may be glob patterns,
+    # other tasks are routed to `default-queue`
+    BACKGROUND_TASKS_QUEUES_BY_TASK: dict[str, str] = {
+        "src.background_tasks.main.send_*": "emails-queue",
+        "src.background_tasks.main.todo_item*": "sweeps-queue",
+    }
+    # emails of these templates are user-facing: they are routed to their own queue
+    # and published with the highest priority
+    BACKGROUND_TASKS_PRIORITY_EMAIL_TEMPLATES: list[str] = ["user_registered"]
+    BACKGROUND_TASKS_PRIORITY_EMAILS_QUEUE: str = "emails-priority-queue"
+    # the queues, except for `default-queue`, support priorities up to that one
+    BACKGROUND_TASKS_PRIORITY_MAX: int = 9
+    # serializer of the background tasks messages: `json`, `orjson` or `msgpack`
+    BACKGROUND_TASKS_SERIALIZER: str = "json"
+    # messages bigger than that are compressed with zlib, `None` disables compression
+    BACKGROUND_TASKS_COMPRESSION_THRESHOLD_BYTES: int | None = None
 
     SMTP_DO_USE_TLS: bool
     SMTP_PORT: str
     SMTP_HOST: str
     SMTP_USER: str
     SMTP_PASSWORD: str
+    # persistent connections kept by each background tasks worker process
+    SMTP_POOL_SIZE: int = 1
+    # connections idle for longer are checked with `NOOP` before being reused
+    SMTP_POOL_HEALTH_CHECK_IDLE_SECONDS: float = 30.0
+    SMTP_TIMEOUT_SECONDS: float = 30.0
 
     class Config:
         case_sensitive = True
@@ -42,6 +131,12 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_HOST}/{self.POSTGRES_DB}"
         )
 
+    def get_postgres_async_uri(self, host: str | None = None) -> str:
+        return (
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+            f"@{host or self.POSTGRES_HOST}/{self.POSTGRES_DB}"
+        )
+
     def get_rabbitmq_uri(self) -> str:
         return (
             f"amqp://{self.RABBITMQ_USER}:{self.RABBITMQ_PASSWORD}"
@@ -0,0 +1,69 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+from src.core.metrics import metrics
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class TTLLRUCache(Generic[KeyT, ValueT]):
+    """
+    Thread-safe in-process cache. Entries expire after `ttl_seconds` and the least\
+    recently used ones are evicted once there are more than `max_size` of them.
+
+    A named cache counts its hits and misses in the metrics.
+    """
+
+    def __init__(
+        self, max_size: int, ttl_seconds: float, name: str | None = None
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+        self._lock = threading.Lock()
+        # values along with the monotonic time they expire at
+        self._entries: OrderedDict[KeyT, tuple[ValueT, float]] = OrderedDict()
+
+    def get(self, key: KeyT) -> ValueT | None:
+        value = self._get(key)
+        if self.name is not None:
+            metrics.increment(
+                f"cache.{self.name}.{'misses' if value is None else 'hits'}"
+            )
+        return value
+
+    def set(self, key: KeyT, value: ValueT, ttl_seconds: float | None = None) -> None:
+        """
+        Set the value. `ttl_seconds` overrides the cache-wide TTL, but only in case it\
+        is shorter.
+        """
+        if ttl_seconds is None or ttl_seconds > self.ttl_seconds:
+            ttl_seconds = self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: KeyT) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key: KeyT) -> ValueT | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
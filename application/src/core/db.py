@@ -1,13 +1,159 @@
-from sqlalchemy import create_engine
+import functools
+import hashlib
+import itertools
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm.session import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from src.config import application_config
+from src.core.metrics import metrics
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    Queue pool reporting the time spent waiting for a connection to be checked\
+    out, including the time to open a new one when the pool is not full yet.
+    """
+
+    def _do_get(self) -> Any:
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()  # type: ignore[misc]
+        finally:
+            metrics.observe(
+                f"db.pool.{self.logging_name}.checkout_wait",
+                time.perf_counter() - started_at,
+            )
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    pass
+
 
+def get_pool_status(engine_: Engine | AsyncEngine) -> dict[str, int]:
+    # an engine's pool is replaced on `dispose()`, hence the lookup on each call
+    pool: Any = engine_.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+    }
+
+
+# used by the background tasks workers
 engine = create_engine(
     application_config.get_postgres_uri(),
-    pool_pre_ping=True,
+    poolclass=InstrumentedQueuePool,
+    pool_logging_name="worker",
+    pool_size=application_config.POSTGRES_WORKER_POOL_SIZE,
+    max_overflow=application_config.POSTGRES_WORKER_POOL_MAX_OVERFLOW,
+    pool_timeout=application_config.POSTGRES_WORKER_POOL_TIMEOUT_SECONDS,
+    pool_recycle=application_config.POSTGRES_WORKER_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=application_config.POSTGRES_WORKER_POOL_PRE_PING,
+)
+
+
+def _create_api_async_engine(host: str | None, name: str) -> AsyncEngine:
+    return create_async_engine(
+        application_config.get_postgres_async_uri(host),
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_logging_name=name,
+        pool_size=application_config.POSTGRES_API_POOL_SIZE,
+        max_overflow=application_config.POSTGRES_API_POOL_MAX_OVERFLOW,
+        pool_timeout=application_config.POSTGRES_API_POOL_TIMEOUT_SECONDS,
+        pool_recycle=application_config.POSTGRES_API_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=application_config.POSTGRES_API_POOL_PRE_PING,
+    )
+
+
+# used by the API
+async_engine = _create_api_async_engine(None, "api")
+
+# used by the API's read-only endpoints, the primary serves them if there are no
+# replicas. Transactions are read-only so that a write is never attempted on them
+replica_async_engines = [
+    _create_api_async_engine(host, f"api-replica-{replica_number}")
+    for replica_number, host in enumerate(application_config.POSTGRES_REPLICA_HOSTS)
+]
+_read_only_primary_async_engine = async_engine.execution_options(
+    postgresql_readonly=True
 )
+_read_only_async_engines = itertools.cycle(
+    [
+        replica_async_engine.execution_options(postgresql_readonly=True)
+        for replica_async_engine in replica_async_engines
+    ]
+    or [_read_only_primary_async_engine]
+)
+
+metrics.register_gauge("db.pool.worker", functools.partial(get_pool_status, engine))
+metrics.register_gauge("db.pool.api", functools.partial(get_pool_status, async_engine))
+for replica_number, replica_async_engine in enumerate(replica_async_engines):
+    metrics.register_gauge(
+        f"db.pool.api-replica-{replica_number}",
+        functools.partial(get_pool_status, replica_async_engine),
+    )
 
 
 def get_session() -> Session:
     return Session(engine, autocommit=False, autoflush=False)
+
+
+def get_async_session() -> AsyncSession:
+    """
+    Get a session bound to the async engine. Used in the API path operations so
+    that waiting for the database does not occupy a threadpool's thread.
+
+    Attributes are not expired on commit as an expired attribute may not be lazy
+    loaded implicitly outside of an `await` expression.
+    """
+    return AsyncSession(
+        async_engine, autocommit=False, autoflush=False, expire_on_commit=False
+    )
+
+
+def get_async_read_only_session(do_use_primary: bool = False) -> AsyncSession:
+    """
+    Get a read-only session bound to one of the replicas in turn. Used in the API\
+    path operations which do not write.
+
+    `do_use_primary` is for reads that must see the latest writes, replicas lag behind\
+    the primary.
+    """
+    return AsyncSession(
+        (
+            _read_only_primary_async_engine
+            if do_use_primary
+            else next(_read_only_async_engines)
+        ),
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+@contextmanager
+def try_advisory_lock(name: str) -> Iterator[bool]:
+    """
+    Try to take the Postgres session-level advisory lock of `name` with no waiting.\
+    Yield whether it has been taken.
+
+    The lock is held by a dedicated connection until exit. It is released by the\
+    server in case the process holding it dies.
+    """
+    key = int.from_bytes(hashlib.sha256(name.encode()).digest()[:8], "big", signed=True)
+    # no transaction is kept open while the lock is being held
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        is_locked = bool(connection.scalar(select(func.pg_try_advisory_lock(key))))
+        try:
+            yield is_locked
+        finally:
+            if is_locked:
+                connection.execute(select(func.pg_advisory_unlock(key)))
@@ -1,34 +1,187 @@
-from typing import Any
+import queue
+import smtplib
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Iterable
+
+import jinja2
 
 import emails
-from emails.template import JinjaTemplate
 from src.config import application_config
+from src.core.metrics import metrics
 
 # mypy: ignore-errors
 
 
+class EmailTemplatesRegistry:
+    """
+    Process-wide registry of compiled email templates. Body templates are loaded \
+    from the templates directory and compiled once, the same for subject templates \
+    given as strings.
+    """
+
+    def __init__(self, templates_dir: str) -> None:
+        self._environment = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(templates_dir),
+            # templates are not changed while the application is running
+            auto_reload=False,
+            cache_size=-1,
+        )
+
+    def get_template(self, template_filename: str) -> jinja2.Template:
+        return self._environment.get_template(template_filename)
+
+    @lru_cache(maxsize=None)
+    def get_string_template(self, template: str) -> jinja2.Template:
+        return self._environment.from_string(template)
+
+    def precompile(self) -> None:
+        """
+        Compile all the body templates in advance, e.g. at a worker's startup.
+        """
+        for template_filename in self._environment.list_templates():
+            self.get_template(template_filename)
+
+
+email_templates_registry = EmailTemplatesRegistry(
+    application_config.EMAIL_TEMPLATES_DIR
+)
+
+
 def compose_email(
     subject_template: str, body_template_filename: str, render_kwargs: dict[str, Any]
 ) -> tuple[str, str]:
-    subject = _render_from_template(subject_template, **render_kwargs)
-    body_html = _render_from_file(body_template_filename, **render_kwargs)
+    started_at = time.perf_counter()
+    subject = email_templates_registry.get_string_template(subject_template).render(
+        **render_kwargs
+    )
+    body_html = email_templates_registry.get_template(body_template_filename).render(
+        **render_kwargs
+    )
+    metrics.observe(
+        f"email.render.{body_template_filename}", time.perf_counter() - started_at
+    )
 
     return (subject, body_html)
 
 
+class SMTPConnectionPool:
+    """
+    Pool of persistent SMTP connections, one per worker process. Reusing a \
+    connection saves the TCP, TLS and AUTH handshakes for every email.
+
+    A connection idle for longer than `health_check_idle_seconds` is checked with \
+    `NOOP` before use and reopened in case the server has dropped it.
+    """
+
+    def __init__(self, size: int, health_check_idle_seconds: float) -> None:
+        self.health_check_idle_seconds = health_check_idle_seconds
+        # idle connections along with the monotonic time they were released at
+        self._idle: queue.LifoQueue[tuple[smtplib.SMTP, float]] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def send(self, messages: Iterable[emails.Message]) -> None:
+        """
+        Send messages over a single connection. Reconnect if the server has \
+        disconnected meanwhile.
+        """
+        with self._slots:
+            connection = self._checkout()
+            try:
+                for message in messages:
+                    try:
+                        _send_message(connection, message)
+                    except smtplib.SMTPServerDisconnected:
+                        metrics.increment("email.smtp.reconnects")
+                        self._close(connection)
+                        connection = self._connect()
+                        _send_message(connection, message)
+            except Exception as error:
+                # the server has replied with an error, hence the connection is fine
+                if isinstance(error, smtplib.SMTPException) and not isinstance(
+                    error, smtplib.SMTPServerDisconnected
+                ):
+                    self._release(connection)
+                else:
+                    self._close(connection)
+                raise
+            self._release(connection)
+
+    def close(self) -> None:
+        while True:
+            try:
+                connection, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                connection.quit()
+            except OSError:
+                self._close(connection)
+
+    def _checkout(self) -> smtplib.SMTP:
+        try:
+            connection, released_at = self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+        if time.monotonic() - released_at < self.health_check_idle_seconds:
+            return connection
+        try:
+            if connection.noop()[0] == 250:
+                return connection
+        except OSError:
+            pass
+        self._close(connection)
+        return self._connect()
+
+    def _connect(self) -> smtplib.SMTP:
+        metrics.increment("email.smtp.connects")
+        connection = smtplib.SMTP(
+            application_config.SMTP_HOST,
+            int(application_config.SMTP_PORT),
+            timeout=application_config.SMTP_TIMEOUT_SECONDS,
+        )
+        if application_config.SMTP_DO_USE_TLS:
+            connection.starttls()
+        if application_config.SMTP_USER:
+            connection.login(
+                application_config.SMTP_USER, application_config.SMTP_PASSWORD
+            )
+        return connection
+
+    def _release(self, connection: smtplib.SMTP) -> None:
+        self._idle.put((connection, time.monotonic()))
+
+    def _close(self, connection: smtplib.SMTP) -> None:
+        try:
+            connection.close()
+        except OSError:
+            pass
+
+
+smtp_connection_pool = SMTPConnectionPool(
+    size=application_config.SMTP_POOL_SIZE,
+    health_check_idle_seconds=application_config.SMTP_POOL_HEALTH_CHECK_IDLE_SECONDS,
+)
+
+
 def send_email(email_to: str, subject: str, body_html: str) -> None:
-    smtp_options = {
-        "host": application_config.SMTP_HOST,
-        "port": application_config.SMTP_PORT,
-    }
-    if application_config.SMTP_DO_USE_TLS:
-        smtp_options["tls"] = True
-    if application_config.SMTP_USER:
-        smtp_options["user"] = application_config.SMTP_USER
-    if application_config.SMTP_PASSWORD:
-        smtp_options["password"] = application_config.SMTP_PASSWORD
-
-    emails.Message(
+    smtp_connection_pool.send([make_message(email_to, subject, body_html)])
+
+
+def send_emails(emails_to_send: Iterable[tuple[str, str, str]]) -> None:
+    """
+    Send emails, given as `(email_to, subject, body_html)`, over a single connection.
+    """
+    smtp_connection_pool.send(
+        make_message(email_to, subject, body_html)
+        for email_to, subject, body_html in emails_to_send
+    )
+
+
+def make_message(email_to: str, subject: str, body_html: str) -> emails.Message:
+    return emails.Message(
         mail_to=email_to,
         subject=subject,
         html=body_html,
@@ -36,16 +189,12 @@ def send_email(email_to: str, subject: str, body_html: str) -> None:
             application_config.EMAIL_FROM_NAME,
             application_config.EMAIL_FROM_EMAIL,
         ),
-    ).send(smtp=smtp_options)
-
-
-def _render_from_template(template: str, **kwargs: Any) -> str:
-    return JinjaTemplate(template).render(**kwargs)
+    )
 
 
-def _render_from_file(template_filename: str, **kwargs: Any) -> str:
-    with open(
-        application_config.EMAIL_TEMPLATES_DIR + template_filename
-    ) as template_file:
-        template_str = template_file.read()
-    return _render_from_template(template_str, **kwargs)
+def _send_message(connection: smtplib.SMTP, message: emails.Message) -> None:
+    connection.sendmail(
+        application_config.EMAIL_FROM_EMAIL,
+        [email for _, email in message.mail_to],
+        message.as_string(),
+    )
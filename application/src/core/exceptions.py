@@ -16,6 +16,18 @@ class AccessTokenMalformedException(BaseApplicationException):
     """
 
 
+class PaginationCursorMalformedException(BaseApplicationException):
+    """
+    Raised when a pagination cursor is malformed.
+    """
+
+
+class PasswordHashingOverloadedException(BaseApplicationException):
+    """
+    Raised when too many passwords are being hashed or verified at the moment.
+    """
+
+
 def add_application_exception_handler(
     application: FastAPI,
     exceptions_to_http_status_codes: dict[Type[BaseApplicationException], int],
@@ -0,0 +1,59 @@
+import threading
+from typing import Any, Callable
+
+
+class MetricsRegistry:
+    """
+    In-process registry of counters, timers and gauges. Each API process and\
+    each background tasks worker process keeps its own one.
+
+    Gauges are callbacks evaluated at the time a snapshot is taken.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self._timers: dict[str, dict[str, float]] = {}
+        self._gauges: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            timer = self._timers.setdefault(
+                name, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            timer["count"] += 1
+            timer["total_seconds"] += seconds
+            timer["max_seconds"] = max(timer["max_seconds"], seconds)
+
+    def register_gauge(self, name: str, callback: Callable[[], dict[str, Any]]) -> None:
+        with self._lock:
+            self._gauges[name] = callback
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            timers = {name: dict(timer) for name, timer in self._timers.items()}
+            gauges = dict(self._gauges)
+
+        for timer in timers.values():
+            timer["average_seconds"] = (
+                timer["total_seconds"] / timer["count"] if timer["count"] else 0.0
+            )
+
+        return {
+            "counters": counters,
+            "timers": timers,
+            "gauges": {name: callback() for name, callback in gauges.items()},
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._timers.clear()
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,24 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+
+from src.core.exceptions import PaginationCursorMalformedException
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Encode the primary key of the last model on a page into an opaque cursor \
+    pointing to the next page.
+    """
+    return urlsafe_b64encode(str(last_id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decode a cursor made by `encode_cursor()` back into the primary key of the last \
+    model on the previous page.
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        return int(urlsafe_b64decode(cursor + padding).decode())
+    except (BinasciiError, UnicodeDecodeError, ValueError):
+        raise PaginationCursorMalformedException("Pagination cursor is malformed")
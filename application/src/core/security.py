@@ -1,5 +1,10 @@
+import asyncio
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
-from typing import Self
+from typing import Callable, Self, TypeVar
 
 import bcrypt
 from jose import jwt
@@ -7,17 +12,49 @@ from jose.exceptions import JWTError
 from pydantic import BaseModel, ValidationError
 
 from src.config import application_config
-from src.core.exceptions import AccessTokenMalformedException
+from src.core.cache import TTLLRUCache
+from src.core.exceptions import (
+    AccessTokenMalformedException,
+    PasswordHashingOverloadedException,
+)
+from src.core.metrics import metrics
 
 ALGORITHM = "HS256"
 
+ResultT = TypeVar("ResultT")
+
 
 class AccessTokenPayload(BaseModel):
     sub: str
     exp: datetime
 
+    class Config:
+        # instances are shared through the cache of the verified access tokens
+        frozen = True
+
     @classmethod
     def decode_from_access_token(cls, token: str) -> Self:
+        """
+        Decode an access token verifying its signature and expiration time.
+
+        Clients reuse a token for many requests, hence verified tokens' payloads are \
+        cached by the token's digest until the token expires.
+        """
+        token_digest = hashlib.sha256(token.encode()).digest()
+        token_payload_cached = access_tokens_cache.get(token_digest)
+        if isinstance(token_payload_cached, cls):
+            return token_payload_cached
+
+        token_payload = cls.decode_from_access_token_uncached(token)
+        access_tokens_cache.set(
+            token_digest,
+            token_payload,
+            ttl_seconds=token_payload.exp.timestamp() - time.time(),
+        )
+        return token_payload
+
+    @classmethod
+    def decode_from_access_token_uncached(cls, token: str) -> Self:
         try:
             payload = jwt.decode(
                 token, application_config.SECURITY_SECRET_KEY, algorithms=[ALGORITHM]
@@ -32,6 +69,13 @@ class AccessTokenPayload(BaseModel):
         )
 
 
+access_tokens_cache: TTLLRUCache[bytes, AccessTokenPayload] = TTLLRUCache(
+    max_size=application_config.SECURITY_ACCESS_TOKENS_CACHE_SIZE_MAX,
+    ttl_seconds=application_config.SECURITY_ACCESS_TOKENS_CACHE_TTL_SECONDS,
+    name="access_tokens",
+)
+
+
 def generate_access_token(subject: int | str) -> str:
     expire = datetime.now(UTC) + timedelta(
         seconds=application_config.SECURITY_ACCESS_TOKEN_EXPIRE_SECONDS
@@ -40,9 +84,71 @@ def generate_access_token(subject: int | str) -> str:
     return token_payload.encode_to_access_token()
 
 
+class PasswordHashingExecutor:
+    """
+    Thread pool running the CPU-bound password hashing and verification apart from \
+    the threadpool serving the path operations. bcrypt releases the GIL, so \
+    `threads` hash in parallel.
+
+    At most `queue_depth_max` calls wait for a thread, the ones beyond that are \
+    rejected right away instead of piling up during a login storm.
+    """
+
+    def __init__(self, threads: int, queue_depth_max: int) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="password-hashing"
+        )
+        self._slots = threading.BoundedSemaphore(threads + queue_depth_max)
+
+    async def run(self, function: Callable[..., ResultT], *args: object) -> ResultT:
+        if not self._slots.acquire(blocking=False):
+            metrics.increment("security.password_hashing.rejected")
+            raise PasswordHashingOverloadedException(
+                "Too many requests, try again later"
+            )
+        try:
+            future = self._executor.submit(function, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # the slot is freed once the thread is, not once the awaiting request is
+        # cancelled while the hashing is still running
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+
+password_hashing_executor = PasswordHashingExecutor(
+    threads=application_config.SECURITY_PASSWORD_HASHING_THREADS,
+    queue_depth_max=application_config.SECURITY_PASSWORD_HASHING_QUEUE_DEPTH_MAX,
+)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hashing_executor.run(
+        verify_password, plain_password, hashed_password
+    )
+
+
 def get_password_hash(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    return bcrypt.hashpw(
+        password.encode(),
+        bcrypt.gensalt(rounds=application_config.SECURITY_BCRYPT_ROUNDS),
+    ).decode()
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hashing_executor.run(get_password_hash, password)
+
+
+def is_password_hash_outdated(hashed_password: str) -> bool:
+    """
+    Check whether a password was hashed with another cost factor than the \
+    configured one. A bcrypt hash looks like `$2b$<rounds>$<salt and hash>`.
+    """
+    return (
+        int(hashed_password.split("$")[2]) != application_config.SECURITY_BCRYPT_ROUNDS
+    )
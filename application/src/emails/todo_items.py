@@ -1,8 +1,8 @@
 from src.core.email import compose_email
-from src.models import TodoItem
+from src.services.todo_item_service import TodoItemMarkedAsOverdue
 
 
-def compose_overdue_email(todo_item: TodoItem) -> tuple[str, str]:
+def compose_overdue_email(todo_item: TodoItemMarkedAsOverdue) -> tuple[str, str]:
     return compose_email(
         '"{{ todo_item.subject }}" has passed the deadline',
         "todo_item_overdue.html",
@@ -10,3 +10,23 @@ def compose_overdue_email(todo_item: TodoItem) -> tuple[str, str]:
             "todo_item": todo_item,
         },
     )
+
+
+def compose_overdue_digest_email(
+    user_username: str,
+    todo_items: list[TodoItemMarkedAsOverdue],
+    todo_items_count: int,
+) -> tuple[str, str]:
+    """
+    Compose a single email about many of a user's `TodoItems` marked as overdue. \
+    Only `todo_items` are listed, while `todo_items_count` is the total.
+    """
+    return compose_email(
+        "{{ todo_items_count }} of your todo items have passed the deadline",
+        "todo_item_overdue_digest.html",
+        {
+            "user_username": user_username,
+            "todo_items": todo_items,
+            "todo_items_count": todo_items_count,
+        },
+    )
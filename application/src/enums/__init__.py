@@ -1,2 +1,4 @@
+from .email_template_enum import EmailTemplateEnum  # noqa: F401
+from .file_format_enum import FileFormatEnum  # noqa: F401
 from .todo_item_status_enum import TodoItemStatusEnum  # noqa: F401
 from .todo_item_visibility_enum import TodoItemVisibilityEnum  # noqa: F401
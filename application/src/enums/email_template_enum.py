@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class EmailTemplateEnum(Enum):
+    USER_REGISTERED = "user_registered"
+    TODO_ITEM_OVERDUE = "todo_item_overdue"
+    TODO_ITEMS_OVERDUE_DIGEST = "todo_items_overdue_digest"
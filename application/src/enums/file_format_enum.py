@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class FileFormatEnum(Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
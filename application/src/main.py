@@ -1,17 +1,35 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.api.api_router import api_router
 from src.api.errors import exceptions_to_http_status_codes
+from src.core.db import async_engine, replica_async_engines
 from src.core.exceptions import add_application_exception_handler
+from src.core.metrics import metrics
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
+    yield
+    # async connections are bound to the event loop they were opened in
+    await async_engine.dispose()
+    for replica_async_engine in replica_async_engines:
+        await replica_async_engine.dispose()
 
-application = FastAPI()
+
+application = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 application.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "localhost:3000"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # carries the next page's URL of paginated lists
+    expose_headers=["Link"],
 )
 application.include_router(api_router)
 
@@ -21,3 +39,8 @@ add_application_exception_handler(application, exceptions_to_http_status_codes)
 @application.get("/ping", tags=["Healthcheck"])
 def ping() -> dict[str, str]:
     return {"message": "pong"}
+
+
+@application.get("/metrics", tags=["Monitoring"])
+def read_metrics() -> dict[str, Any]:
+    return metrics.snapshot()
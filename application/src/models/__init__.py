@@ -1,3 +1,5 @@
 from .base import BaseDBModel  # noqa: F401
+from .outbox_message import OutboxMessage  # noqa: F401
+from .sweep_watermark import SweepWatermark  # noqa: F401
 from .todo_item import TodoItem  # noqa: F401
 from .user import User  # noqa: F401
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, Column, DateTime, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from .base import BaseDBModel
+
+
+class OutboxMessage(BaseDBModel):
+    """
+    A background task to be published to the broker. Written in the same \
+    transaction as the change it follows from, published by the outbox relay.
+    """
+
+    __tablename__: str = "outbox_messages"
+
+    id: int | None = Column(BigInteger, primary_key=True)
+
+    task_name: str = Column(String, nullable=False)
+    task_args: list[Any] = Column(JSONB, nullable=False, server_default="[]")
+    task_kwargs: dict[str, Any] = Column(JSONB, nullable=False, server_default="{}")
+    task_eta: datetime | None = Column(DateTime, nullable=True)
+
+    # timestamps are being set automatically
+    create_time: datetime | None = Column(
+        DateTime, nullable=False, server_default=func.now()
+    )
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.sql import func
+
+from .base import BaseDBModel
+
+
+class SweepWatermark(BaseDBModel):
+    """
+    The position a periodic sweep has processed rows up to, ordered by \
+    `(last_time, last_id)`, so that the next run starts right after it.
+    """
+
+    __tablename__: str = "sweep_watermarks"
+
+    name: str = Column(String, primary_key=True)
+
+    last_time: datetime = Column(DateTime, nullable=False)
+    last_id: int = Column(Integer, nullable=False, server_default="0")
+
+    # timestamps are being set automatically
+    update_time: datetime | None = Column(
+        DateTime, nullable=True, default=None, onupdate=func.now()
+    )
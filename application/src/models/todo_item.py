@@ -22,7 +22,6 @@ class TodoItem(BaseDBModel):
     user_id: int = Column(
         Integer,
         ForeignKey("users.id", ondelete="CASCADE", onupdate="CASCADE"),
-        index=True,
         nullable=False,
     )
     user: "User" = relationship("User", back_populates="todo_items")
@@ -60,12 +59,23 @@ class TodoItem(BaseDBModel):
     )
 
 
+# used in `TodoItemService.list_by_user()` for the keyset pagination. The first one
+# also serves the `user_id` foreign key
+Index("ix_todo_items_user_id_id", TodoItem.user_id, TodoItem.id)
+Index(
+    "ix_todo_items_user_id_visibility_id",
+    TodoItem.user_id,
+    TodoItem.visibility,
+    TodoItem.id,
+)
+
 # BEGIN: highly specific partial indices for services' certain methods
 #
 # They shouldn't contain too many rows and produce a redundant overhead.
 # While they should greatly speed up the queries.
 
-# used in `TodoItemService.get_all_open_overdue()`
+# used in `TodoItemService.mark_all_open_overdue_as_overdue()` and
+# `TodoItemService.mark_open_overdue_after_watermark_as_overdue()`
 Index(
     "ix_todo_items_deadline_when_opened",
     TodoItem.deadline,
@@ -75,7 +85,7 @@ Index(
     ),
 )
 
-# the two are both used in `TodoItemService.get_all_visible_not_open_dangling()`
+# the two are both used in `TodoItemService.archive_all_visible_not_open_dangling()`
 Index(
     "ix_todo_items_deadline_when_visible_overdue",
     TodoItem.deadline,
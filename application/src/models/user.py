@@ -13,6 +13,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class User(BaseDBModel):
     __tablename__: str = "users"
+    # fetch the server generated `id` and `create_time` with `INSERT ... RETURNING`
+    __mapper_args__ = {"eager_defaults": True}
 
     id: int | None = Column(Integer, primary_key=True)
 
@@ -39,3 +39,7 @@ class TodoItemResponse(BaseAPIModel):
 
     class Config:
         orm_mode = True
+
+
+class TodoItemsImportResponse(BaseAPIModel):
+    created_count: int = Field(example=1000)
@@ -1,2 +1,3 @@
+from .outbox_service import outbox_service  # noqa: F401
 from .todo_item_service import todo_item_service  # noqa: F401
 from .user_service import user_service  # noqa: F401
@@ -1,15 +1,23 @@
-from typing import Any, Generic, Type, TypeVar
+from typing import Any, Callable, ClassVar, Generic, Iterable, Type, TypeVar
 
+from sqlalchemy import inspect, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
 
-from src.models import BaseDBModel
+from src.models import BaseDBModel, OutboxMessage
 
-from .exceptions import NotFoundException
+from .exceptions import NotFoundException, UniqueConstraintViolationException
 
 DBModelType = TypeVar("DBModelType", bound=BaseDBModel)
 
 
 class BaseService(Generic[DBModelType]):
+    # unique constraints violated on create or update are translated into
+    # `UniqueConstraintViolationException` with these messages by constraint names
+    unique_constraints_violation_messages: ClassVar[dict[str, str]] = {}
+
     def __init__(self, db_model_type: Type[DBModelType]):
         """
         Base class for services. Contains basic low-level DB operations.
@@ -17,6 +25,10 @@ class BaseService(Generic[DBModelType]):
         All methods here were intentionally made private in order to explicitly
         declare APIs in derived classes. The main intention was to make a more
         robust and less error-prone design.
+
+        Every operation has an `_async` counterpart that works with an
+        `AsyncSession`. Those are used in the API, while the synchronous ones are
+        used in background tasks.
         """
         self.db_model_type = db_model_type
 
@@ -26,43 +38,197 @@ class BaseService(Generic[DBModelType]):
         """
         return db.query(self.db_model_type).get(id)
 
+    async def _get_async(self, db: AsyncSession, id: int) -> DBModelType | None:
+        """
+        Get a model from the database by the primary key.
+        """
+        return await db.get(self.db_model_type, id)
+
     def _get_or_exception(self, db: Session, id: int) -> DBModelType:
         """
         Get a model from the database by the primary key. Raise exception if not found.
         """
-        db_model = self._get(db, id)
-        if db_model is None:
-            raise NotFoundException(f"`{self.db_model_type.__name__}` not found.")
-        return db_model
+        return self._ensure_found(self._get(db, id))
+
+    async def _get_or_exception_async(self, db: AsyncSession, id: int) -> DBModelType:
+        """
+        Get a model from the database by the primary key. Raise exception if not found.
+        """
+        return self._ensure_found(await self._get_async(db, id))
 
-    def _create(self, db: Session, data_to_create: dict[str, Any]) -> DBModelType:
+    def _make_columns_query(self, column_names: Iterable[str]) -> Select:
+        """
+        Make a query of only the named columns. It yields plain rows, in the order of\
+        the names, which are neither tracked by the session nor instrumented. Used for\
+        the reads that only serialize the models.
+        """
+        return select(
+            *(getattr(self.db_model_type, column_name) for column_name in column_names)
+        )
+
+    def _create(
+        self,
+        db: Session,
+        data_to_create: dict[str, Any],
+        make_outbox_messages: (
+            Callable[[DBModelType], list[OutboxMessage]] | None
+        ) = None,
+    ) -> DBModelType:
         """
         Create a new model instance and persist it to the database.
+
+        Messages made by `make_outbox_messages` from the new model instance are \
+        committed in the same transaction.
         """
         db_model = self.db_model_type(**data_to_create)
         db.add(db_model)
-        db.commit()
+        if make_outbox_messages is not None:
+            # the model's id is assigned on flush
+            self._commit(db, do_flush_only=True)
+            db.add_all(make_outbox_messages(db_model))
+        self._commit(db)
         db.refresh(db_model)
         return db_model
 
+    async def _create_async(
+        self,
+        db: AsyncSession,
+        data_to_create: dict[str, Any],
+        make_outbox_messages: (
+            Callable[[DBModelType], list[OutboxMessage]] | None
+        ) = None,
+    ) -> DBModelType:
+        """
+        Create a new model instance and persist it to the database.
+
+        Messages made by `make_outbox_messages` from the new model instance are \
+        committed in the same transaction.
+        """
+        db_model = self.db_model_type(**data_to_create)
+        db.add(db_model)
+        if make_outbox_messages is not None:
+            # the model's id is assigned on flush
+            await self._commit_async(db, do_flush_only=True)
+            db.add_all(make_outbox_messages(db_model))
+        await self._commit_async(db)
+        if not self._are_server_defaults_fetched_eagerly():
+            await db.refresh(db_model)
+        return db_model
+
     def _update(
         self,
         db: Session,
         db_model: DBModelType,
         data_to_update: dict[str, Any],
+        make_outbox_messages: (
+            Callable[[DBModelType], list[OutboxMessage]] | None
+        ) = None,
     ) -> None:
         """
         Update a model and persist changes to the database.
+
+        Messages made by `make_outbox_messages` from the updated model are \
+        committed in the same transaction.
         """
         for field in data_to_update:
             setattr(db_model, field, data_to_update[field])
         db.add(db_model)
-        db.commit()
+        if make_outbox_messages is not None:
+            db.add_all(make_outbox_messages(db_model))
+        self._commit(db)
         db.refresh(db_model)
 
+    async def _update_async(
+        self,
+        db: AsyncSession,
+        db_model: DBModelType,
+        data_to_update: dict[str, Any],
+        make_outbox_messages: (
+            Callable[[DBModelType], list[OutboxMessage]] | None
+        ) = None,
+    ) -> None:
+        """
+        Update a model and persist changes to the database.
+
+        Messages made by `make_outbox_messages` from the updated model are \
+        committed in the same transaction.
+        """
+        for field in data_to_update:
+            setattr(db_model, field, data_to_update[field])
+        db.add(db_model)
+        if make_outbox_messages is not None:
+            db.add_all(make_outbox_messages(db_model))
+        await self._commit_async(db)
+        await db.refresh(db_model)
+
     def _delete(self, db: Session, db_model: DBModelType) -> None:
         """
         Delete a model from the database.
         """
         db.delete(db_model)
         db.commit()
+
+    async def _delete_async(self, db: AsyncSession, db_model: DBModelType) -> None:
+        """
+        Delete a model from the database.
+        """
+        await db.delete(db_model)
+        await db.commit()
+
+    def _commit(self, db: Session, do_flush_only: bool = False) -> None:
+        """
+        Commit (or only flush) the session. Translate the known unique constraints\
+        violations.
+        """
+        try:
+            if do_flush_only:
+                db.flush()
+            else:
+                db.commit()
+        except IntegrityError as error:
+            db.rollback()
+            self._raise_if_unique_constraint_violated(error)
+            raise
+
+    async def _commit_async(
+        self, db: AsyncSession, do_flush_only: bool = False
+    ) -> None:
+        """
+        Commit (or only flush) the session. Translate the known unique constraints\
+        violations.
+        """
+        try:
+            if do_flush_only:
+                await db.flush()
+            else:
+                await db.commit()
+        except IntegrityError as error:
+            await db.rollback()
+            self._raise_if_unique_constraint_violated(error)
+            raise
+
+    def _raise_if_unique_constraint_violated(self, error: IntegrityError) -> None:
+        # psycopg2 exposes the constraint name via the diagnostics, asyncpg via the
+        # original exception wrapped by the SQLAlchemy's adapter
+        diagnostics = getattr(error.orig, "diag", None)
+        constraint_name = (
+            diagnostics.constraint_name
+            if diagnostics is not None
+            else getattr(error.orig.__cause__, "constraint_name", None)
+        )
+        if constraint_name in self.unique_constraints_violation_messages:
+            raise UniqueConstraintViolationException(
+                self.unique_constraints_violation_messages[constraint_name]
+            ) from error
+
+    def _are_server_defaults_fetched_eagerly(self) -> bool:
+        """
+        Check whether server generated values are fetched by the INSERT statement \
+        itself (`RETURNING`), making a refresh after it redundant.
+        """
+        return bool(inspect(self.db_model_type).eager_defaults)
+
+    def _ensure_found(self, db_model: DBModelType | None) -> DBModelType:
+        if db_model is None:
+            raise NotFoundException(f"`{self.db_model_type.__name__}` not found.")
+        return db_model
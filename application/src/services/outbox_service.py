@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from src.models import OutboxMessage
+
+from .base_service import BaseService
+
+
+class OutboxService(BaseService[OutboxMessage]):
+    def make_message(
+        self,
+        task_name: str,
+        task_args: Iterable[Any] = (),
+        task_kwargs: dict[str, Any] | None = None,
+        *,
+        task_eta: datetime | None = None,
+    ) -> OutboxMessage:
+        """
+        Make a message to be added to a session along with the change it follows \
+        from. Arguments must be JSON serializable. The task is not executed before \
+        `task_eta`.
+        """
+        return OutboxMessage(
+            task_name=task_name,
+            task_args=list(task_args),
+            task_kwargs=task_kwargs or {},
+            task_eta=task_eta,
+        )
+
+    def relay_pending(
+        self,
+        db: Session,
+        publish: Callable[[list[OutboxMessage]], None],
+        *,
+        batch_size: int,
+    ) -> int:
+        """
+        Pass pending messages to `publish` by batches of `batch_size` in the order \
+        they were written. Return the number of messages relayed.
+
+        Every batch is deleted in its own transaction once `publish` has returned. \
+        A batch failing to be published stays in the outbox, so a message is \
+        published at least once. Rows locked by a concurrent relay are skipped.
+        """
+        relayed_count = 0
+        while True:
+            outbox_messages = list(
+                db.execute(
+                    select(OutboxMessage)
+                    .order_by(OutboxMessage.id)
+                    .limit(batch_size)
+                    .with_for_update(skip_locked=True)
+                ).scalars()
+            )
+            if outbox_messages:
+                publish(outbox_messages)
+                db.execute(
+                    delete(OutboxMessage)
+                    .where(
+                        OutboxMessage.id.in_(
+                            [outbox_message.id for outbox_message in outbox_messages]
+                        )
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            db.commit()
+            relayed_count += len(outbox_messages)
+            if len(outbox_messages) < batch_size:
+                return relayed_count
+
+
+outbox_service = OutboxService(OutboxMessage)
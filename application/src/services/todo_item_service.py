@@ -1,11 +1,34 @@
 from datetime import datetime, timedelta
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Sequence,
+)
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session, selectinload
-from sqlalchemy.sql import func
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    String,
+    bindparam,
+    cast,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Insert, Select, Update, func
+from sqlalchemy.sql.selectable import ScalarSelect
 
 from src.enums import TodoItemStatusEnum, TodoItemVisibilityEnum
-from src.models import TodoItem, User
+from src.models import OutboxMessage, SweepWatermark, TodoItem, User
 from src.schemas.todo_item import TodoItemCreate, TodoItemUpdate
 
 from .base_service import BaseService
@@ -15,6 +38,21 @@ from .exceptions import (
     ValidationException,
 )
 
+OutboxMessagesFactory = Callable[[TodoItem], list[OutboxMessage]]
+
+
+class TodoItemMarkedAsOverdue(NamedTuple):
+    """
+    A `TodoItem` marked as overdue in bulk along with its owner's details.
+    """
+
+    id: int
+    subject: str
+    deadline: datetime
+    user_id: int
+    user_username: str
+    user_email: str
+
 
 class TodoItemService(BaseService[TodoItem]):
     def get_for_user_or_exception(
@@ -28,129 +66,630 @@ class TodoItemService(BaseService[TodoItem]):
         self._check_is_owner(todo_item, user_owner)
         return todo_item
 
+    async def get_for_user_or_exception_async(
+        self, db: AsyncSession, id: int, user_owner: User
+    ) -> TodoItem:
+        """
+        Get a `TodoItem` by `id`. Raise exception if not found. Check if the \
+        `user_owner` is an owner of the `TodoItem`.
+        """
+        todo_item = await self._get_or_exception_async(db, id)
+        self._check_is_owner(todo_item, user_owner)
+        return todo_item
+
     def list_by_user(
         self,
         db: Session,
-        user: User,
+        user_id: int,
         *,
         visibility: TodoItemVisibilityEnum | None = None,
+        after_id: int | None = None,
         offset: int = 0,
         limit: int = 100,
     ) -> list[TodoItem]:
-        query = db.query(TodoItem).filter(TodoItem.user_id == user.id)
-        if visibility is not None:
-            query = query.filter(TodoItem.visibility == visibility)
-        return query.offset(offset).limit(limit).all()
+        """
+        List a user's `TodoItems` ordered by `id`.
 
-    def get_all_open_overdue(self, db: Session) -> list[TodoItem]:
-        return (
-            db.query(TodoItem)
-            .filter(TodoItem.status == TodoItemStatusEnum.OPEN)
-            .filter(TodoItem.deadline != None)  # noqa: E711
-            .filter(TodoItem.deadline < func.now())
-            .options(selectinload(TodoItem.user))
-            .all()
+        Pass the `id` of the last `TodoItem` of the previous page as `after_id` to \
+        get the next page. Unlike the `offset` it costs the same for any page.
+        """
+        query = self._make_list_by_user_query(
+            user_id,
+            visibility=visibility,
+            after_id=after_id,
+            offset=offset,
+            limit=limit,
         )
+        return list(db.execute(query).scalars().all())
 
-    def get_all_visible_not_open_dangling(
-        self, db: Session, *, hours_in_status: int
+    async def list_by_user_async(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        *,
+        visibility: TodoItemVisibilityEnum | None = None,
+        after_id: int | None = None,
+        offset: int = 0,
+        limit: int = 100,
     ) -> list[TodoItem]:
-        datetime_in_status_before = datetime.now() - timedelta(hours=hours_in_status)
-        return (
-            db.query(TodoItem)
-            .filter(TodoItem.visibility == TodoItemVisibilityEnum.VISIBLE)
-            .filter(
-                or_(
-                    and_(
-                        TodoItem.status == TodoItemStatusEnum.RESOLVED,
-                        TodoItem.resolve_time != None,  # noqa: E711
-                        TodoItem.resolve_time < datetime_in_status_before,
-                    ),
-                    and_(
-                        TodoItem.status == TodoItemStatusEnum.OVERDUE,
-                        TodoItem.deadline != None,  # noqa: E711
-                        TodoItem.deadline < datetime_in_status_before,
-                    ),
+        """
+        List a user's `TodoItems` ordered by `id`. See `list_by_user()`.
+        """
+        query = self._make_list_by_user_query(
+            user_id,
+            visibility=visibility,
+            after_id=after_id,
+            offset=offset,
+            limit=limit,
+        )
+        return list((await db.execute(query)).scalars().all())
+
+    async def list_rows_by_user_async(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        *,
+        column_names: Sequence[str],
+        visibility: TodoItemVisibilityEnum | None = None,
+        after_id: int | None = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> list[Row]:
+        """
+        List the named columns of a user's `TodoItems` as plain rows, see \
+        `list_by_user()`. Costs much less per row than `TodoItem` instances, for the \
+        lists which are only serialized.
+        """
+        query = self._make_list_by_user_query(
+            user_id,
+            column_names=column_names,
+            visibility=visibility,
+            after_id=after_id,
+            offset=offset,
+            limit=limit,
+        )
+        return list((await db.execute(query)).all())
+
+    async def stream_rows_by_user_async(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        *,
+        column_names: Sequence[str],
+        visibility: TodoItemVisibilityEnum | None = None,
+        batch_size: int,
+    ) -> AsyncIterator[list[Row]]:
+        """
+        Stream the named columns of all of a user's `TodoItems` ordered by `id`, in \
+        batches of `batch_size` rows fetched from a server-side cursor. Memory stays \
+        the same for any number of them.
+        """
+        query = self._make_list_by_user_query(
+            user_id,
+            column_names=column_names,
+            visibility=visibility,
+            after_id=None,
+            offset=0,
+            limit=None,
+        )
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        async for rows in result.partitions():  # type: ignore[attr-defined]
+            yield list(rows)
+
+    def make_overdue_watermark_name(
+        self, partition_number: int, partitions_count: int
+    ) -> str:
+        return f"todo_items_overdue.{partition_number}-of-{partitions_count}"
+
+    def mark_open_overdue_after_watermark_as_overdue(
+        self,
+        db: Session,
+        *,
+        batch_size: int,
+        partition_number: int = 0,
+        partitions_count: int = 1,
+    ) -> Iterator[list[TodoItemMarkedAsOverdue]]:
+        """
+        Mark open `TodoItems` which have passed the deadline since the previous run \
+        as overdue, so that the cost is proportional to the number of them.
+
+        Only `TodoItems` after the persisted watermark are processed, ordered by \
+        `(deadline, id)`. Every batch of `batch_size` is committed in its own \
+        transaction along with the watermark advanced past it. Yield `TodoItems` of \
+        each batch after it has been committed. The ones left behind the watermark, \
+        e.g. reopened past the deadline, are marked by \
+        `mark_all_open_overdue_as_overdue()`.
+
+        `TodoItems` are partitioned by their owners into `partitions_count` \
+        partitions, each with its own watermark, so that the partitions can be \
+        processed concurrently. Only the one of `partition_number` is processed.
+        """
+        watermark_name = self.make_overdue_watermark_name(
+            partition_number, partitions_count
+        )
+        db.execute(
+            insert(SweepWatermark)
+            .values(name=watermark_name, last_time=datetime.min)
+            .on_conflict_do_nothing()
+        )
+        db.commit()
+        while True:
+            watermark = db.execute(
+                select(SweepWatermark)
+                .where(SweepWatermark.name == watermark_name)
+                .with_for_update()
+            ).scalar_one()
+            todo_item_ids_to_mark = (
+                self._make_open_overdue_ids_query(partition_number, partitions_count)
+                .where(
+                    tuple_(TodoItem.deadline, TodoItem.id)  # type: ignore[type-var]
+                    > tuple_(watermark.last_time, watermark.last_id)
+                )
+                .order_by(TodoItem.deadline, TodoItem.id)
+                .limit(batch_size)
+                .with_for_update()
+                .scalar_subquery()
+            )
+            todo_items_marked = [
+                TodoItemMarkedAsOverdue(*row)
+                for row in db.execute(
+                    self._make_mark_as_overdue_statement(todo_item_ids_to_mark)
+                )
+            ]
+            is_drained = len(todo_items_marked) < batch_size
+            if is_drained:
+                # everything due up to the transaction's start has been processed
+                watermark_values: dict[str, Any] = {
+                    "last_time": func.now(),
+                    "last_id": 0,
+                }
+            else:
+                last_todo_item_marked = max(
+                    todo_items_marked,
+                    key=lambda todo_item: (todo_item.deadline, todo_item.id),
+                )
+                watermark_values = {
+                    "last_time": last_todo_item_marked.deadline,
+                    "last_id": last_todo_item_marked.id,
+                }
+            db.execute(
+                update(SweepWatermark)
+                .where(SweepWatermark.name == watermark_name)
+                .values(**watermark_values)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            if todo_items_marked:
+                yield todo_items_marked
+            if is_drained:
+                return
+
+    def mark_all_open_overdue_as_overdue(
+        self,
+        db: Session,
+        *,
+        batch_size: int,
+        partition_number: int = 0,
+        partitions_count: int = 1,
+    ) -> Iterator[list[TodoItemMarkedAsOverdue]]:
+        """
+        Mark all open `TodoItems` which have passed the deadline as overdue. The \
+        recovery path for the ones left behind the watermark of \
+        `mark_open_overdue_after_watermark_as_overdue()`.
+
+        `TodoItems` are updated in bulk by batches of `batch_size`, every batch is \
+        committed in its own transaction. Yield `TodoItems` of each batch after it \
+        has been committed.
+
+        `TodoItems` are partitioned by their owners into `partitions_count` \
+        partitions. Only the one of `partition_number` is processed.
+        """
+        while True:
+            # ordering by the deadline lets the batch be read from the partial index
+            # `ix_todo_items_deadline_when_opened` with no sorting; rows locked by a
+            # concurrent transaction are left for the next run
+            todo_item_ids_to_mark = (
+                self._make_open_overdue_ids_query(partition_number, partitions_count)
+                .order_by(TodoItem.deadline)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            todo_items_marked = [
+                TodoItemMarkedAsOverdue(*row)
+                for row in db.execute(
+                    self._make_mark_as_overdue_statement(todo_item_ids_to_mark)
                 )
+            ]
+            db.commit()
+            if todo_items_marked:
+                yield todo_items_marked
+            if len(todo_items_marked) < batch_size:
+                return
+
+    def mark_open_overdue_as_overdue(
+        self, db: Session, id: int
+    ) -> TodoItemMarkedAsOverdue | None:
+        """
+        Mark a `TodoItem` as overdue in case it is open and has passed the deadline. \
+        Return it if it has been marked.
+        """
+        todo_item_ids_to_mark = (
+            self._make_open_overdue_ids_query()
+            .where(TodoItem.id == id)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        row = db.execute(
+            self._make_mark_as_overdue_statement(todo_item_ids_to_mark)
+        ).first()
+        db.commit()
+        return TodoItemMarkedAsOverdue(*row) if row is not None else None
+
+    def list_open_with_deadline_between(
+        self, db: Session, deadline_from: datetime, deadline_before: datetime
+    ) -> list[tuple[int, datetime]]:
+        """
+        List `(id, deadline)` of the open `TodoItems` with a deadline from \
+        `deadline_from` and before `deadline_before` ordered by the deadline.
+        """
+        query = (
+            select(TodoItem.id, TodoItem.deadline)
+            .where(TodoItem.status == TodoItemStatusEnum.OPEN)
+            .where(TodoItem.deadline >= deadline_from)
+            .where(TodoItem.deadline < deadline_before)
+            .order_by(TodoItem.deadline)
+        )
+        return [(row.id, row.deadline) for row in db.execute(query)]
+
+    def list_overdue_by_ids(
+        self, db: Session, ids: list[int]
+    ) -> list[TodoItemMarkedAsOverdue]:
+        """
+        List the `TodoItems` of `ids` which are still overdue along with their \
+        owners' details.
+        """
+        query = (
+            select(
+                TodoItem.id,
+                TodoItem.subject,
+                TodoItem.deadline,
+                TodoItem.user_id,
+                User.username,
+                User.email,
             )
-            .all()
+            .join(User, TodoItem.user_id == User.id)
+            .where(TodoItem.id.in_(ids))
+            .where(TodoItem.status == TodoItemStatusEnum.OVERDUE)
+            .order_by(TodoItem.deadline)
         )
+        return [TodoItemMarkedAsOverdue(*row) for row in db.execute(query)]
+
+    def archive_all_visible_not_open_dangling(
+        self, db: Session, *, hours_in_status: int, batch_size: int
+    ) -> int:
+        """
+        Move to archive all visible `TodoItems` that have been resolved or overdue \
+        for more than `hours_in_status` hours. Return the number of `TodoItems` \
+        moved to archive.
+
+        `TodoItems` are updated in bulk by batches of `batch_size`, every batch is \
+        committed in its own transaction.
+        """
+        datetime_in_status_before = datetime.now() - timedelta(hours=hours_in_status)
+        archived_count = 0
+        # statuses are processed one by one as each of them has its own index
+        for status, time_in_status_column in [
+            (TodoItemStatusEnum.RESOLVED, TodoItem.resolve_time),
+            (TodoItemStatusEnum.OVERDUE, TodoItem.deadline),
+        ]:
+            statement = self._make_archive_statement(
+                status, time_in_status_column, datetime_in_status_before, batch_size
+            )
+            while True:
+                result = db.execute(statement)
+                db.commit()
+                batch_archived_count: int = result.rowcount  # type: ignore
+                archived_count += batch_archived_count
+                if batch_archived_count < batch_size:
+                    break
+        return archived_count
 
     def create_for_user(
-        self, db: Session, create_api_model: TodoItemCreate, user: User
+        self,
+        db: Session,
+        create_api_model: TodoItemCreate,
+        user: User,
+        make_outbox_messages: OutboxMessagesFactory | None = None,
     ) -> TodoItem:
         """
         Create a new `TodoItem` with a given `user` as owner.
         """
-        data_to_create_prepared = dict(
-            **create_api_model.dict(),
-            user_id=user.id,
+        return self._create(
+            db, self._prepare_create(create_api_model, user), make_outbox_messages
+        )
+
+    async def create_for_user_async(
+        self,
+        db: AsyncSession,
+        create_api_model: TodoItemCreate,
+        user: User,
+        make_outbox_messages: OutboxMessagesFactory | None = None,
+    ) -> TodoItem:
+        """
+        Create a new `TodoItem` with a given `user` as owner.
+        """
+        return await self._create_async(
+            db, self._prepare_create(create_api_model, user), make_outbox_messages
         )
-        return self._create(db, data_to_create_prepared)
+
+    async def create_many_for_user_async(
+        self,
+        db: AsyncSession,
+        create_api_models_batches: Iterable[list[TodoItemCreate]],
+        user_id: int,
+        make_outbox_messages: OutboxMessagesFactory | None = None,
+    ) -> int:
+        """
+        Create `TodoItems` in bulk with a given user as owner, a single multi-row \
+        INSERT per batch. All of them are committed in a single transaction once the \
+        batches are exhausted: nothing is created in case iterating them raises. \
+        Return the number of `TodoItems` created.
+
+        `make_outbox_messages` is passed the `TodoItems` with a deadline only, with \
+        just the `id`, `user_id`, `deadline` and `status` set.
+        """
+        created_count = 0
+        for create_api_models in create_api_models_batches:
+            result = await db.execute(
+                self._make_create_many_statement(),
+                self._prepare_create_many(create_api_models, user_id),
+            )
+            created_rows = result.all()
+            if make_outbox_messages is not None:
+                self._add_create_many_outbox_messages(
+                    db, created_rows, user_id, make_outbox_messages
+                )
+            created_count += len(created_rows)
+        await self._commit_async(db)
+        return created_count
 
     def update(
         self,
         db: Session,
         db_model: TodoItem,
         update_api_model: TodoItemUpdate,
+        make_outbox_messages: OutboxMessagesFactory | None = None,
+    ) -> None:
+        self._update(
+            db,
+            db_model,
+            self._prepare_update(db_model, update_api_model),
+            make_outbox_messages,
+        )
+
+    async def update_async(
+        self,
+        db: AsyncSession,
+        db_model: TodoItem,
+        update_api_model: TodoItemUpdate,
+        make_outbox_messages: OutboxMessagesFactory | None = None,
+    ) -> None:
+        await self._update_async(
+            db,
+            db_model,
+            self._prepare_update(db_model, update_api_model),
+            make_outbox_messages,
+        )
+
+    def resolve(self, db: Session, db_model: TodoItem) -> None:
+        self._update(db, db_model, self._prepare_resolve(db_model))
+
+    async def resolve_async(self, db: AsyncSession, db_model: TodoItem) -> None:
+        await self._update_async(db, db_model, self._prepare_resolve(db_model))
+
+    def reopen(
+        self,
+        db: Session,
+        db_model: TodoItem,
+        make_outbox_messages: OutboxMessagesFactory | None = None,
+    ) -> None:
+        self._update(db, db_model, self._prepare_reopen(db_model), make_outbox_messages)
+
+    async def reopen_async(
+        self,
+        db: AsyncSession,
+        db_model: TodoItem,
+        make_outbox_messages: OutboxMessagesFactory | None = None,
+    ) -> None:
+        await self._update_async(
+            db, db_model, self._prepare_reopen(db_model), make_outbox_messages
+        )
+
+    def delete(self, db: Session, db_model: TodoItem) -> None:
+        self._delete(db, db_model)
+
+    async def delete_async(self, db: AsyncSession, db_model: TodoItem) -> None:
+        await self._delete_async(db, db_model)
+
+    def _make_list_by_user_query(
+        self,
+        user_id: int,
+        *,
+        column_names: Sequence[str] | None = None,
+        visibility: TodoItemVisibilityEnum | None,
+        after_id: int | None,
+        offset: int,
+        limit: int | None,
+    ) -> Select:
+        query = (
+            select(TodoItem)
+            if column_names is None
+            else self._make_columns_query(column_names)
+        ).where(TodoItem.user_id == user_id)
+        if visibility is not None:
+            query = query.where(TodoItem.visibility == visibility)
+        if after_id is not None:
+            query = query.where(TodoItem.id > after_id)
+        return query.order_by(TodoItem.id).offset(offset).limit(limit)
+
+    def _make_open_overdue_ids_query(
+        self, partition_number: int = 0, partitions_count: int = 1
+    ) -> Select:
+        # conditions match the partial index `ix_todo_items_deadline_when_opened`
+        query = (
+            select(TodoItem.id)
+            .where(TodoItem.status == TodoItemStatusEnum.OPEN)
+            .where(TodoItem.deadline != None)  # noqa: E711
+            .where(TodoItem.deadline < func.now())
+        )
+        if partitions_count > 1:
+            # all of a user's todo items are in the same partition, so that he gets
+            # a single email about them
+            query = query.where(TodoItem.user_id % partitions_count == partition_number)
+        return query
+
+    def _make_mark_as_overdue_statement(
+        self, todo_item_ids_to_mark: ScalarSelect
+    ) -> Update:
+        return (
+            update(TodoItem)
+            .where(TodoItem.id.in_(todo_item_ids_to_mark))
+            .where(TodoItem.user_id == User.id)
+            .values(status=TodoItemStatusEnum.OVERDUE)
+            .returning(
+                TodoItem.id,
+                TodoItem.subject,
+                TodoItem.deadline,
+                TodoItem.user_id,
+                User.username,
+                User.email,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def _make_archive_statement(
+        self,
+        status: TodoItemStatusEnum,
+        time_in_status_column: Column[DateTime],
+        datetime_in_status_before: datetime,
+        batch_size: int,
+    ) -> Update:
+        # conditions match the partial indices on `time_in_status_column` so that a
+        # batch is read from the index only
+        todo_item_ids_to_archive = (
+            select(TodoItem.id)
+            .where(TodoItem.visibility == TodoItemVisibilityEnum.VISIBLE)
+            .where(TodoItem.status == status)
+            .where(time_in_status_column != None)  # noqa: E711
+            .where(time_in_status_column < datetime_in_status_before)
+            .order_by(time_in_status_column)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        return (
+            update(TodoItem)
+            .where(TodoItem.id.in_(todo_item_ids_to_archive))
+            .values(visibility=TodoItemVisibilityEnum.ARCHIVED)
+            .execution_options(synchronize_session=False)
+        )
+
+    def _prepare_create(
+        self, create_api_model: TodoItemCreate, user: User
+    ) -> dict[str, Any]:
+        return dict(
+            **create_api_model.dict(),
+            user_id=user.id,
+        )
+
+    def _prepare_create_many(
+        self, create_api_models: list[TodoItemCreate], user_id: int
+    ) -> dict[str, Any]:
+        return {
+            "user_id": user_id,
+            "subjects": [
+                create_api_model.subject for create_api_model in create_api_models
+            ],
+            "deadlines": [
+                create_api_model.deadline for create_api_model in create_api_models
+            ],
+        }
+
+    def _make_create_many_statement(self) -> Insert:
+        # the rows are passed as a single array per column, so that the statement is
+        # the same for any number of them and its parameters are not capped
+        rows = (
+            func.unnest(
+                cast(bindparam("subjects"), ARRAY(String)),
+                cast(bindparam("deadlines"), ARRAY(DateTime)),
+            )
+            .table_valued("subject", "deadline")
+            .render_derived()
+        )
+        statement: Insert = (
+            insert(TodoItem)
+            .from_select(
+                ["user_id", "subject", "deadline"],
+                select(
+                    cast(bindparam("user_id"), Integer), rows.c.subject, rows.c.deadline
+                ),
+            )
+            .returning(TodoItem.id, TodoItem.deadline)
+        )
+        return statement
+
+    def _add_create_many_outbox_messages(
+        self,
+        db: Session | AsyncSession,
+        created_rows: list[Row],
+        user_id: int,
+        make_outbox_messages: OutboxMessagesFactory,
     ) -> None:
+        for created_row in created_rows:
+            if created_row.deadline is None:
+                continue
+            # not added to the session, only passed to the factory
+            todo_item = TodoItem(
+                id=created_row.id,
+                user_id=user_id,
+                deadline=created_row.deadline,
+                status=TodoItemStatusEnum.OPEN,
+            )
+            db.add_all(make_outbox_messages(todo_item))
+
+    def _prepare_update(
+        self, db_model: TodoItem, update_api_model: TodoItemUpdate
+    ) -> dict[str, Any]:
         if db_model.status == TodoItemStatusEnum.OPEN:
             if (
                 update_api_model.deadline is not None
                 and update_api_model.deadline < datetime.now()
             ):
                 raise ValidationException("deadline can not be set in the past")
-        data_to_update_prepared = update_api_model.dict()
-        self._update(db, db_model, data_to_update_prepared)
+        return update_api_model.dict()
 
-    def resolve(self, db: Session, db_model: TodoItem) -> None:
+    def _prepare_resolve(self, db_model: TodoItem) -> dict[str, Any]:
         if db_model.status != TodoItemStatusEnum.OPEN:
             raise StateConflictException(
                 f"Can resolve TodoItems only in status"
                 f" '{TodoItemStatusEnum.OPEN.value}'"
             )
-        data_to_update_prepared = {
+        return {
             "status": TodoItemStatusEnum.RESOLVED,
             "resolve_time": datetime.now(),
         }
-        self._update(db, db_model, data_to_update_prepared)
 
-    def reopen(self, db: Session, db_model: TodoItem) -> None:
+    def _prepare_reopen(self, db_model: TodoItem) -> dict[str, Any]:
         if db_model.status != TodoItemStatusEnum.RESOLVED:
             raise StateConflictException(
                 f"Can reopen TodoItems only in status"
                 f" '{TodoItemStatusEnum.RESOLVED.value}'"
             )
-        data_to_update_prepared = {
+        return {
             "status": TodoItemStatusEnum.OPEN,
             "resolve_time": None,
         }
-        self._update(db, db_model, data_to_update_prepared)
-
-    def mark_as_overdue(self, db: Session, db_model: TodoItem) -> None:
-        if db_model.status != TodoItemStatusEnum.OPEN:
-            raise StateConflictException(
-                f"Can mark TodoItems as overdue only in status"
-                f" '{TodoItemStatusEnum.OPEN.value}'"
-            )
-        data_to_update_prepared = {
-            "status": TodoItemStatusEnum.OVERDUE,
-        }
-        self._update(db, db_model, data_to_update_prepared)
-
-    def move_to_archive(self, db: Session, db_model: TodoItem) -> None:
-        if db_model.visibility != TodoItemVisibilityEnum.VISIBLE:
-            raise StateConflictException(
-                f"Can move TodoItems to archive only with visibility"
-                f" '{TodoItemVisibilityEnum.VISIBLE.value}'"
-            )
-        data_to_update_prepared = {
-            "visibility": TodoItemVisibilityEnum.ARCHIVED,
-        }
-        self._update(db, db_model, data_to_update_prepared)
-
-    def delete(self, db: Session, db_model: TodoItem) -> None:
-        self._delete(db, db_model)
 
     def _check_is_owner(self, db_model: TodoItem, user: User) -> None:
         if db_model.user_id != user.id:
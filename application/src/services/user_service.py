@@ -1,15 +1,39 @@
-from sqlalchemy.orm import Session
-from sqlalchemy.sql import exists
+from typing import Any, Callable
 
-from src.core.security import get_password_hash, verify_password
-from src.models import User
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from src.config import application_config
+from src.core.cache import TTLLRUCache
+from src.core.exceptions import PasswordHashingOverloadedException
+from src.core.security import (
+    get_password_hash,
+    get_password_hash_async,
+    is_password_hash_outdated,
+    verify_password,
+    verify_password_async,
+)
+from src.models import OutboxMessage, User
 from src.schemas.user import UserCreate, UserUpdate
 
 from .base_service import BaseService
-from .exceptions import UniqueConstraintViolationException
+
+# detached copies of the users by id, see `UserService.get_cached_or_exception_async()`
+users_cache: TTLLRUCache[int, User] = TTLLRUCache(
+    max_size=application_config.USERS_CACHE_SIZE_MAX,
+    ttl_seconds=application_config.USERS_CACHE_TTL_SECONDS,
+    name="users",
+)
 
 
 class UserService(BaseService[User]):
+    # PostgreSQL's default names of the unique constraints
+    unique_constraints_violation_messages = {
+        "users_email_key": "Email already in use",
+        "users_username_key": "Username already in use",
+    }
+
     def get(self, db: Session, id: int) -> User | None:
         return self._get(db, id)
 
@@ -19,29 +43,114 @@ class UserService(BaseService[User]):
         """
         return self._get_or_exception(db, id)
 
+    async def get_or_exception_async(self, db: AsyncSession, id: int) -> User:
+        """
+        Get a User by id. Raise exception if not found.
+        """
+        return await self._get_or_exception_async(db, id)
+
+    async def get_cached_or_exception_async(self, db: AsyncSession, id: int) -> User:
+        """
+        Get a User by id from the cache, query it only on a cache miss. Raise \
+        exception if not found.
+
+        The cached User is merged into the session without a query. The cache is \
+        invalidated by `update()` and `delete()`.
+        """
+        user_cached = users_cache.get(id)
+        if user_cached is not None:
+            return await db.merge(user_cached, load=False)
+
+        user = await self._get_or_exception_async(db, id)
+        users_cache.set(id, self._make_detached_copy(user))
+        return user
+
     def get_by_credentials_verified(
         self, db: Session, *, username: str, password: str
     ) -> User | None:
         """
         Get a user by his login credentials with password verification.
+
+        The password is rehashed if it was hashed with an outdated cost factor.
         """
         user: User | None = db.query(User).filter(User.username == username).first()
         if not user:
             return None
         if not verify_password(password, user.hashed_password):
             return None
+        if is_password_hash_outdated(user.hashed_password):
+            user.hashed_password = get_password_hash(password)
+            db.commit()
+            users_cache.delete(user.id)  # type: ignore
         return user
 
-    def create(self, db: Session, create_api_model: UserCreate) -> User:
-        self._validate_email_unique(db, create_api_model.email)
-        self._validate_username_unique(db, create_api_model.username)
-        data_to_create_prepared = dict(
-            **create_api_model.dict(exclude={"password"}),
-            hashed_password=get_password_hash(
-                create_api_model.password.get_secret_value()
-            ),
+    async def get_by_credentials_verified_async(
+        self, db: AsyncSession, *, username: str, password: str
+    ) -> User | None:
+        """
+        Get a user by his login credentials with password verification. See \
+        `get_by_credentials_verified()`.
+
+        The CPU-bound password verification is run by the password hashing executor \
+        in order not to block the event loop.
+        """
+        user: User | None = (
+            (await db.execute(select(User).where(User.username == username)))
+            .scalars()
+            .first()
+        )
+        if not user:
+            return None
+        if not await verify_password_async(password, user.hashed_password):
+            return None
+        if is_password_hash_outdated(user.hashed_password):
+            try:
+                user.hashed_password = await get_password_hash_async(password)
+            except PasswordHashingOverloadedException:
+                # rehashing can wait until the next login
+                return user
+            await db.commit()
+            users_cache.delete(user.id)  # type: ignore
+        return user
+
+    def create(
+        self,
+        db: Session,
+        create_api_model: UserCreate,
+        make_outbox_messages: Callable[[User], list[OutboxMessage]] | None = None,
+    ) -> User:
+        """
+        Create a User. Raise exception if the email or the username is in use.
+        """
+        hashed_password = get_password_hash(
+            create_api_model.password.get_secret_value()
+        )
+        return self._create(
+            db,
+            self._prepare_create(create_api_model, hashed_password),
+            make_outbox_messages,
+        )
+
+    async def create_async(
+        self,
+        db: AsyncSession,
+        create_api_model: UserCreate,
+        make_outbox_messages: Callable[[User], list[OutboxMessage]] | None = None,
+    ) -> User:
+        """
+        Create a User. Raise exception if the email or the username is in use.
+
+        The uniqueness is ensured by the database's constraints, hence the User is \
+        created with a single `INSERT ... RETURNING` statement.
+        """
+        hashed_password = await get_password_hash_async(
+            create_api_model.password.get_secret_value()
+        )
+        return await self._create_async(
+            db,
+            self._prepare_create(create_api_model, hashed_password),
+            make_outbox_messages,
         )
-        return self._create(db, data_to_create_prepared)
 
     def update(
         self,
@@ -49,21 +158,57 @@ class UserService(BaseService[User]):
         db_model: User,
         update_api_model: UserUpdate,
     ) -> None:
-        if update_api_model.username != db_model.username:
-            self._validate_username_unique(db, update_api_model.username)
+        """
+        Update a User. Raise exception if the username is in use.
+        """
         data_to_update_prepared = update_api_model.dict()
         self._update(db, db_model, data_to_update_prepared)
+        users_cache.delete(db_model.id)  # type: ignore
+
+    async def update_async(
+        self,
+        db: AsyncSession,
+        db_model: User,
+        update_api_model: UserUpdate,
+    ) -> None:
+        """
+        Update a User. Raise exception if the username is in use.
+        """
+        data_to_update_prepared = update_api_model.dict()
+        await self._update_async(db, db_model, data_to_update_prepared)
+        users_cache.delete(db_model.id)  # type: ignore
 
     def delete(self, db: Session, db_model: User) -> None:
+        user_id = db_model.id
         self._delete(db, db_model)
+        users_cache.delete(user_id)  # type: ignore
 
-    def _validate_email_unique(self, db: Session, email: str) -> None:
-        if db.query(exists().where(User.email == email)).scalar():
-            raise UniqueConstraintViolationException("Email already in use")
+    async def delete_async(self, db: AsyncSession, db_model: User) -> None:
+        user_id = db_model.id
+        await self._delete_async(db, db_model)
+        users_cache.delete(user_id)  # type: ignore
 
-    def _validate_username_unique(self, db: Session, username: str) -> None:
-        if db.query(exists().where(User.username == username)).scalar():
-            raise UniqueConstraintViolationException("Username already in use")
+    def _prepare_create(
+        self, create_api_model: UserCreate, hashed_password: str
+    ) -> dict[str, Any]:
+        return dict(
+            **create_api_model.dict(exclude={"password"}),
+            hashed_password=hashed_password,
+        )
+
+    def _make_detached_copy(self, db_model: User) -> User:
+        """
+        Copy a User's column attributes to a new detached instance, which unlike \
+        the original is not bound to any session's lifetime.
+        """
+        db_model_copy = User(
+            **{
+                column_attribute.key: getattr(db_model, column_attribute.key)
+                for column_attribute in inspect(User).column_attrs
+            }
+        )
+        make_transient_to_detached(db_model_copy)
+        return db_model_copy
 
 
 user_service = UserService(User)
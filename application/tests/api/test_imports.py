@@ -0,0 +1,79 @@
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+from fastapi import HTTPException
+from fastapi.exceptions import RequestValidationError
+
+from src.api.imports import parse_body_batches
+from src.enums import FileFormatEnum
+from src.schemas.todo_item import TodoItemCreate
+
+
+async def _split_into_chunks(body: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    for chunk_start in range(0, len(body), chunk_size):
+        chunk_end = chunk_start + chunk_size
+        yield body[chunk_start:chunk_end]
+
+
+def _parse(
+    body: bytes,
+    import_format: FileFormatEnum,
+    *,
+    chunk_size: int = 3,
+    size_bytes_max: int = 1000,
+) -> list[list[TodoItemCreate]]:
+    async def collect_batches() -> list[list[TodoItemCreate]]:
+        return [
+            batch
+            async for batch in parse_body_batches(
+                _split_into_chunks(body, chunk_size),
+                TodoItemCreate,
+                import_format,
+                batch_size=2,
+                size_bytes_max=size_bytes_max,
+                errors_max=10,
+            )
+        ]
+
+    return asyncio.run(collect_batches())
+
+
+def test_parse_body_batches_csv_split_into_chunks() -> None:
+    body = 'subject,deadline\r\n"first\r\nline, ""second""",\r\nthird,\r\nfourth,'
+
+    batches = _parse(body.encode(), FileFormatEnum.CSV)
+
+    assert [[row.subject for row in batch] for batch in batches] == [
+        ['first\r\nline, "second"', "third"],
+        ["fourth"],
+    ]
+
+
+def test_parse_body_batches_csv_ragged_rows() -> None:
+    body = "subject,deadline\nfirst,\nsecond\nthird,,extra"
+
+    with pytest.raises(RequestValidationError) as error:
+        _parse(body.encode(), FileFormatEnum.CSV)
+
+    assert [row_error["loc"] for row_error in error.value.errors()] == [
+        ("body", 3),
+        ("body", 4),
+    ]
+
+
+def test_parse_body_batches_ndjson_multibyte_characters() -> None:
+    body = '{"subject": "перше"}\n{"subject": "друге"}'
+
+    batches = _parse(body.encode(), FileFormatEnum.NDJSON, chunk_size=1)
+
+    assert [row.subject for row in batches[0]] == ["перше", "друге"]
+
+
+def test_parse_body_batches_too_large() -> None:
+    body = '{"subject": "first"}\n' * 10
+
+    with pytest.raises(HTTPException) as error:
+        _parse(body.encode(), FileFormatEnum.NDJSON, size_bytes_max=100)
+
+    assert error.value.status_code == 413
@@ -2,6 +2,9 @@ import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from src.core import security
+from src.core.metrics import metrics
+
 TEST_USER_LOGIN_DATA = {
     "username": "johnny.test.login",
     "password": "johnnies@password123",
@@ -39,6 +42,23 @@ def test_get_access_token_wrong_credentials(
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
+def test_get_access_token_password_hashing_overloaded(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    password_hashing_executor = security.PasswordHashingExecutor(
+        threads=1, queue_depth_max=0
+    )
+    # occupy the only thread
+    password_hashing_executor._slots.acquire()
+    monkeypatch.setattr(
+        security, "password_hashing_executor", password_hashing_executor
+    )
+
+    response = client.post("/login/access-token", data=TEST_USER_LOGIN_DATA)
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+
 def test_authorization_flow(client: TestClient) -> None:
     # get access token
     access_token_response = client.post(
@@ -64,6 +84,23 @@ def test_authorization_flow(client: TestClient) -> None:
     assert who_am_i_payload["username"] == TEST_USER_LOGIN_DATA["username"]
 
 
+def test_authorization_flow_user_cached(client: TestClient) -> None:
+    access_token_response = client.post(
+        "/login/access-token", data=TEST_USER_LOGIN_DATA
+    )
+    authorization_headers = {
+        "Authorization": f"Bearer {access_token_response.json()['access_token']}"
+    }
+    client.get("/login/who-am-i", headers=authorization_headers)
+    cache_hits_before = metrics.snapshot()["counters"].get("cache.users.hits", 0)
+
+    who_am_i_response = client.get("/login/who-am-i", headers=authorization_headers)
+
+    assert who_am_i_response.status_code == status.HTTP_200_OK
+    assert who_am_i_response.json()["username"] == TEST_USER_LOGIN_DATA["username"]
+    assert metrics.snapshot()["counters"]["cache.users.hits"] == cache_hits_before + 1
+
+
 def test_authorization_header_not_passed(client: TestClient) -> None:
     who_am_i_response = client.get("/login/who-am-i")
 
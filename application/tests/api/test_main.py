@@ -7,3 +7,17 @@ def test_healthcheck(client: TestClient) -> None:
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {"message": "pong"}
+
+
+def test_metrics(client: TestClient) -> None:
+    response = client.get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK
+    response_json = response.json()
+    assert response_json["gauges"]["db.pool.api"].keys() == {
+        "size",
+        "checked_out",
+        "idle",
+        "overflow",
+    }
+    assert "db.pool.worker" in response_json["gauges"]
@@ -0,0 +1,69 @@
+import json
+from datetime import datetime
+
+import pytest
+from pydantic import Field
+
+from src.api.responses import (
+    get_field_names,
+    is_encoding_accepted,
+    make_db_model_response,
+    make_rows_response,
+)
+from src.enums import TodoItemStatusEnum, TodoItemVisibilityEnum
+from src.models import TodoItem
+from src.schemas.base import BaseAPIModel
+from src.schemas.todo_item import TodoItemResponse
+
+
+def _make_todo_item(id: int) -> TodoItem:
+    return TodoItem(
+        id=id,
+        user_id=1,
+        subject=f"todo item {id}",
+        deadline=datetime(2023, 6, 1, 18, 0, 0, 123456),
+        status=TodoItemStatusEnum.RESOLVED,
+        visibility=TodoItemVisibilityEnum.ARCHIVED,
+        resolve_time=None,
+    )
+
+
+def test_make_db_model_response_single_field() -> None:
+    class TodoItemIdResponse(BaseAPIModel):
+        id: int = Field(example=1)
+
+    response = make_db_model_response(_make_todo_item(1), TodoItemIdResponse)
+
+    assert json.loads(response.body) == {"id": 1}
+
+
+def test_make_rows_response_matches_response_model() -> None:
+    todo_item = _make_todo_item(1)
+    row = tuple(
+        getattr(todo_item, field_name)
+        for field_name in get_field_names(TodoItemResponse)
+    )
+
+    response = make_rows_response([row], TodoItemResponse)
+
+    assert json.loads(response.body) == [
+        json.loads(TodoItemResponse.from_orm(todo_item).json())
+    ]
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, is_accepted",
+    [
+        ("", False),
+        ("gzip", True),
+        ("deflate, GZIP;q=0.5", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.0, deflate", False),
+        ("*", True),
+        ("*;q=0", False),
+        ("gzip;q=0, *", False),
+        ("gzip;q=invalid", False),
+    ],
+)
+def test_is_encoding_accepted(accept_encoding: str, is_accepted: bool) -> None:
+    assert is_encoding_accepted(accept_encoding, "gzip") == is_accepted
@@ -4,10 +4,12 @@ import pytest
 from faker import Faker
 from fastapi import status
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.core.security import verify_password
-from src.models import User
+from src.enums import EmailTemplateEnum
+from src.models import OutboxMessage, User
 from tests import factories, schemas
 from tests.common import get_db_model
 
@@ -33,6 +35,15 @@ def test_create_user_successful(
     assert user_created.full_name == fake_user.full_name
     assert verify_password(fake_user_password, user_created.hashed_password)
 
+    # assert the registration email task was written to the outbox
+    outbox_message = db.execute(
+        select(OutboxMessage).where(
+            OutboxMessage.task_kwargs == {"user_id": user_created.id}
+        )
+    ).scalar_one()
+    assert outbox_message.task_name.endswith("send_templated_email")
+    assert outbox_message.task_args == [EmailTemplateEnum.USER_REGISTERED.value]
+
     # assert response content
     response_payload = response.json()
     assert response_payload == schemas.user.make_user_response_dict(user_created)
@@ -0,0 +1,55 @@
+from faker import Faker
+from sqlalchemy.orm import Session
+
+from src.background_tasks import tasks
+from src.enums import EmailTemplateEnum, TodoItemStatusEnum
+from src.models import User
+from tests import factories
+from tests.common import get_db_model_or_exception
+
+
+def test_compose_user_registered(db: Session) -> None:
+    user = get_db_model_or_exception(db, User, username="johnny.multitasker")
+
+    email_composed = tasks.emails.compose(
+        EmailTemplateEnum.USER_REGISTERED, user_id=user.id
+    )
+
+    assert email_composed is not None
+    email_to, subject, body_html = email_composed
+    assert email_to == user.email
+    assert "johnny.multitasker" in subject
+
+
+def test_compose_user_registered_deleted() -> None:
+    assert tasks.emails.compose(EmailTemplateEnum.USER_REGISTERED, user_id=-1) is None
+
+
+def test_compose_todo_items_overdue_digest(db: Session, session_faker: Faker) -> None:
+    todo_items = [
+        factories.make_todo_item_persisted(
+            db,
+            session_faker,
+            user_owner_username="johnny.multitasker",
+            subject=f"overdue todo item to be rendered {index}",
+            status=status,
+        )
+        for index, status in enumerate(
+            [TodoItemStatusEnum.OVERDUE, TodoItemStatusEnum.RESOLVED]
+        )
+    ]
+
+    email_composed = tasks.emails.compose(
+        EmailTemplateEnum.TODO_ITEMS_OVERDUE_DIGEST,
+        todo_item_ids=[todo_item.id for todo_item in todo_items],
+        todo_items_count=7,
+    )
+
+    assert email_composed is not None
+    email_to, subject, body_html = email_composed
+    assert email_to == todo_items[0].user.email
+    # resolved since it had been marked as overdue, hence not counted
+    assert subject.startswith("6 ")
+    assert "overdue todo item to be rendered 0" in body_html
+    assert "overdue todo item to be rendered 1" not in body_html
+    assert "and 5 more" in body_html
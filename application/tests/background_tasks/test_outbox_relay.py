@@ -0,0 +1,26 @@
+from kombu import Producer
+from sqlalchemy.orm import Session
+
+from src.background_tasks import outbox_relay
+from src.background_tasks.main import application, send_templated_email
+from src.enums import EmailTemplateEnum
+from src.models import OutboxMessage
+from src.services import outbox_service
+from tests.common import get_db_model
+
+
+def test_relay_pending(db: Session) -> None:
+    outbox_message = outbox_service.make_message(
+        send_templated_email.name,
+        [EmailTemplateEnum.USER_REGISTERED.value],
+        {"user_id": 1},
+    )
+    db.add(outbox_message)
+    db.commit()
+    outbox_message_id: int = outbox_message.id  # type: ignore
+
+    with application.connection_for_write() as connection:
+        relayed_count = outbox_relay.relay_pending(Producer(connection))
+
+    assert relayed_count >= 1
+    assert get_db_model(db, OutboxMessage, id=outbox_message_id) is None
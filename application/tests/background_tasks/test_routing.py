@@ -0,0 +1,46 @@
+from typing import Any
+
+import pytest
+
+from src.background_tasks.main import (
+    application,
+    send_email,
+    send_templated_email,
+    todo_items_move_dangling_to_archive_chunk,
+)
+from src.enums import EmailTemplateEnum
+
+
+@pytest.mark.parametrize(
+    "task_name, args, queue_name, priority",
+    [
+        (
+            send_templated_email.name,
+            (EmailTemplateEnum.USER_REGISTERED.value,),
+            "emails-priority-queue",
+            9,
+        ),
+        (
+            send_templated_email.name,
+            (EmailTemplateEnum.TODO_ITEM_OVERDUE.value,),
+            "emails-queue",
+            None,
+        ),
+        (
+            send_email.name,
+            ("johnny@example.com", "Subject", "<p>Body</p>"),
+            "emails-queue",
+            None,
+        ),
+        (todo_items_move_dangling_to_archive_chunk.name, (0,), "sweeps-queue", None),
+    ],
+)
+def test_route(
+    task_name: str, args: tuple[Any, ...], queue_name: str, priority: int | None
+) -> None:
+    route = application.amqp.router.route(  # type: ignore[attr-defined]
+        {}, task_name, args, {}
+    )
+
+    assert route["queue"].name == queue_name
+    assert route.get("priority") == priority
@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.background_tasks.scheduling import make_todo_item_overdue_outbox_messages
+from src.enums import TodoItemStatusEnum
+from src.models import TodoItem
+
+
+def test_make_todo_item_overdue_outbox_messages() -> None:
+    deadline = datetime.now() + timedelta(minutes=1)
+    todo_item = TodoItem(id=1, deadline=deadline, status=TodoItemStatusEnum.OPEN)
+
+    outbox_messages = make_todo_item_overdue_outbox_messages(todo_item)
+
+    assert len(outbox_messages) == 1
+    assert outbox_messages[0].task_args == [1]
+    assert outbox_messages[0].task_eta == deadline
+
+
+@pytest.mark.parametrize(
+    "deadline, status",
+    [
+        (None, TodoItemStatusEnum.OPEN),
+        (datetime.now() + timedelta(days=1), TodoItemStatusEnum.OPEN),
+        (datetime.now() + timedelta(minutes=1), TodoItemStatusEnum.RESOLVED),
+    ],
+)
+def test_make_todo_item_overdue_outbox_messages_not_scheduled(
+    deadline: datetime | None, status: TodoItemStatusEnum
+) -> None:
+    todo_item = TodoItem(id=1, deadline=deadline, status=status)
+
+    assert make_todo_item_overdue_outbox_messages(todo_item) == []
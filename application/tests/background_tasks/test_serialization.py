@@ -0,0 +1,45 @@
+import pytest
+from kombu import serialization
+
+from src.background_tasks import serialization as tasks_serialization
+from src.config import application_config
+
+_BODY = {"args": [[1, 2, 3], "todo_item_overdue"], "kwargs": {"user_id": 1}}
+
+
+@pytest.mark.parametrize(
+    "serializer", [tasks_serialization.ORJSON_SERIALIZER, "msgpack", "json"]
+)
+def test_serializer_round_trip(serializer: str) -> None:
+    content_type, content_encoding, dumped = serialization.dumps(_BODY, serializer)
+
+    loaded = serialization.loads(
+        dumped,
+        content_type,
+        content_encoding,
+        accept=serialization.prepare_accept_content(
+            [tasks_serialization.ORJSON_SERIALIZER, "msgpack", "json"]
+        ),
+    )
+
+    assert loaded == _BODY
+
+
+@pytest.mark.parametrize(
+    "threshold_bytes, is_compressed",
+    [(None, False), (10_000, False), (100, True)],
+)
+def test_compress_above_threshold(
+    monkeypatch: pytest.MonkeyPatch, threshold_bytes: int | None, is_compressed: bool
+) -> None:
+    monkeypatch.setattr(
+        application_config,
+        "BACKGROUND_TASKS_COMPRESSION_THRESHOLD_BYTES",
+        threshold_bytes,
+    )
+    body = b"todo item " * 100
+
+    compressed = tasks_serialization.compress_above_threshold(body)
+
+    assert (len(compressed) < len(body)) is is_compressed
+    assert tasks_serialization.decompress_above_threshold(compressed) == body
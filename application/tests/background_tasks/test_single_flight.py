@@ -0,0 +1,24 @@
+from src.background_tasks.single_flight import single_flight
+from src.core.metrics import metrics
+
+
+@single_flight
+def run_single_flight(number: int, do_overlap: bool = False) -> int:
+    if do_overlap:
+        # the same arguments are skipped, others are not
+        assert run_single_flight(number, do_overlap=True) is None
+        assert run_single_flight(number + 1) == number + 1
+    return number
+
+
+def test_single_flight() -> None:
+    skipped_before = metrics.snapshot()["counters"].get(
+        "background_tasks.run_single_flight.skipped", 0
+    )
+
+    assert run_single_flight(1, do_overlap=True) == 1
+
+    assert (
+        metrics.snapshot()["counters"]["background_tasks.run_single_flight.skipped"]
+        == skipped_before + 1
+    )
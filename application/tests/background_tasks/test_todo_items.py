@@ -0,0 +1,35 @@
+import pytest
+from faker import Faker
+from sqlalchemy.orm import Session
+
+from src.background_tasks import tasks
+from src.config import application_config
+from tests import factories
+
+
+def test_recover_status_overdue_grouped_by_user(
+    db: Session, session_faker: Faker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(application_config, "TODO_ITEMS_OVERDUE_DIGEST_ITEMS_MAX", 2)
+    todo_items_overdue = [
+        factories.make_todo_item_persisted(
+            db,
+            session_faker,
+            user_owner_username="johnny.multitasker",
+            subject=f"open todo item to be digested {index}",
+            deadline=session_faker.past_datetime(),
+        )
+        for index in range(3)
+    ]
+
+    digests = tasks.todo_items.recover_status_overdue()
+
+    assert len({digest.user_email for digest in digests}) == len(digests)
+    user_digest = next(
+        digest for digest in digests if digest.user_username == "johnny.multitasker"
+    )
+    assert user_digest.todo_items_count == len(todo_items_overdue)
+    assert len(user_digest.todo_items) == 2
+    assert {todo_item.id for todo_item in user_digest.todo_items} < {
+        todo_item.id for todo_item in todo_items_overdue
+    }
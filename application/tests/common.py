@@ -1,13 +1,18 @@
-from typing import Type, TypeVar
+import asyncio
+from typing import Awaitable, Callable, Type, TypeVar
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from src.core.db import async_engine, get_async_session
+
 
 class DBModelNotFound(BaseException):
     pass
 
 
 DBModelType = TypeVar("DBModelType")
+ResultType = TypeVar("ResultType")
 
 
 def get_db_model(
@@ -38,3 +43,21 @@ def get_db_model_or_exception(
         )
         raise exception
     return db_model
+
+
+def run_with_async_session(
+    function: Callable[[AsyncSession], Awaitable[ResultType]]
+) -> ResultType:
+    """
+    Run `function` with an API async session in a new event loop.
+    """
+
+    async def run() -> ResultType:
+        try:
+            async with get_async_session() as db_async:
+                return await function(db_async)
+        finally:
+            # async connections are bound to the event loop they were opened in
+            await async_engine.dispose()
+
+    return asyncio.run(run())
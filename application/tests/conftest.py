@@ -1,17 +1,22 @@
 from random import randint
-from typing import Callable, Generator
+from typing import Any, Callable, Generator
 
 import pytest
 from faker import Faker
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from src.api.dependencies import SessionDependency
-from src.api.dependencies.auth import get_current_user
+from src.api.dependencies import ReadOnlySessionDependency, SessionDependency
+from src.api.dependencies.auth import (
+    get_current_user,
+    get_current_user_id,
+    get_current_user_read_only,
+)
 from src.core.db import get_session
 from src.main import application
 from src.models import User
-from tests.common import get_db_model, get_db_model_or_exception
+from tests.common import get_db_model_or_exception
 
 FAKER_LOCALES = ["en_US"]
 
@@ -45,21 +50,42 @@ def force_authenticate_user(
     db: Session,
 ) -> Generator[Callable[[str], User], None, None]:
     def fixture_yielded_callable(username: str) -> User:
-        def get_current_user_override(
+        async def get_current_user_override(
             db_application_session: SessionDependency,
         ) -> User | None:
-            return get_db_model(db_application_session, User, username=username)
+            result = await db_application_session.execute(
+                select(User).filter_by(username=username)
+            )
+            return result.scalars().first()
+
+        async def get_current_user_read_only_override(
+            db_application_session: ReadOnlySessionDependency,
+        ) -> User | None:
+            result = await db_application_session.execute(
+                select(User).filter_by(username=username)
+            )
+            return result.scalars().first()
 
         # user models are fetched from different sessions to avoid errors like
         # "Object '<User at ...>' already attached to session '...'"
         user = get_db_model_or_exception(db, User, username=username)
 
         application.dependency_overrides[get_current_user] = get_current_user_override
+        application.dependency_overrides[get_current_user_read_only] = (
+            get_current_user_read_only_override
+        )
+        application.dependency_overrides[get_current_user_id] = lambda: user.id
 
         return user
 
     try:
         yield fixture_yielded_callable
     finally:
-        if get_current_user in application.dependency_overrides:
-            del application.dependency_overrides[get_current_user]
+        dependencies_overridden: list[Callable[..., Any]] = [
+            get_current_user,
+            get_current_user_read_only,
+            get_current_user_id,
+        ]
+        for dependency in dependencies_overridden:
+            if dependency in application.dependency_overrides:
+                del application.dependency_overrides[dependency]
@@ -0,0 +1,37 @@
+import time
+
+from src.core.cache import TTLLRUCache
+
+
+def test_ttl_lru_cache_evicts_least_recently_used() -> None:
+    cache: TTLLRUCache[int, str] = TTLLRUCache(max_size=2, ttl_seconds=60)
+    cache.set(1, "one")
+    cache.set(2, "two")
+    cache.get(1)
+
+    cache.set(3, "three")
+
+    assert cache.get(1) == "one"
+    assert cache.get(2) is None
+    assert cache.get(3) == "three"
+
+
+def test_ttl_lru_cache_expires() -> None:
+    cache: TTLLRUCache[int, str] = TTLLRUCache(max_size=2, ttl_seconds=60)
+    cache.set(1, "one", ttl_seconds=0.01)
+    cache.set(2, "two", ttl_seconds=120)
+
+    time.sleep(0.02)
+
+    assert cache.get(1) is None
+    assert cache.get(2) == "two"
+
+
+def test_ttl_lru_cache_delete() -> None:
+    cache: TTLLRUCache[int, str] = TTLLRUCache(max_size=2, ttl_seconds=60)
+    cache.set(1, "one")
+
+    cache.delete(1)
+    cache.delete(2)
+
+    assert cache.get(1) is None
@@ -0,0 +1,13 @@
+from src.core.db import try_advisory_lock
+
+
+def test_try_advisory_lock() -> None:
+    with try_advisory_lock("test.lock") as is_locked:
+        assert is_locked
+        with try_advisory_lock("test.lock") as is_locked_concurrently:
+            assert not is_locked_concurrently
+        with try_advisory_lock("test.lock.other") as is_other_locked:
+            assert is_other_locked
+
+    with try_advisory_lock("test.lock") as is_locked_again:
+        assert is_locked_again
@@ -0,0 +1,152 @@
+import socket
+from datetime import datetime
+from typing import Generator
+
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import SMTP, Envelope, Session
+
+from src.config import application_config
+from src.core.email import SMTPConnectionPool, email_templates_registry, make_message
+from src.emails.todo_items import compose_overdue_digest_email, compose_overdue_email
+from src.services.todo_item_service import TodoItemMarkedAsOverdue
+
+
+def test_email_templates_compiled_once() -> None:
+    email_templates_registry.precompile()
+
+    assert email_templates_registry.get_template(
+        "todo_item_overdue.html"
+    ) is email_templates_registry.get_template("todo_item_overdue.html")
+    assert email_templates_registry.get_string_template(
+        "Hello, {{ name }}!"
+    ) is email_templates_registry.get_string_template("Hello, {{ name }}!")
+
+
+def test_compose_overdue_email() -> None:
+    todo_item = TodoItemMarkedAsOverdue(
+        id=1,
+        subject="Buy milk",
+        deadline=datetime(2024, 1, 1),
+        user_id=1,
+        user_username="johnny.test",
+        user_email="johnny.test@example.com",
+    )
+
+    subject, body_html = compose_overdue_email(todo_item)
+
+    assert subject == '"Buy milk" has passed the deadline'
+    assert "Hello, johnny.test!" in body_html
+    assert 'Your todo item "Buy milk" has passed' in body_html
+
+
+def test_compose_overdue_digest_email() -> None:
+    todo_items = [
+        TodoItemMarkedAsOverdue(
+            id=number,
+            subject=f"Buy milk {number}",
+            deadline=datetime(2024, 1, 1),
+            user_id=1,
+            user_username="johnny.test",
+            user_email="johnny.test@example.com",
+        )
+        for number in range(2)
+    ]
+
+    subject, body_html = compose_overdue_digest_email("johnny.test", todo_items, 5)
+
+    assert subject == "5 of your todo items have passed the deadline"
+    assert "Hello, johnny.test!" in body_html
+    assert '"Buy milk 0"' in body_html
+    assert '"Buy milk 1"' in body_html
+    assert "...and 3 more." in body_html
+
+
+class RecordingHandler:
+    def __init__(self) -> None:
+        # peer addresses of the connections the messages were received over
+        self.peers: list[object] = []
+
+    async def handle_DATA(
+        self, server: SMTP, session: Session, envelope: Envelope
+    ) -> str:
+        self.peers.append(session.peer)
+        return "250 Message accepted for delivery"
+
+
+class SMTPServerStandIn:
+    """
+    Local SMTP server the application is configured to send emails to.
+    """
+
+    def __init__(self, port: int) -> None:
+        self.port = port
+        self.handler = RecordingHandler()
+        self._controller = self._start()
+
+    def restart(self) -> None:
+        """
+        Restart the server dropping all the connections.
+        """
+        self._controller.stop()
+        self._controller = self._start()
+
+    def stop(self) -> None:
+        self._controller.stop()
+
+    def _start(self) -> Controller:
+        controller = Controller(self.handler, hostname="127.0.0.1", port=self.port)
+        controller.start()
+        return controller
+
+
+@pytest.fixture(scope="function")
+def smtp_server(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[SMTPServerStandIn, None, None]:
+    with socket.socket() as free_port_socket:
+        free_port_socket.bind(("127.0.0.1", 0))
+        port = free_port_socket.getsockname()[1]
+    monkeypatch.setattr(application_config, "SMTP_HOST", "127.0.0.1")
+    monkeypatch.setattr(application_config, "SMTP_PORT", str(port))
+
+    smtp_server = SMTPServerStandIn(port)
+    try:
+        yield smtp_server
+    finally:
+        smtp_server.stop()
+
+
+def test_smtp_connection_pool_reuses_connection(
+    smtp_server: SMTPServerStandIn,
+) -> None:
+    smtp_connection_pool = SMTPConnectionPool(size=1, health_check_idle_seconds=0)
+    messages = [
+        make_message(f"johnny.{number}@example.com", "Subject", "<p>Body</p>")
+        for number in range(3)
+    ]
+
+    smtp_connection_pool.send(messages[:2])
+    smtp_connection_pool.send(messages[2:])
+    smtp_connection_pool.close()
+
+    assert len(smtp_server.handler.peers) == 3
+    assert len(set(smtp_server.handler.peers)) == 1
+
+
+@pytest.mark.parametrize("health_check_idle_seconds", [0, 60])
+def test_smtp_connection_pool_reconnects(
+    smtp_server: SMTPServerStandIn, health_check_idle_seconds: float
+) -> None:
+    smtp_connection_pool = SMTPConnectionPool(
+        size=1, health_check_idle_seconds=health_check_idle_seconds
+    )
+    message = make_message("johnny@example.com", "Subject", "<p>Body</p>")
+    smtp_connection_pool.send([message])
+
+    smtp_server.restart()
+    smtp_connection_pool.send([message])
+    smtp_connection_pool.close()
+
+    assert len(smtp_server.handler.peers) == 2
+    assert len(set(smtp_server.handler.peers)) == 2
@@ -0,0 +1,72 @@
+import asyncio
+import threading
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.core.exceptions import (
+    AccessTokenMalformedException,
+    PasswordHashingOverloadedException,
+)
+from src.core.security import (
+    AccessTokenPayload,
+    PasswordHashingExecutor,
+    generate_access_token,
+)
+
+
+def test_decode_from_access_token_cached() -> None:
+    access_token = generate_access_token(42)
+
+    token_payload = AccessTokenPayload.decode_from_access_token(access_token)
+    token_payload_cached = AccessTokenPayload.decode_from_access_token(access_token)
+
+    assert token_payload.sub == "42"
+    assert token_payload_cached is token_payload
+
+
+def test_decode_from_access_token_expired() -> None:
+    access_token = AccessTokenPayload(
+        sub="42", exp=datetime.now(UTC) - timedelta(seconds=1)
+    ).encode_to_access_token()
+
+    with pytest.raises(AccessTokenMalformedException):
+        AccessTokenPayload.decode_from_access_token(access_token)
+
+
+def test_decode_from_access_token_tampered() -> None:
+    access_token = generate_access_token(42)
+    AccessTokenPayload.decode_from_access_token(access_token)
+
+    with pytest.raises(AccessTokenMalformedException):
+        AccessTokenPayload.decode_from_access_token(access_token[:-2] + "xx")
+
+
+def test_password_hashing_executor_slot_held_until_cancelled_call_finishes() -> None:
+    password_hashing_executor = PasswordHashingExecutor(threads=1, queue_depth_max=0)
+    hashing_started = threading.Event()
+    hashing_may_finish = threading.Event()
+
+    def hash_slowly() -> str:
+        hashing_started.set()
+        hashing_may_finish.wait()
+        return "hash"
+
+    async def cancel_while_hashing() -> None:
+        task = asyncio.create_task(password_hashing_executor.run(hash_slowly))
+        await asyncio.to_thread(hashing_started.wait)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        try:
+            # the thread is still busy with the cancelled call
+            with pytest.raises(PasswordHashingOverloadedException):
+                await password_hashing_executor.run(str)
+        finally:
+            hashing_may_finish.set()
+        # the only thread runs the calls in order, the slot is freed by then
+        await asyncio.wrap_future(password_hashing_executor._executor.submit(str))
+        assert await password_hashing_executor.run(str) == ""
+
+    asyncio.run(cancel_while_hashing())
@@ -0,0 +1,57 @@
+from typing import Any
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.models import OutboxMessage
+from src.services import outbox_service
+from tests.common import get_db_model
+
+
+def test_relay_pending(db: Session) -> None:
+    outbox_messages = [
+        outbox_service.make_message("test.relayed", [index], {"key": "value"})
+        for index in range(3)
+    ]
+    db.add_all(outbox_messages)
+    db.commit()
+    outbox_message_ids: list[int] = [
+        outbox_message.id for outbox_message in outbox_messages  # type: ignore
+    ]
+    batch_sizes: list[int] = []
+    messages_published: list[tuple[int, list[Any], dict[str, Any]]] = []
+
+    def publish(outbox_messages_batch: list[OutboxMessage]) -> None:
+        batch_sizes.append(len(outbox_messages_batch))
+        messages_published.extend(
+            (outbox_message.id, outbox_message.task_args, outbox_message.task_kwargs)
+            for outbox_message in outbox_messages_batch
+            if outbox_message.id in outbox_message_ids
+        )
+
+    relayed_count = outbox_service.relay_pending(db, publish, batch_size=2)
+
+    assert relayed_count >= len(outbox_messages)
+    assert max(batch_sizes) == 2
+    assert messages_published == [
+        (outbox_message_id, [index], {"key": "value"})
+        for index, outbox_message_id in enumerate(outbox_message_ids)
+    ]
+    for outbox_message_id in outbox_message_ids:
+        assert get_db_model(db, OutboxMessage, id=outbox_message_id) is None
+
+
+def test_relay_pending_publish_failed(db: Session) -> None:
+    outbox_message = outbox_service.make_message("test.not_relayed")
+    db.add(outbox_message)
+    db.commit()
+    outbox_message_id: int = outbox_message.id  # type: ignore
+
+    def publish_failing(outbox_messages: list[OutboxMessage]) -> None:
+        raise ConnectionError("the broker is down")
+
+    with pytest.raises(ConnectionError):
+        outbox_service.relay_pending(db, publish_failing, batch_size=100)
+    db.rollback()
+
+    assert get_db_model(db, OutboxMessage, id=outbox_message_id) is not None
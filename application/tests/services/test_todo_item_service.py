@@ -1,10 +1,14 @@
+from datetime import datetime, timedelta
+
 import pytest
 from faker import Faker
 from sqlalchemy import inspect
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.enums import TodoItemStatusEnum, TodoItemVisibilityEnum
-from src.models import TodoItem, User
+from src.models import OutboxMessage, SweepWatermark, TodoItem, User
 from src.schemas.todo_item import TodoItemCreate, TodoItemUpdate
 from src.services import todo_item_service
 from src.services.exceptions import (
@@ -14,7 +18,7 @@ from src.services.exceptions import (
     ValidationException,
 )
 from tests import factories
-from tests.common import get_db_model, get_db_model_or_exception
+from tests.common import get_db_model, get_db_model_or_exception, run_with_async_session
 
 
 def test_get_for_user_or_exception(db: Session, session_faker: Faker) -> None:
@@ -78,14 +82,72 @@ def test_list_for_user(
 ) -> None:
     target_user_username = "jane.with.some.todo_items.to.list"
     target_user = get_db_model_or_exception(db, User, username=target_user_username)
+    target_user_id: int = target_user.id  # type: ignore
 
     todo_items_listed = todo_item_service.list_by_user(
-        db, target_user, visibility=visibility_filter
+        db, target_user_id, visibility=visibility_filter
     )
 
     assert len(todo_items_listed) == expected_count
 
 
+def test_list_for_user_after_id(db: Session) -> None:
+    target_user_username = "jane.with.some.todo_items.to.list"
+    target_user = get_db_model_or_exception(db, User, username=target_user_username)
+    target_user_id: int = target_user.id  # type: ignore
+    todo_items_all = todo_item_service.list_by_user(db, target_user_id)
+
+    todo_items_listed = todo_item_service.list_by_user(
+        db, target_user_id, after_id=todo_items_all[1].id, limit=2
+    )
+
+    assert todo_items_listed == todo_items_all[2:4]
+
+
+def test_list_rows_for_user(db: Session) -> None:
+    target_user_username = "jane.with.some.todo_items.to.list"
+    target_user = get_db_model_or_exception(db, User, username=target_user_username)
+    target_user_id: int = target_user.id  # type: ignore
+    todo_items_all = todo_item_service.list_by_user(
+        db, target_user_id, visibility=TodoItemVisibilityEnum.ARCHIVED
+    )
+
+    rows_listed = run_with_async_session(
+        lambda db_async: todo_item_service.list_rows_by_user_async(
+            db_async,
+            target_user_id,
+            column_names=["id", "status"],
+            visibility=TodoItemVisibilityEnum.ARCHIVED,
+        )
+    )
+
+    assert [tuple(row) for row in rows_listed] == [
+        (todo_item.id, todo_item.status) for todo_item in todo_items_all
+    ]
+
+
+def test_stream_rows_for_user(db: Session) -> None:
+    target_user_username = "jane.with.some.todo_items.to.list"
+    target_user = get_db_model_or_exception(db, User, username=target_user_username)
+    target_user_id: int = target_user.id  # type: ignore
+    todo_items_all = todo_item_service.list_by_user(db, target_user_id)
+
+    async def stream_rows(db_async: AsyncSession) -> list[list[Row]]:
+        return [
+            batch
+            async for batch in todo_item_service.stream_rows_by_user_async(
+                db_async, target_user_id, column_names=["id"], batch_size=2
+            )
+        ]
+
+    batches_streamed = run_with_async_session(stream_rows)
+
+    assert [len(batch) for batch in batches_streamed] == [2, 2, 1]
+    assert [row.id for batch in batches_streamed for row in batch] == [
+        todo_item.id for todo_item in todo_items_all
+    ]
+
+
 @pytest.mark.parametrize(
     "with_deadline",
     [
@@ -117,6 +179,47 @@ def test_create_for_user(
     assert todo_item_created.resolve_time is None
 
 
+def test_create_many_for_user(db: Session, session_faker: Faker) -> None:
+    user_owner_username = "johnny.multitasker"
+    create_api_models = [
+        TodoItemCreate(
+            subject=session_faker.unique.text(max_nb_chars=80),
+            deadline=session_faker.future_datetime() if number % 2 else None,
+        )
+        for number in range(3)
+    ]
+    user_owner = get_db_model_or_exception(db, User, username=user_owner_username)
+    user_owner_id: int = user_owner.id  # type: ignore
+    todo_items_passed_to_factory: list[TodoItem] = []
+
+    def make_outbox_messages(todo_item: TodoItem) -> list[OutboxMessage]:
+        todo_items_passed_to_factory.append(todo_item)
+        return []
+
+    created_count = run_with_async_session(
+        lambda db_async: todo_item_service.create_many_for_user_async(
+            db_async,
+            [create_api_models[:2], create_api_models[2:]],
+            user_owner_id,
+            make_outbox_messages,
+        )
+    )
+
+    assert created_count == 3
+    for create_api_model in create_api_models:
+        todo_item_created = get_db_model_or_exception(
+            db, TodoItem, subject=create_api_model.subject
+        )
+        assert todo_item_created.user_id == user_owner_id
+        assert todo_item_created.deadline == create_api_model.deadline
+        assert todo_item_created.status == TodoItemStatusEnum.OPEN
+        assert todo_item_created.visibility == TodoItemVisibilityEnum.VISIBLE
+    assert [
+        (todo_item.user_id, todo_item.deadline)
+        for todo_item in todo_items_passed_to_factory
+    ] == [(user_owner_id, create_api_models[1].deadline)]
+
+
 @pytest.mark.parametrize(
     "do_set_deadline",
     [
@@ -297,6 +400,269 @@ def test_reopen_status_not_resolved(
         todo_item_service.reopen(db, target_todo_item)
 
 
+def test_mark_all_open_overdue_as_overdue(db: Session, session_faker: Faker) -> None:
+    todo_items_overdue = [
+        factories.make_todo_item_persisted(
+            db,
+            session_faker,
+            user_owner_username="johnny.multitasker",
+            subject=f"open todo item with a passed deadline {index}",
+            deadline=session_faker.past_datetime(),
+        )
+        for index in range(3)
+    ]
+    todo_item_not_overdue = factories.make_todo_item_persisted(
+        db,
+        session_faker,
+        user_owner_username="johnny.multitasker",
+        subject="open todo item with a future deadline",
+        deadline=session_faker.future_datetime(),
+    )
+
+    todo_items_batches = list(
+        todo_item_service.mark_all_open_overdue_as_overdue(db, batch_size=2)
+    )
+
+    assert all(len(batch) <= 2 for batch in todo_items_batches)
+    todo_items_marked = {
+        todo_item.id: todo_item for batch in todo_items_batches for todo_item in batch
+    }
+    for todo_item in todo_items_overdue:
+        db.refresh(todo_item)
+        assert todo_item.status == TodoItemStatusEnum.OVERDUE
+        todo_item_marked = todo_items_marked[todo_item.id]  # type: ignore
+        assert todo_item_marked.subject == todo_item.subject
+        assert todo_item_marked.user_id == todo_item.user_id
+        assert todo_item_marked.user_email == todo_item.user.email
+    db.refresh(todo_item_not_overdue)
+    assert todo_item_not_overdue.status == TodoItemStatusEnum.OPEN
+    assert todo_item_not_overdue.id not in todo_items_marked
+
+
+def test_mark_all_open_overdue_as_overdue_partitioned(
+    db: Session, session_faker: Faker
+) -> None:
+    todo_item_overdue = factories.make_todo_item_persisted(
+        db,
+        session_faker,
+        user_owner_username="johnny.multitasker",
+        subject="open todo item with a passed deadline in a partition",
+        deadline=session_faker.past_datetime(),
+    )
+    partition_number = todo_item_overdue.user_id % 2
+
+    todo_item_ids_marked_by_partition = [
+        {
+            todo_item.id
+            for batch in todo_item_service.mark_all_open_overdue_as_overdue(
+                db,
+                batch_size=100,
+                partition_number=other_partition_number,
+                partitions_count=2,
+            )
+            for todo_item in batch
+        }
+        for other_partition_number in [1 - partition_number, partition_number]
+    ]
+
+    assert todo_item_overdue.id not in todo_item_ids_marked_by_partition[0]
+    assert todo_item_overdue.id in todo_item_ids_marked_by_partition[1]
+
+
+def test_mark_open_overdue_after_watermark_as_overdue(
+    db: Session, session_faker: Faker
+) -> None:
+    watermark_time = datetime.now() - timedelta(hours=1)
+    db.merge(
+        SweepWatermark(
+            name=todo_item_service.make_overdue_watermark_name(0, 1),
+            last_time=watermark_time,
+            last_id=0,
+        )
+    )
+    db.commit()
+    todo_items_overdue = [
+        factories.make_todo_item_persisted(
+            db,
+            session_faker,
+            user_owner_username="johnny.multitasker",
+            subject=f"open todo item due after the watermark {index}",
+            deadline=watermark_time + timedelta(minutes=30),
+        )
+        for index in range(3)
+    ]
+    todo_item_behind_watermark = factories.make_todo_item_persisted(
+        db,
+        session_faker,
+        user_owner_username="johnny.multitasker",
+        subject="open todo item due behind the watermark",
+        deadline=watermark_time - timedelta(minutes=1),
+    )
+
+    todo_items_batches = list(
+        todo_item_service.mark_open_overdue_after_watermark_as_overdue(db, batch_size=2)
+    )
+
+    assert all(len(batch) <= 2 for batch in todo_items_batches)
+    todo_item_ids_marked = {
+        todo_item.id for batch in todo_items_batches for todo_item in batch
+    }
+    for todo_item in todo_items_overdue:
+        db.refresh(todo_item)
+        assert todo_item.status == TodoItemStatusEnum.OVERDUE
+        assert todo_item.id in todo_item_ids_marked
+    db.refresh(todo_item_behind_watermark)
+    assert todo_item_behind_watermark.status == TodoItemStatusEnum.OPEN
+    watermark = get_db_model_or_exception(
+        db, SweepWatermark, name=todo_item_service.make_overdue_watermark_name(0, 1)
+    )
+    assert watermark.last_time > todo_items_overdue[0].deadline  # type: ignore
+
+    # the recovery path
+    list(todo_item_service.mark_all_open_overdue_as_overdue(db, batch_size=2))
+
+    todo_item_recovered = get_db_model_or_exception(
+        db, TodoItem, id=todo_item_behind_watermark.id  # type: ignore
+    )
+    assert todo_item_recovered.status == TodoItemStatusEnum.OVERDUE
+
+
+def test_mark_open_overdue_as_overdue(db: Session, session_faker: Faker) -> None:
+    todo_item_overdue = factories.make_todo_item_persisted(
+        db,
+        session_faker,
+        user_owner_username="johnny.multitasker",
+        subject="open todo item due right now",
+        deadline=datetime.now() - timedelta(seconds=1),
+    )
+    todo_item_overdue_id: int = todo_item_overdue.id  # type: ignore
+
+    todo_item_marked = todo_item_service.mark_open_overdue_as_overdue(
+        db, todo_item_overdue_id
+    )
+
+    assert todo_item_marked is not None
+    assert todo_item_marked.id == todo_item_overdue_id
+    assert todo_item_marked.user_email == todo_item_overdue.user.email
+    db.refresh(todo_item_overdue)
+    assert todo_item_overdue.status == TodoItemStatusEnum.OVERDUE
+    # already marked
+    assert (
+        todo_item_service.mark_open_overdue_as_overdue(db, todo_item_overdue_id) is None
+    )
+
+
+def test_mark_open_overdue_as_overdue_deadline_moved(
+    db: Session, session_faker: Faker
+) -> None:
+    todo_item = factories.make_todo_item_persisted(
+        db,
+        session_faker,
+        user_owner_username="johnny.multitasker",
+        subject="open todo item with a deadline moved",
+        deadline=session_faker.future_datetime(),
+    )
+
+    todo_item_marked = todo_item_service.mark_open_overdue_as_overdue(
+        db, todo_item.id  # type: ignore
+    )
+
+    assert todo_item_marked is None
+    db.refresh(todo_item)
+    assert todo_item.status == TodoItemStatusEnum.OPEN
+
+
+def test_list_open_with_deadline_between(db: Session, session_faker: Faker) -> None:
+    deadline_from = datetime.now() + timedelta(days=360)
+    deadline_before = datetime.now() + timedelta(days=365)
+    todo_items = [
+        factories.make_todo_item_persisted(
+            db,
+            session_faker,
+            user_owner_username="johnny.multitasker",
+            subject=f"open todo item to be scheduled {index}",
+            deadline=deadline,
+            status=status,
+        )
+        for index, (deadline, status) in enumerate(
+            [
+                (deadline_before - timedelta(days=1), TodoItemStatusEnum.OPEN),
+                (deadline_before - timedelta(days=2), TodoItemStatusEnum.OPEN),
+                (deadline_before - timedelta(days=1), TodoItemStatusEnum.RESOLVED),
+                (deadline_before + timedelta(days=1), TodoItemStatusEnum.OPEN),
+                (deadline_from - timedelta(days=1), TodoItemStatusEnum.OPEN),
+            ]
+        )
+    ]
+
+    todo_items_listed = todo_item_service.list_open_with_deadline_between(
+        db, deadline_from, deadline_before
+    )
+
+    todo_item_ids = [todo_item.id for todo_item in todo_items]
+    assert [
+        todo_item_listed
+        for todo_item_listed in todo_items_listed
+        if todo_item_listed[0] in todo_item_ids
+    ] == [
+        (todo_items[1].id, todo_items[1].deadline),
+        (todo_items[0].id, todo_items[0].deadline),
+    ]
+    deadlines = [deadline for _, deadline in todo_items_listed]
+    assert deadlines == sorted(deadlines)
+
+
+def test_archive_all_visible_not_open_dangling(
+    db: Session, session_faker: Faker
+) -> None:
+    long_ago = datetime.now() - timedelta(hours=48)
+    recently = datetime.now() - timedelta(hours=1)
+    todo_items_dangling = [
+        factories.make_todo_item_persisted(
+            db,
+            session_faker,
+            user_owner_username="johnny.multitasker",
+            subject=f"dangling {status.value} todo item to archive",
+            status=status,
+            visibility=TodoItemVisibilityEnum.VISIBLE,
+            **time_in_status,
+        )
+        for status, time_in_status in [
+            (TodoItemStatusEnum.RESOLVED, {"resolve_time": long_ago}),
+            (TodoItemStatusEnum.OVERDUE, {"deadline": long_ago}),
+            (TodoItemStatusEnum.OVERDUE, {"deadline": long_ago}),
+        ]
+    ]
+    todo_items_not_dangling = [
+        factories.make_todo_item_persisted(
+            db,
+            session_faker,
+            user_owner_username="johnny.multitasker",
+            subject=f"not dangling {status.value} todo item to keep visible",
+            status=status,
+            visibility=TodoItemVisibilityEnum.VISIBLE,
+            **time_in_status,
+        )
+        for status, time_in_status in [
+            (TodoItemStatusEnum.RESOLVED, {"resolve_time": recently}),
+            (TodoItemStatusEnum.OVERDUE, {"deadline": recently}),
+            (TodoItemStatusEnum.OPEN, {"deadline": long_ago}),
+        ]
+    ]
+
+    archived_count = todo_item_service.archive_all_visible_not_open_dangling(
+        db, hours_in_status=24, batch_size=1
+    )
+
+    assert archived_count >= len(todo_items_dangling)
+    for todo_item in todo_items_dangling:
+        db.refresh(todo_item)
+        assert todo_item.visibility == TodoItemVisibilityEnum.ARCHIVED
+    for todo_item in todo_items_not_dangling:
+        db.refresh(todo_item)
+        assert todo_item.visibility == TodoItemVisibilityEnum.VISIBLE
+
+
 def test_delete(db: Session, session_faker: Faker) -> None:
     target_todo_item_subject = "todo item for delete via service"
     target_todo_item = factories.make_todo_item_persisted(
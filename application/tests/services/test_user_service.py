@@ -1,13 +1,18 @@
+import bcrypt
 import pytest
 from faker import Faker
 from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 
-from src.core.security import verify_password
+from src.core.security import is_password_hash_outdated, verify_password
 from src.models import User
 from src.schemas.user import UserCreate, UserUpdate
 from src.services import user_service
-from src.services.exceptions import NotFoundException
+from src.services.exceptions import (
+    NotFoundException,
+    UniqueConstraintViolationException,
+)
+from src.services.user_service import users_cache
 from tests import factories
 from tests.common import get_db_model, get_db_model_or_exception
 
@@ -70,6 +75,25 @@ def test_get_by_credentials_verified(
     assert user.id == target_user.id
 
 
+def test_get_by_credentials_verified_rehashes_outdated(
+    db: Session, session_faker: Faker
+) -> None:
+    password = session_faker.unique.password()
+    target_user = factories.user.make(session_faker, password=password)
+    target_user.hashed_password = bcrypt.hashpw(
+        password.encode(), bcrypt.gensalt(rounds=4)
+    ).decode()
+    factories.persist(db, target_user)
+
+    user = user_service.get_by_credentials_verified(
+        db, username=target_user.username, password=password
+    )
+
+    assert user is not None
+    assert not is_password_hash_outdated(user.hashed_password)
+    assert verify_password(password, user.hashed_password)
+
+
 def test_create(db: Session, session_faker: Faker) -> None:
     fake_user_password = session_faker.unique.password()
     fake_user = factories.user.make(session_faker, password=fake_user_password)
@@ -88,6 +112,30 @@ def test_create(db: Session, session_faker: Faker) -> None:
     assert verify_password(fake_user_password, user_created.hashed_password)
 
 
+@pytest.mark.parametrize(
+    "field_in_use, exception_message",
+    [
+        ("username", "Username already in use"),
+        ("email", "Email already in use"),
+    ],
+)
+def test_create_conflict(
+    db: Session, session_faker: Faker, field_in_use: str, exception_message: str
+) -> None:
+    user_existing = get_db_model_or_exception(db, User, username="johnny.test.readonly")
+    fake_user = factories.user.make(session_faker)
+    create_api_model = UserCreate(
+        **{
+            **fake_user.__dict__,
+            field_in_use: getattr(user_existing, field_in_use),
+        },
+        password=session_faker.unique.password(),
+    )
+
+    with pytest.raises(UniqueConstraintViolationException, match=exception_message):
+        user_service.create(db, create_api_model)
+
+
 def test_update(db: Session) -> None:
     target_user_username = "johnny.test.service.update"
     update_api_model = UserUpdate(
@@ -95,6 +143,8 @@ def test_update(db: Session) -> None:
         full_name="Giovanni Giorgio",
     )
     target_user = get_db_model_or_exception(db, User, username=target_user_username)
+    target_user_id: int = target_user.id  # type: ignore
+    users_cache.set(target_user_id, target_user)
 
     user_service.update(db, target_user, update_api_model)
 
@@ -107,15 +157,21 @@ def test_update(db: Session) -> None:
     assert user_from_db is not None
     assert user_from_db.full_name == update_api_model.full_name
 
+    # assert the cached user has been invalidated
+    assert users_cache.get(target_user_id) is None
+
 
 def test_delete(
     db: Session,
 ) -> None:
     target_user_username = "johnny.test.service.delete"
     target_user = get_db_model_or_exception(db, User, username=target_user_username)
+    target_user_id: int = target_user.id  # type: ignore
+    users_cache.set(target_user_id, target_user)
 
     user_service.delete(db, target_user)
 
     assert inspect(target_user).detached
     user_from_db = get_db_model(db, User, username=target_user_username)
     assert user_from_db is None
+    assert users_cache.get(target_user_id) is None